@@ -23,19 +23,52 @@ def loadJson(filename):
         return json.load(fh)
 
 
-def createInitPy(pydir, modules):
+def createInitPy(pydir, modules, package='sync'):
+    """Write an __init__.py which imports each module's class on first use.
+    Python versions without module __getattr__ import them all at once.
+    """
     initpy = os.path.join(pydir, '__init__.py')
     print(initpy)
     with open(initpy, 'w') as fh:
         print("#!/usr/bin/env python", file=fh)
         print(GENERATED_STRING, file=fh)
-        for module in modules:
-            print("from taskcluster.sync.{module} import {module}".format(module=module),
-                  file=fh)
+        print("import importlib", file=fh)
+        print("import sys", file=fh)
+        print("", file=fh)
         print("__all__ = [", file=fh)
         for module in modules:
-            print("    {module},".format(module=module), file=fh)
+            print("    '{module}',".format(module=module), file=fh)
         print("]", file=fh)
+        print(textwrap.dedent("""
+            if sys.version_info >= (3, 7):
+                def __getattr__(name):
+                    if name not in __all__:
+                        raise AttributeError(
+                            'module {{!r}} has no attribute {{!r}}'.format(__name__, name))
+                    module = importlib.import_module('{{}}.{{}}'.format(__name__, name))
+                    value = globals()[name] = getattr(module, name)
+                    return value
+
+                def __dir__():
+                    return sorted(set(globals()) | set(__all__))
+            else:
+                for name in __all__:
+                    module = importlib.import_module('taskcluster.{package}.' + name)
+                    globals()[name] = getattr(module, name)""".format(package=package)),
+              file=fh)
+
+
+def createApiReferences(apiDir, apiDef):
+    """Write each service's API reference to its own compact JSON file, with
+    an index of the services, for taskcluster.baseclient.API_CONFIG to load
+    only the references which are used.
+    """
+    print(apiDir)
+    for name, defn in apiDef.items():
+        with open(os.path.join(apiDir, '{}.json'.format(name)), 'w', encoding='utf-8') as fh:
+            fh.write(six.text_type(json.dumps(defn, sort_keys=True, separators=(',', ':'))))
+    with open(os.path.join(apiDir, '_index.json'), 'w', encoding='utf-8') as fh:
+        fh.write(six.text_type(json.dumps(sorted(apiDef.keys()))))
 
 
 def createRoutes(api):
@@ -45,7 +78,8 @@ def createRoutes(api):
     for entry in api['entries']:
         if entry['type'] == 'function':
             routes += "'%s': '%s',\n" % (entry['name'], anglesToBraces(entry['route']))
-    return routes
+    # Newer jinja2 versions keep the trailing newline when indenting
+    return routes.rstrip('\n')
 
 
 def createRoutingKeys(api):
@@ -92,6 +126,7 @@ def argumentString(entry, methodArgs=False):
     if methodArgs:
         if entry.get('query'):
             parts.append('options=None')
+        parts.append('**callOptions')
         return ", ".join(parts)
     else:
         string = ""
@@ -108,12 +143,13 @@ def anglesToBraces(s):
         return re.sub('<(.*?)>', '{\\1}', s)
 
 
-def render(env, templateName, serviceName, defn):
+def render(env, templateName, serviceName, defn, isAsync=False):
     template = env.get_template(templateName)
     api = defn['reference']
     url = defn['referenceUrl']
     return template.render(
         serviceName=serviceName,
+        isAsync=isAsync,
         api=api,
         argumentString=argumentString,
         createRoutes=createRoutes,
@@ -136,7 +172,7 @@ def typesetDocstring(s, level=4):
     return '\n'.join(lines)
 
 
-def renderCode(name, defn, codeDir, testDir):
+def renderCode(name, defn, codeDir, testDir, aioDir):
     env = Environment(loader=FileSystemLoader('templates'))
     env.filters['docstring'] = typesetDocstring
     env.filters['anglesToBraces'] = anglesToBraces
@@ -144,6 +180,10 @@ def renderCode(name, defn, codeDir, testDir):
     with open(os.path.join(codeDir, '{}.py'.format(name)),
               'w', encoding='utf-8') as fh:
         print(code, file=fh)
+    code = render(env, 'code.template', name, defn, isAsync=True)
+    with open(os.path.join(aioDir, '{}.py'.format(name)),
+              'w', encoding='utf-8') as fh:
+        print(code, file=fh)
     test = render(env, 'test.template', name, defn)
     with open(os.path.join(testDir, 'test{}.py'.format(name)),
               'w', encoding='utf-8') as fh:
@@ -157,11 +197,16 @@ if __name__ == '__main__':
         os.path.join(baseDir, "taskcluster", "apis.json")
     )
     codeDir = os.path.join(baseDir, 'taskcluster', 'sync')
+    aioDir = os.path.join(baseDir, 'taskcluster', 'aio')
     testDir = os.path.join(baseDir, 'test')
-    if not os.path.exists(codeDir):
-        os.makedirs(codeDir)
+    apiDir = os.path.join(baseDir, 'taskcluster', 'apis')
+    for d in (codeDir, aioDir, apiDir):
+        if not os.path.exists(d):
+            os.makedirs(d)
     apiDef = loadJson(jsonFile)
     createInitPy(codeDir, sorted(apiDef.keys()))
+    createInitPy(aioDir, sorted(apiDef.keys()), package='aio')
+    createApiReferences(apiDir, apiDef)
     for name, defn in apiDef.items():
         print(name)
-        renderCode(name, defn, codeDir, testDir)
+        renderCode(name, defn, codeDir, testDir, aioDir)
@@ -22,6 +22,8 @@ tests_require = [
     'pgpy',
     'tox==2.3.1',
     'coverage==4.0.3',
+    # test/test_aio.py is only run on python 3
+    'aiohttp; python_version >= "3.5.3"',
 ]
 
 # requests has a policy of not breaking apis between major versions
@@ -37,6 +39,16 @@ gencode_requires = [
     'jinja2',
 ]
 
+# the asyncio clients in taskcluster.aio need aiohttp
+async_requires = [
+    'aiohttp>=3.3',
+]
+
+# JSON is encoded and decoded faster with orjson, which needs python 3.8
+fastjson_requires = [
+    'orjson>=3; python_version >= "3.8"',
+]
+
 # from http://testrun.org/tox/latest/example/basic.html
 class Tox(TestCommand):
     user_options = [('tox-args=', 'a', "Arguments to pass to tox")]
@@ -64,6 +76,9 @@ if sys.version_info[:2] == (2, 7):
     tests_require.extend([
         'subprocess32==3.2.6',
     ])
+    install_requires.extend([
+        'futures',
+    ])
 
 if __name__ == '__main__':
     setup(
@@ -73,11 +88,15 @@ if __name__ == '__main__':
         author='John Ford',
         author_email='jhford@mozilla.com',
         url='https://github.com/taskcluster/taskcluster-client.py',
-        packages=['taskcluster'],
+        packages=['taskcluster', 'taskcluster.sync', 'taskcluster.aio'],
         package_data={
-            'taskcluster': ['**.json']
+            'taskcluster': ['**.json', 'apis/*.json']
         },
         install_requires=install_requires,
+        extras_require={
+            'async': async_requires,
+            'fastjson': fastjson_requires,
+        },
         test_suite="nose.collector",
         tests_require=tests_require,
         cmdclass={'test': Tox},
@@ -3,11 +3,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import logging
 import os
-import taskcluster.client
-import taskcluster.utils
-from six.moves import reload_module as reload
-reload(taskcluster.client)
-reload(taskcluster.utils)
+import sys
 
 log = logging.getLogger(__name__)
 
@@ -17,5 +13,23 @@ if os.environ.get('DEBUG_TASKCLUSTER_CLIENT'):
         log.addHandler(logging.StreamHandler())
 log.addHandler(logging.NullHandler())
 
-from taskcluster.client import *  # NOQA
+import taskcluster.client  # NOQA
+import taskcluster.utils  # NOQA
+from taskcluster.client import createTemporaryCredentials, config, RuntimeClient  # NOQA
+from taskcluster.client import createApiClient  # NOQA
 from taskcluster.utils import *  # NOQA
+
+__all__ = taskcluster.client.__all__ + taskcluster.utils.__all__
+
+if sys.version_info >= (3, 7):
+    # Service classes, e.g. taskcluster.Queue, are imported on first use
+    def __getattr__(name):
+        if name not in taskcluster.client.services:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+        value = globals()[name] = getattr(taskcluster.client, name)
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    from taskcluster.client import *  # NOQA
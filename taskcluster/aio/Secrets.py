@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is generated!  Do not edit!
+'''
+TaskCluster Secrets API Documentation
+'''
+from __future__ import absolute_import, division, print_function
+
+import logging
+import taskcluster.asyncclient as asyncclient
+
+log = logging.getLogger(__name__)
+
+
+class Secrets(asyncclient.AsyncBaseClient):
+    '''
+    TaskCluster Secrets API Documentation
+    The secrets service, is a simple key/value store for secret data
+    guarded by TaskCluster scopes.  It is typically available at
+    `secrets.taskcluster.net`.
+    '''
+    version = 0
+    referenceUrl = 'http://references.taskcluster.net/secrets/v1/api.json'
+    routes = {
+        'set': '/secret/{name}',
+        'remove': '/secret/{name}',
+        'get': '/secret/{name}',
+        'list': '/secrets',
+        'ping': '/ping',
+    }
+
+    classOptions = {
+        'baseUrl': 'https://secrets.taskcluster.net/v1',
+    }
+
+    async def set(self, name, payload, **callOptions):
+        '''
+        Create Secret
+
+        Set a secret associated with some key.  If the secret already exists, it is updated instead.
+
+        This method takes:
+        - ``name``
+        '''
+        route = self.makeRoute('set', replDict={
+            'name': name,
+        })
+        return await self._makeHttpRequest(
+            'put', route, payload, methodName='set', **callOptions)
+
+    async def remove(self, name, **callOptions):
+        '''
+        Delete Secret
+
+        Delete the secret attached to some key.
+
+        This method takes:
+        - ``name``
+        '''
+        route = self.makeRoute('remove', replDict={
+            'name': name,
+        })
+        return await self._makeHttpRequest(
+            'delete', route, methodName='remove', **callOptions)
+
+    async def get(self, name, **callOptions):
+        '''
+        Read Secret
+
+        Read the secret attached to some key.
+
+        This method takes:
+        - ``name``
+        '''
+        route = self.makeRoute('get', replDict={
+            'name': name,
+        })
+        return await self._makeHttpRequest(
+            'get', route, methodName='get', **callOptions)
+
+    async def list(self, **callOptions):
+        '''
+        List Secrets
+
+        List the names of all visible secrets.
+
+        This method takes no arguments.
+        '''
+        route = self.makeRoute('list')
+        return await self._makeHttpRequest(
+            'get', route, methodName='list', **callOptions)
+
+    async def ping(self, **callOptions):
+        '''
+        Ping Server
+
+        Documented later...
+
+        **Warning** this api end-point is **not stable**.
+
+        This method takes no arguments.
+        '''
+        route = self.makeRoute('ping')
+        return await self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# This file is generated!  Do not edit!
+import importlib
+import sys
+
+__all__ = [
+    'Auth',
+    'AwsProvisioner',
+    'AwsProvisionerEvents',
+    'Github',
+    'GithubEvents',
+    'Hooks',
+    'Index',
+    'PurgeCache',
+    'PurgeCacheEvents',
+    'Queue',
+    'QueueEvents',
+    'Scheduler',
+    'SchedulerEvents',
+    'Secrets',
+]
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in __all__:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(__name__, name))
+        module = importlib.import_module('{}.{}'.format(__name__, name))
+        value = globals()[name] = getattr(module, name)
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    for name in __all__:
+        module = importlib.import_module('taskcluster.aio.' + name)
+        globals()[name] = getattr(module, name)
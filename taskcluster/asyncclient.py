@@ -0,0 +1,429 @@
+"""This module is used to interact with taskcluster rest apis from asyncio
+
+The generated classes in taskcluster.aio are built on AsyncBaseClient, whose
+API methods are coroutines.  Requests go through aiohttp sessions which are
+shared by all clients talking to the same host on the same event loop.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import copy
+import logging
+import time
+import weakref
+
+from six.moves import urllib
+
+import taskcluster.baseclient as baseclient
+import taskcluster.cache as cache
+import taskcluster.circuitbreaker as circuitbreaker
+import taskcluster.exceptions as exceptions
+import taskcluster.hedging as hedging
+import taskcluster.ratelimit as ratelimit
+import taskcluster.tracing as tracing
+import taskcluster.transport as transport
+import taskcluster.utils as utils
+
+log = logging.getLogger(__name__)
+
+try:
+    # Do not require aiohttp for users of the synchronous clients
+    import aiohttp
+except ImportError:
+    aiohttp = None
+    log.debug("Async clients disabled. Install aiohttp to enable.")
+
+# The exceptions of failed attempts, which may be retried
+if aiohttp is not None:
+    _attemptErrors = (aiohttp.ClientError, asyncio.TimeoutError)
+else:
+    _attemptErrors = (asyncio.TimeoutError,)
+
+
+def _requireAiohttp():
+    if aiohttp is None:
+        raise RuntimeError("Install `aiohttp' to use taskcluster.aio")
+
+
+# Shared aiohttp sessions.  A session can only be used on the event loop it
+# was created on, so they are kept per loop and then per host.
+_sessions = weakref.WeakKeyDictionary()
+
+
+class Response(object):
+    """ The parts of an aiohttp response we need once its body has been read
+    and the connection released back to the pool """
+
+    def __init__(self, status_code, headers, content, written=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        # The number of bytes of the body written to a responseFile
+        self.written = written
+
+    def json(self):
+        return utils.loadJson(self.content)
+
+
+def getSession(url, poolSize=None, keepAlive=None):
+    """ Return the shared aiohttp session used to talk to the host of url from
+    the current event loop """
+    _requireAiohttp()
+    if poolSize is None:
+        poolSize = transport.DEFAULT_POOL_SIZE
+    if keepAlive is None:
+        keepAlive = transport.DEFAULT_KEEP_ALIVE
+
+    loop = asyncio.get_event_loop()
+    u = urllib.parse.urlsplit(url)
+    key = (u.scheme, u.netloc, poolSize, keepAlive)
+    sessions = _sessions.setdefault(loop, {})
+    session = sessions.get(key)
+    if session is None or session.closed:
+        # 0 is aiohttp's "no limit"
+        connector = aiohttp.TCPConnector(limit_per_host=poolSize or 0,
+                                         force_close=not keepAlive)
+        session = aiohttp.ClientSession(connector=connector)
+        sessions[key] = session
+    return session
+
+
+# The futures of the coalesced calls in flight, per event loop and then by
+# key, see coalesce()
+_coalescedCalls = weakref.WeakKeyDictionary()
+
+
+async def coalesce(key, fn, timeout=None):
+    """ Await fn() and return its result, unless a call with the same key is
+    already in flight on this event loop, in which case wait for that call
+    and return (a copy of) its result or raise its exception.  This is the
+    asyncio counterpart of taskcluster.singleflight.do() """
+    loop = asyncio.get_event_loop()
+    calls = _coalescedCalls.setdefault(loop, {})
+    future = calls.get(key)
+    if future is not None:
+        log.debug('Waiting for in-flight call %s', key[:2])
+        try:
+            # The call goes on for its other callers if this one gives up
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise exceptions.TaskclusterDeadlineExceeded(
+                'Deadline exceeded waiting for an in-flight call')
+        # Callers get their own copy, so that they are free to modify it
+        try:
+            return copy.deepcopy(result)
+        except Exception:
+            return result
+
+    future = calls[key] = loop.create_future()
+    try:
+        result = await fn()
+    except Exception as e:
+        future.set_exception(e)
+        # Nobody may be waiting for it
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del calls[key]
+        if not future.done():
+            # The call was cancelled
+            future.cancel()
+
+
+async def closeSessions():
+    """ Close every shared session belonging to the current event loop """
+    sessions = _sessions.pop(asyncio.get_event_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+class ResponseWriter(object):
+    """ Writes the body of one attempt's response to a file, counting the bytes
+    written, so that a failed attempt can be undone before it is retried """
+
+    def __init__(self, f):
+        self.file = f
+        self.written = 0
+        try:
+            self.start = f.tell() if getattr(f, 'seekable', lambda: True)() else None
+        except (AttributeError, IOError, OSError):
+            self.start = None
+
+    def write(self, data):
+        self.file.write(data)
+        self.written += len(data)
+
+    def undo(self):
+        """ Remove what was written from the file.  Return False if that is
+        impossible because the file cannot seek """
+        if not self.written:
+            return True
+        if self.start is None:
+            return False
+        self.file.seek(self.start)
+        self.file.truncate()
+        self.written = 0
+        return True
+
+
+async def makeSingleHttpRequest(method, url, payload, headers, session=None, timeout=None,
+                                responseFile=None):
+    """ Make a single HTTP request.  timeout is an aiohttp.ClientTimeout.
+    The body of a successful response is written to responseFile, if given,
+    instead of being read """
+    method = method.upper()
+    traced = tracing.enabled(log)
+    if traced:
+        tracing.trace(log, 'request', method=method, url=url, headers=tracing.Headers(headers),
+                      payload=tracing.Truncated(payload, tracing.PAYLOAD_LIMIT))
+    if session is None:
+        session = getSession(url)
+    if isinstance(payload, utils.SpooledPayload):
+        # aiohttp streams file objects, with a Content-Length header
+        payload = payload.rewind()
+    async with session.request(method, url, data=payload, headers=headers,
+                               timeout=timeout) as r:
+        if responseFile is not None and 200 <= r.status < 300:
+            written = 0
+            async for chunk in r.content.iter_chunked(utils.PAYLOAD_CHUNK_SIZE):
+                responseFile.write(chunk)
+                written += len(chunk)
+            response = Response(r.status, r.headers, None, written)
+        else:
+            response = Response(r.status, r.headers, await r.read())
+    if traced:
+        body = response.content
+        if body is not None:
+            body = tracing.Truncated(body, tracing.RESPONSE_LIMIT)
+        tracing.trace(log, 'response', status=response.status_code,
+                      headers=tracing.Headers(response.headers), body=body)
+    return response
+
+
+class AsyncBaseClient(baseclient.BaseClient):
+    """ Base Class for asyncio API Client Classes.  API methods of subclasses
+    are coroutines, everything else behaves like BaseClient.
+    """
+
+    def _defaultSession(self):
+        # Sessions are bound to an event loop, so the shared session is looked
+        # up for every request instead
+        return None
+
+    def _getSession(self, url):
+        if self.session is not None:
+            return self.session
+        return getSession(url, self.options.get('poolSize'), self.options.get('keepAlive'))
+
+    async def _makeHttpRequest(self, method, route, payload=None, methodName=None,
+                               connectTimeout=None, readTimeout=None, deadline=None,
+                               priority=None, responseMode=None, responseFile=None, **kwargs):
+        """ Make an HTTP Request for the API endpoint.  This is the coroutine
+        counterpart of BaseClient._makeHttpRequest, with the same retry,
+        caching, coalescing, hedging, deadline and response mode logic.
+        Coalesced calls are shared by the coroutines of one event loop.
+        aiohttp manages its own connection pool, so priority is only
+        validated
+        """
+
+        timeouts = self._callTimeouts(connectTimeout, readTimeout, deadline)
+        self._callPriority(methodName, priority)
+        responseMode = self._callResponseMode(responseMode, responseFile)
+        url = self.makeFullUrl(route, **kwargs)
+        tracing.trace(log, 'call', method=method, methodName=methodName, url=url)
+
+        ttl = cache.NEVER
+        if responseMode.mode == 'json':
+            ttl = self._responseCacheTtl(method, methodName)
+        if ttl != cache.NEVER:
+            responseCache = self.options['cache']
+            cacheKey = self._responseCacheKey(url)
+            result = responseCache.get(cacheKey)
+            if result is not None:
+                log.debug('Using cached response for %s', url)
+                return result
+
+        def send():
+            return self._hedgedHttpRequest(method, url, payload, methodName, timeouts,
+                                           responseMode)
+
+        if (self.options.get('coalesceRequests') and method.upper() == 'GET' and
+                payload is None and responseMode.mode == 'json'):
+            result = await coalesce(self._coalescingKey(method, url), send,
+                                    timeouts.remaining())
+        else:
+            result = await send()
+
+        if ttl != cache.NEVER:
+            responseCache.set(cacheKey, result, ttl)
+        return result
+
+    async def _hedgedHttpRequest(self, method, url, payload=None, methodName=None,
+                                 timeouts=None, responseMode=baseclient.JSON_RESPONSE):
+        """ Make the HTTP request, hedging it if the hedgeRequests option
+        says so.  The slower of two hedged requests is cancelled """
+        hedger = None
+        if not responseMode.stream:
+            hedger = hedging.getHedgerForCall(self.options, method, methodName)
+        if hedger is None:
+            return await self._sendHttpRequest(method, url, payload, methodName, timeouts,
+                                               responseMode)
+
+        def send():
+            return asyncio.ensure_future(
+                self._sendHttpRequest(method, url, payload, methodName, timeouts,
+                                      responseMode))
+
+        delay = hedger.start()
+        start = time.time()
+        primary = send()
+        if delay is not None:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+        if delay is None or done or not hedger.allowHedge():
+            result = await primary
+            hedger.record(time.time() - start)
+            return result
+
+        log.debug('No response after %.3fs, hedging', delay)
+        hedge = send()
+        pending = set([primary, hedge])
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for f in done:
+                    if f.exception() is None:
+                        hedger.record(time.time() - start, hedgeWon=f is hedge)
+                        return f.result()
+                    error = error or f.exception()
+            raise error
+        finally:
+            for f in pending:
+                f.cancel()
+
+    def _clientTimeout(self, timeouts):
+        """ Return the aiohttp.ClientTimeout for the next attempt, which must
+        not outlast the deadline """
+        _requireAiohttp()
+        connect, read = timeouts.forAttempt() or (None, None)
+        return aiohttp.ClientTimeout(total=timeouts.remaining(), sock_connect=connect,
+                                     sock_read=read)
+
+    async def _makeAttempt(self, limiter, method, url, payload, headers, timeouts,
+                           responseFile=None):
+        """ Make a single request, within the adaptive concurrency limit if
+        limiter is given """
+        session = self._getSession(url)
+        if limiter is None:
+            return await makeSingleHttpRequest(method, url, payload, headers, session,
+                                               self._clientTimeout(timeouts), responseFile)
+        token = limiter.tryAcquire()
+        wait = 0.001
+        while token is None:
+            self._checkDeadline(timeouts, wait)
+            await asyncio.sleep(wait)
+            wait = min(wait * 2, 0.05)
+            token = limiter.tryAcquire()
+        success = False
+        try:
+            response = await makeSingleHttpRequest(method, url, payload, headers, session,
+                                                   self._clientTimeout(timeouts), responseFile)
+            success = baseclient.isHealthyStatus(response.status_code)
+            return response
+        finally:
+            limiter.release(token, success)
+
+    async def _sendHttpRequest(self, method, url, payload=None, methodName=None,
+                               timeouts=None, responseMode=baseclient.JSON_RESPONSE):
+        """ Make the HTTP request to url, retrying it when that might help """
+
+        if timeouts is None:
+            timeouts = self._callTimeouts()
+
+        payload, contentHash, contentEncoding = self._encodePayload(payload)
+        try:
+            return await self._retryHttpRequest(method, url, payload, contentHash,
+                                                contentEncoding, methodName, timeouts,
+                                                responseMode)
+        finally:
+            if isinstance(payload, utils.SpooledPayload):
+                payload.close()
+
+    async def _retryHttpRequest(self, method, url, payload, contentHash, contentEncoding,
+                                methodName, timeouts, responseMode):
+        hawkCredentials = self._hawkCredentials()
+        breaker = circuitbreaker.getBreakerForOptions(self.options)
+        buckets = ratelimit.getBucketsForOptions(self.options, methodName)
+        limiter = ratelimit.getLimiterForOptions(self.options)
+        retryState = self._retryPolicy().begin()
+        while True:
+            self._checkCircuitBreaker(breaker)
+            try:
+                if buckets:
+                    delay = ratelimit.reserve(buckets)
+                    if delay > 0:
+                        self._checkDeadline(timeouts, delay)
+                        log.debug('Rate limited, waiting %.3fs', delay)
+                        await asyncio.sleep(delay)
+                self._checkDeadline(timeouts)
+                headers = self._makeHeaders(method, url, payload, hawkCredentials, contentHash,
+                                            contentEncoding)
+
+                log.debug('Making attempt %d', retryState.retries)
+                writer = ResponseWriter(responseMode.file) if responseMode.file else None
+                response = await self._makeAttempt(limiter, method, url, payload, headers,
+                                                   timeouts, writer)
+            except _attemptErrors as rerr:
+                if breaker is not None:
+                    breaker.record(False)
+                if writer is not None and not writer.undo():
+                    # Retrying would append the body again
+                    raise exceptions.TaskclusterConnectionError(
+                        'Failed while reading the response', superExc=rerr)
+                delay = retryState.nextDelay(error=rerr)
+                # The attempt may have timed out because the deadline passed
+                self._checkDeadline(timeouts, delay or 0, rerr)
+                if delay is not None:
+                    log.warn('Retrying because of: %s' % rerr)
+                    await asyncio.sleep(delay)
+                    continue
+                # raise a connection exception
+                raise exceptions.TaskclusterConnectionError(
+                    "Failed to establish connection",
+                    superExc=rerr
+                )
+            except BaseException:
+                # No attempt was made, or it was cancelled
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            # Handle non 2xx status code and retry if possible
+            status = response.status_code
+            if breaker is not None:
+                breaker.record(baseclient.isHealthyStatus(status))
+            if status == 204:
+                return None
+            if status >= 400:
+                delay = retryState.nextDelay(
+                    status=status, retryAfter=response.headers.get('Retry-After'))
+                if delay is not None:
+                    self._checkDeadline(timeouts, delay)
+                    log.warn('Retrying because of: status %d' % status)
+                    await asyncio.sleep(delay)
+                    continue
+                # Parse messages from errors
+                data = {}
+                try:
+                    data = response.json()
+                except ValueError:
+                    pass  # Ignore JSON errors in error messages
+                raise self._makeApiFailure(status, data, None)
+
+            if responseMode.stream:
+                return response.written
+            return responseMode.read(response)
@@ -3,27 +3,83 @@
 from __future__ import absolute_import, division, print_function
 
 import os
-import json
 import logging
+import collections
 import copy
+import hashlib
+import pkgutil
 import requests
 import re
+import threading
 import time
 import six
 from six.moves import urllib
-
-# For finding apis.json
-from pkg_resources import resource_string
+from concurrent import futures
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
 
 import mohawk
 import mohawk.bewit
 
+import taskcluster.cache as cache
+import taskcluster.circuitbreaker as circuitbreaker
 import taskcluster.exceptions as exceptions
+import taskcluster.hawk as hawk
+import taskcluster.hedging as hedging
+import taskcluster.ratelimit as ratelimit
+import taskcluster.retry as retry
+import taskcluster.singleflight as singleflight
+import taskcluster.tracing as tracing
+import taskcluster.transport as transport
 import taskcluster.utils as utils
 
 log = logging.getLogger(__name__)
 
-API_CONFIG = json.loads(resource_string(__name__, 'apis.json').decode('utf-8'))
+
+class ApiReferences(Mapping):
+    """ The API definitions of the services, by name, as in apis.json
+
+    genCode.py writes each service's definition to its own file in
+    taskcluster/apis, and they are only read and parsed when first used.
+    """
+
+    def __init__(self, package=__name__, directory='apis'):
+        self._package = package
+        self._directory = directory
+        self._names = None
+        self._references = {}
+
+    def _load(self, name):
+        data = pkgutil.get_data(self._package, '%s/%s.json' % (self._directory, name))
+        return utils.loadJson(data)
+
+    def _services(self):
+        if self._names is None:
+            self._names = frozenset(self._load('_index'))
+        return self._names
+
+    def __getitem__(self, name):
+        try:
+            return self._references[name]
+        except KeyError:
+            pass
+        if name not in self._services():
+            raise KeyError(name)
+        return self._references.setdefault(name, self._load(name))
+
+    def __contains__(self, name):
+        return name in self._services()
+
+    def __iter__(self):
+        return iter(sorted(self._services()))
+
+    def __len__(self):
+        return len(self._services())
+
+
+API_CONFIG = ApiReferences()
 
 # Default configuration
 _defaultConfig = config = {
@@ -33,13 +89,204 @@ _defaultConfig = config = {
         'certificate': os.environ.get('TASKCLUSTER_CERTIFICATE'),
     },
     'maxRetries': 5,
+    # Sign requests with taskcluster.hawk.Signer ('fast') or mohawk.Sender
+    # ('mohawk'), both make the same headers
+    'hawkSigner': 'fast',
+    # Encode payloads in chunks into memory, or a temporary file when they are
+    # large, instead of into one string (see utils.SpooledPayload)
+    'streamPayloads': False,
+    # gzip compress payloads of at least gzipThreshold bytes (None to never
+    # compress them) with compression level gzipLevel
+    'gzipThreshold': None,
+    'gzipLevel': 6,
+    # Seconds to wait for a connection and between bytes of a response, and
+    # the total time allowed for a call including all retries (None for no
+    # limit).  Each API method accepts the same values as keyword arguments
+    'connectTimeout': utils.DEFAULT_CONNECT_TIMEOUT,
+    'readTimeout': utils.DEFAULT_READ_TIMEOUT,
+    'deadline': None,
+    # A taskcluster.retry.RetryPolicy, by default exponential backoff with
+    # maxRetries retries
+    'retryPolicy': None,
+    # Fail fast while a service keeps failing: True or a dict of
+    # taskcluster.circuitbreaker.CircuitBreaker settings
+    'circuitBreaker': None,
+    # Client side rate limits, see taskcluster.ratelimit: requests per second
+    # (or a dict with 'rate' and 'burst') for the service, and a dict of method
+    # name to such a limit
+    'rateLimit': None,
+    'methodRateLimits': None,
+    # Adapt the number of requests in flight to the service to its health:
+    # True or a dict of taskcluster.ratelimit.AdaptiveLimiter settings
+    'adaptiveConcurrency': None,
+    # Hedge slow GET calls with a second request: True or a dict of
+    # taskcluster.hedging.Hedger settings
+    'hedgeRequests': None,
     'signedUrlExpiration': 15 * 60,
+    # Connection pool settings, the pool is shared by all clients using the
+    # same host and settings.  A poolSize of None does not limit the number
+    # of requests in flight
+    'poolSize': transport.DEFAULT_POOL_SIZE,
+    'maxIdleConnections': transport.DEFAULT_MAX_IDLE_CONNECTIONS,
+    'keepAlive': transport.DEFAULT_KEEP_ALIVE,
+    # Slots of the pool reserved for priority classes, e.g. {'high': 2}, and a
+    # dict of method name to priority class overriding
+    # transport.DEFAULT_PRIORITIES.  Both only apply when poolSize is set, and
+    # reservations without a poolSize raise ValueError
+    'poolReservations': None,
+    'priorities': None,
+    # Share one request between concurrent identical GET calls
+    'coalesceRequests': False,
+    # A response cache (e.g. taskcluster.cache.MemoryCache) for GET calls, and
+    # a dict of method name to time-to-live overriding cache.DEFAULT_TTLS
+    'cache': None,
+    'cacheTtls': None,
 }
 
 
+def isHealthyStatus(status):
+    """ Return False for responses showing that the service is struggling,
+    as opposed to errors in the request """
+    return status < 500 and status != 429
+
+
+# Keyword arguments accepted by every API method, overriding the client
+# options of the same name for that call
+CALL_OPTIONS = ('connectTimeout', 'readTimeout', 'deadline', 'priority', 'responseMode',
+                'responseFile')
+
+# What API methods can return for a successful response: its decoded JSON,
+# its body as bytes, a utils.LazyJson decoding it when first used, or the
+# number of bytes of it written to a file object
+RESPONSE_MODES = ('json', 'raw', 'lazy', 'stream')
+
+# Number of calls client.map() makes concurrently when the connection pool
+# is not bounded
+DEFAULT_MAP_CONCURRENCY = 10
+
+
+class ResponseMode(collections.namedtuple('ResponseMode', ['mode', 'file'])):
+    """ How a call returns the body of its response, one of RESPONSE_MODES.
+    file is the file object the body is written to in 'stream' mode """
+
+    @property
+    def stream(self):
+        return self.mode == 'stream'
+
+    def read(self, response):
+        """ Return the body of a successful requests response """
+        if self.mode == 'raw':
+            return response.content
+        if self.mode == 'lazy':
+            return utils.LazyJson(response.content)
+        if self.mode == 'stream':
+            try:
+                return utils.writeResponse(response, self.file)
+            except requests.exceptions.RequestException as rerr:
+                raise exceptions.TaskclusterConnectionError(
+                    'Failed while reading the response', superExc=rerr)
+        try:
+            return utils.loadJson(response.content)
+        except ValueError:
+            return {"response": response}
+
+
+JSON_RESPONSE = ResponseMode('json', None)
+
+
+# One entry of the results of BaseClient.map().  Exactly one of result and
+# exception is meaningful: exception is None if the call succeeded
+BatchResult = collections.namedtuple('BatchResult', ['index', 'args', 'result', 'exception'])
+
+# What signing a request with Hawk needs, made once per set of credentials
+HawkCredentials = collections.namedtuple('HawkCredentials',
+                                         ['clientId', 'accessToken', 'ext', 'signer'])
+
+# The HawkCredentials made by any client, by credentials key, least recently
+# used first, so clients made for the same credentials share them
+HAWK_CREDENTIALS_CACHE_SIZE = 256
+_hawkCredentialsCache = collections.OrderedDict()
+_hawkCredentialsLock = threading.Lock()
+
+
+def encodeCredentials(credentials):
+    """ Encode the strings of a credentials dict to bytes, in place """
+    for x in ('accessToken', 'clientId', 'certificate'):
+        value = credentials.get(x)
+        if value and not isinstance(value, six.binary_type):
+            try:
+                credentials[x] = credentials[x].encode('ascii')
+            except:
+                s = '%s (%s) must be unicode encodable' % (x, credentials[x])
+                raise exceptions.TaskclusterAuthFailure(s)
+
+
+# An argument of a route, e.g. <taskId> in API references or {taskId} in the
+# routes of the generated classes
+_routeArgument = re.compile(r'[<{]([^<>{}]*)[>}]')
+
+
+class RouteTemplate(object):
+    """ A route like "/task/<taskId>/artifacts", split once into the literal
+    parts between its arguments and the names of the arguments """
+
+    __slots__ = ('route', 'parts', 'names')
+
+    def __init__(self, route):
+        self.route = route
+        # Literal parts at even indexes, argument names at odd ones
+        self.parts = tuple(_routeArgument.split(route.lstrip('/')))
+        self.names = frozenset(self.parts[1::2])
+
+    def render(self, replDict, methodName=None):
+        """ Return the route with each argument replaced by its url-quoted
+        value from replDict, without the leading '/' """
+        for key in replDict:
+            if key not in self.names:
+                raise exceptions.TaskclusterFailure(
+                    '{%s} not found in route for %s (%s)' % (key, methodName, self.route))
+        parts = list(self.parts)
+        try:
+            for i in range(1, len(parts), 2):
+                parts[i] = urllib.parse.quote(str(replDict[parts[i]]).encode('utf-8'), '')
+        except KeyError:
+            raise exceptions.TaskclusterFailure(
+                "Error in string formatting %s route %s with %s!" %
+                (methodName, self.route, str(replDict)))
+        return ''.join(parts)
+
+
+_routeTemplates = {}
+
+
+def routeTemplate(route):
+    """ Return the RouteTemplate of route, which is only split once """
+    template = _routeTemplates.get(route)
+    if template is None:
+        template = _routeTemplates.setdefault(route, RouteTemplate(route))
+    return template
+
+
+# The classOptions and default config of each client class, when they were
+# last merged, and the result
+SharedOptions = collections.namedtuple('SharedOptions', 'defaults classOptions options')
+
+_sharedOptions = {}
+
+
+def _mergeOptions(classOptions):
+    """ Return classOptions overridden by the default config """
+    o = copy.deepcopy(classOptions)
+    o.update(_defaultConfig)
+    return o
+
+
 def createSession(*args, **kwargs):
     """ Create a new requests session.  This passes through all positional and
-    keyword arguments to the requests.Session() constructor
+    keyword arguments to the requests.Session() constructor.
+
+    Sessions created this way are not pooled with other clients, the shared
+    pooled sessions are available through taskcluster.transport.getSession()
     """
     return requests.Session(*args, **kwargs)
 
@@ -52,34 +299,185 @@ class BaseClient(object):
     """
 
     def __init__(self, options=None, session=None):
-        o = copy.deepcopy(self.classOptions)
-        o.update(_defaultConfig)
+        o = dict(self._sharedOptions())
         if options:
             o.update(options)
 
         credentials = o.get('credentials')
         if credentials:
-            for x in ('accessToken', 'clientId', 'certificate'):
-                value = credentials.get(x)
-                if value and not isinstance(value, six.binary_type):
-                    try:
-                        credentials[x] = credentials[x].encode('ascii')
-                    except:
-                        s = '%s (%s) must be unicode encodable' % (x, credentials[x])
-                        raise exceptions.TaskclusterAuthFailure(s)
+            encodeCredentials(credentials)
         self.options = o
-        if 'credentials' in o:
-            log.debug('credentials key scrubbed from logging output')
-        log.debug(dict((k, v) for k, v in o.items() if k != 'credentials'))
+        # (credentials key, HawkCredentials) of the last credentials used
+        self._hawkCache = None
+        if tracing.enabled(log):
+            if 'credentials' in o:
+                log.debug('credentials key scrubbed from logging output')
+            log.debug(dict((k, v) for k, v in o.items() if k != 'credentials'))
 
         if session:
             self.session = session
         else:
-            self.session = createSession()
+            self.session = self._defaultSession()
+
+    def _sharedOptions(self):
+        """ Return the options of this client before its own options are
+        applied: its classOptions, overridden by the default config.  These are
+        merged once per class, and again only when the default config or
+        classOptions change, and must not be modified """
+        cls = type(self)
+        if 'classOptions' in self.__dict__:
+            # Set per instance, by an older subclass
+            return _mergeOptions(self.classOptions)
+        shared = _sharedOptions.get(cls)
+        if shared is not None and shared.defaults == _defaultConfig and \
+                shared.classOptions == cls.classOptions:
+            return shared.options
+        shared = SharedOptions(dict(_defaultConfig), copy.deepcopy(cls.classOptions),
+                               _mergeOptions(cls.classOptions))
+        _sharedOptions[cls] = shared
+        return shared.options
+
+    def withCredentials(self, credentials, authorizedScopes=None):
+        """ Return a new client, like this one but using credentials, and
+        authorizedScopes, instead of its own.
+
+        This is much cheaper than constructing a client: the new client starts
+        from this client's options and shares its session.  It suits services
+        which make calls with the credentials of each of their requests.
+        """
+        client = type(self).__new__(type(self))
+        client.__dict__.update(self.__dict__)
+        client.setCredentials(credentials, authorizedScopes)
+        return client
+
+    def _defaultSession(self):
+        """ Return the session to use when none was given to the constructor """
+        if self.options.get('baseUrl'):
+            return transport.getSessionForOptions(self.options['baseUrl'], self.options)
+        # Clients for exchanges only never make HTTP requests
+        return None
+
+    def map(self, methodName, argsList, concurrency=None, ordered=True):
+        """ Call the API method methodName once for every item of argsList,
+        running up to concurrency calls at a time on a pool of threads which
+        share this client's connection pool.
+
+        Each item of argsList is either a tuple or list of positional
+        arguments for the method, or a single argument.  For example
+        queue.map('status', taskIds) or queue.map('createTask', [(taskId,
+        payload), ...]).
+
+        Yields a BatchResult for each item, in the order of argsList when
+        ordered is True and as the calls complete otherwise.  A call which
+        raises does not stop the batch, its exception is stored in the
+        BatchResult instead.  concurrency defaults to the poolSize option, or
+        DEFAULT_MAP_CONCURRENCY if the pool is not bounded.
+        """
+        method = getattr(self, methodName)
+        if concurrency is None:
+            concurrency = self.options.get('poolSize') or DEFAULT_MAP_CONCURRENCY
+        if concurrency < 1:
+            raise exceptions.TaskclusterFailure('concurrency must be at least 1')
+
+        def call(index, args):
+            if not isinstance(args, (tuple, list)):
+                args = (args,)
+            try:
+                return BatchResult(index, args, method(*args), None)
+            except Exception as e:
+                log.debug('%s call %d failed: %s', methodName, index, e)
+                return BatchResult(index, args, None, e)
+
+        # Only keep a bounded number of calls queued so that huge (or lazy)
+        # argsList iterables are not all turned into futures up front
+        window = concurrency * 2
+        items = enumerate(argsList)
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = collections.deque()
+            for index, args in items:
+                pending.append(executor.submit(call, index, args))
+                if len(pending) < window:
+                    continue
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    for f in done:
+                        pending.remove(f)
+                        yield f.result()
+            if ordered:
+                for f in pending:
+                    yield f.result()
+            else:
+                for f in futures.as_completed(pending):
+                    yield f.result()
+
+    def setCredentials(self, credentials, authorizedScopes=None):
+        """ Replace the credentials, and authorizedScopes, used by this client.
+
+        Both are swapped at once: each call is made with either the old or the
+        new credentials, never a mix of them.  Calls already in progress finish
+        with the credentials they started with.
+        """
+        o = dict(self.options)
+        if credentials:
+            credentials = dict(credentials)
+            encodeCredentials(credentials)
+        o['credentials'] = credentials
+        if authorizedScopes is None:
+            o.pop('authorizedScopes', None)
+        else:
+            o['authorizedScopes'] = authorizedScopes
+        self.options = o
+
+    def _credentialsKey(self, options=None):
+        """ Return a tuple which changes whenever the credentials or
+        authorizedScopes options change """
+        o = options or self.options
+        c = o.get('credentials') or {}
+        scopes = o.get('authorizedScopes')
+        return (
+            c.get('clientId'),
+            c.get('accessToken'),
+            c.get('certificate'),
+            tuple(scopes) if scopes is not None else None,
+        )
+
+    def _hawkCredentials(self):
+        """ Return the HawkCredentials to sign requests with, or None if this
+        client has no credentials.  Decoding the certificate and making the ext
+        is only done once for each set of credentials """
+        o = self.options
+        key = self._credentialsKey(o)
+        cached = self._hawkCache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if self._hasCredentials(o):
+            with _hawkCredentialsLock:
+                credentials = _hawkCredentialsCache.pop(key, None)
+                if credentials is not None:
+                    _hawkCredentialsCache[key] = credentials
+            if credentials is None:
+                c = o['credentials']
+                ext = self._makeHawkExt(o)
+                credentials = HawkCredentials(c['clientId'], c['accessToken'], ext,
+                                              hawk.Signer(c['clientId'], c['accessToken'], ext))
+                with _hawkCredentialsLock:
+                    _hawkCredentialsCache[key] = credentials
+                    while len(_hawkCredentialsCache) > HAWK_CREDENTIALS_CACHE_SIZE:
+                        _hawkCredentialsCache.popitem(last=False)
+        else:
+            credentials = None
+        self._hawkCache = (key, credentials)
+        return credentials
 
     def makeHawkExt(self):
         """ Make an 'ext' for Hawk authentication """
-        o = self.options
+        credentials = self._hawkCredentials()
+        return credentials.ext if credentials else {}
+
+    def _makeHawkExt(self, o):
+        """ Make the 'ext' for the credentials and authorizedScopes in o """
         c = o.get('credentials', {})
         if c.get('clientId') and c.get('accessToken'):
             ext = {}
@@ -88,10 +486,10 @@ class BaseClient(object):
                 if six.PY3 and isinstance(cert, six.binary_type):
                     cert = cert.decode()
                 if isinstance(cert, six.string_types):
-                    cert = json.loads(cert)
+                    cert = utils.loadJson(cert)
                 ext['certificate'] = cert
 
-            if 'authorizedScopes' in o:
+            if o.get('authorizedScopes') is not None:
                 ext['authorizedScopes'] = o['authorizedScopes']
 
             # .encode('base64') inserts a newline, which hawk doesn't
@@ -143,28 +541,11 @@ class BaseClient(object):
 
     def makeRoute(self, methodName, route=None, replDict=None):
         """ Given a route like "/task/<taskId>/artifacts" and a mapping like
-        {"taskId": "12345"}, return a string like "/task/12345/artifacts"
+        {"taskId": "12345"}, return a string like "task/12345/artifacts"
         """
         if route is None:
             route = self.routes[methodName]
-        if replDict is None:
-            replDict = {}
-        route = re.sub('<(.*?)>', '{\\1}', route)
-        for key, value in six.iteritems(replDict):
-            replDict[key] = urllib.parse.quote(str(value).encode("utf-8"), '')
-            s = '{%s}' % key
-            if s not in route:
-                raise exceptions.TaskclusterFailure(
-                    '%s not found in route for %s (%s)' % (s, methodName, route))
-        try:
-            route = route.format(**replDict)
-        except KeyError:
-            raise exceptions.TaskclusterFailure(
-                "Error in string formatting %s route %s with %s!" %
-                (methodName, route, str(replDict))
-            )
-
-        return route.lstrip('/')
+        return routeTemplate(route).render(replDict or {}, methodName)
 
     def buildUrl(self, methodName=None, requestUrl=None, replDict=None, **kwargs):
         """Build a tc url.
@@ -252,9 +633,9 @@ class BaseClient(object):
             u.fragment,
         ))
 
-    def _hasCredentials(self):
+    def _hasCredentials(self, options=None):
         """ Return True, if credentials is given """
-        cred = self.options.get('credentials')
+        cred = (options or self.options).get('credentials')
         return (
             cred and
             'clientId' in cred and
@@ -267,8 +648,9 @@ class BaseClient(object):
         if not options:
             return ''
         if validOptions:
-            validOptionsSet = set(validOptions)
-            if not validOptionsSet.issuperset(set(options.keys())):
+            if not isinstance(validOptions, (set, frozenset)):
+                validOptions = set(validOptions)
+            if not validOptions.issuperset(options):
                 raise exceptions.TaskclusterRestFailure(
                     "Invalid options not in validOptions!",
                     str(options), str(validOptions)
@@ -287,62 +669,314 @@ class BaseClient(object):
             baseUrl += '/'
         return urllib.parse.urljoin(baseUrl, route.lstrip('/') + queryString)
 
-    def _makeHttpRequest(self, method, route, payload=None, **kwargs):
+    def _makeHeaders(self, method, url, payload, credentials, contentHash=None,
+                     contentEncoding=None):
+        """ Make the headers for a single attempt of an API request, signed
+        with the HawkCredentials credentials if they are not None.  contentHash
+        is the Hawk hash of the payload, if it is known already, and
+        contentEncoding its Content-Encoding, e.g. 'gzip'.  The Hawk
+        header has to be made again for each attempt since it is only valid for
+        a short time """
+        contentType = 'application/json' if payload else ''
+        if credentials is None:
+            log.debug('Not using hawk!')
+            headers = {}
+        elif self.options.get('hawkSigner') == 'mohawk':
+            if isinstance(payload, utils.SpooledPayload):
+                # mohawk hashes file objects by reading them
+                payload = payload.rewind()
+            sender = mohawk.Sender(
+                credentials={
+                    'id': credentials.clientId,
+                    'key': credentials.accessToken,
+                    'algorithm': 'sha256',
+                },
+                ext=credentials.ext if credentials.ext else {},
+                url=url,
+                content=payload if payload else '',
+                content_type=contentType,
+                method=method,
+            )
+            headers = {'Authorization': sender.request_header}
+        else:
+            if contentHash is None:
+                contentHash = hawk.payloadHash(payload, contentType)
+            headers = {'Authorization': credentials.signer.header(
+                method, url, contentHash=contentHash)}
+        if payload:
+            # Set header for JSON if payload is given, note that we serialize
+            # outside the retry loop.
+            headers['Content-Type'] = 'application/json'
+        if contentEncoding:
+            headers['Content-Encoding'] = contentEncoding
+        return headers
+
+    def _makeApiFailure(self, status, data, superExc):
+        """ Make the exception to raise for an API call which failed with the
+        given HTTP status and (parsed JSON) body """
+        # Find error message
+        message = "Unknown Server Error"
+        if isinstance(data, dict):
+            message = data.get('message')
+        else:
+            if status == 401:
+                message = "Authentication Error"
+            elif status == 500:
+                message = "Internal Server Error"
+        # Raise TaskclusterAuthFailure if this is an auth issue
+        if status == 401:
+            return exceptions.TaskclusterAuthFailure(
+                message,
+                status_code=status,
+                body=data,
+                superExc=superExc
+            )
+        # Raise TaskclusterRestFailure for all other issues
+        return exceptions.TaskclusterRestFailure(
+            message,
+            status_code=status,
+            body=data,
+            superExc=superExc
+        )
+
+    def _coalescingKey(self, method, url):
+        """ Requests with the same key return the same response, so they can
+        share a single round trip """
+        return (method.upper(), url) + self._credentialsKey()
+
+    def _responseCacheTtl(self, method, methodName):
+        """ Return how long the response of this API call can be cached, or
+        cache.NEVER when it must not be cached """
+        if self.options.get('cache') is None or not methodName or method.upper() != 'GET':
+            return cache.NEVER
+        return cache.ttlFor(type(self).__name__, methodName, self.options.get('cacheTtls'))
+
+    def _responseCacheKey(self, url):
+        """ Responses are cached per credentials and authorizedScopes, which
+        are hashed so that no secret ends up in a shared or on-disk cache """
+        credentials = repr(self._credentialsKey()).encode('utf-8')
+        digest = hashlib.sha256(credentials).hexdigest()
+        return '%s %s' % (digest, url)
+
+    def _makeHttpRequest(self, method, route, payload=None, methodName=None,
+                         connectTimeout=None, readTimeout=None, deadline=None, priority=None,
+                         responseMode=None, responseFile=None, **kwargs):
         """ Make an HTTP Request for the API endpoint.  This method wraps
         the logic about doing failure retry and passes off the actual work
-        of doing an HTTP request to another method."""
-
+        of doing an HTTP request to another method.
+
+        methodName is the name of the API method being called, used to find
+        out whether its response can be cached and which rate limits apply.
+        With the coalesceRequests option, concurrent identical GET requests
+        share the response of a single request, and with the hedgeRequests
+        option slow GET requests are hedged (see taskcluster.hedging).
+
+        connectTimeout, readTimeout and deadline override the client options
+        of the same name for this call.  When the deadline passes before the
+        call succeeded, TaskclusterDeadlineExceeded is raised.  priority is
+        the call's priority class in the connection pool, by default found
+        with transport.priorityFor().
+
+        responseMode is one of RESPONSE_MODES, by default 'json', or
+        'stream' if a responseFile to write the response body to is given.
+        Only 'json' responses are cached and coalesced, and 'stream' calls
+        are not hedged."""
+
+        timeouts = self._callTimeouts(connectTimeout, readTimeout, deadline)
+        priority = self._callPriority(methodName, priority)
+        responseMode = self._callResponseMode(responseMode, responseFile)
         url = self.makeFullUrl(route, **kwargs)
-        log.debug('Full URL used is: %s', url)
-
-        hawkExt = self.makeHawkExt()
-
-        # Serialize payload if given
-        if payload is not None:
+        tracing.trace(log, 'call', method=method, methodName=methodName, url=url)
+
+        ttl = cache.NEVER
+        if responseMode.mode == 'json':
+            ttl = self._responseCacheTtl(method, methodName)
+        if ttl != cache.NEVER:
+            responseCache = self.options['cache']
+            cacheKey = self._responseCacheKey(url)
+            result = responseCache.get(cacheKey)
+            if result is not None:
+                log.debug('Using cached response for %s', url)
+                return result
+
+        hedger = None
+        if not responseMode.stream:
+            hedger = hedging.getHedgerForCall(self.options, method, methodName)
+
+        def send():
+            if hedger is not None:
+                return hedger.call(
+                    lambda: self._sendHttpRequest(method, url, payload, methodName, timeouts,
+                                                  priority, responseMode))
+            return self._sendHttpRequest(method, url, payload, methodName, timeouts, priority,
+                                         responseMode)
+
+        if (self.options.get('coalesceRequests') and method.upper() == 'GET' and
+                payload is None and responseMode.mode == 'json'):
+            result = singleflight.do(self._coalescingKey(method, url), send,
+                                     timeouts.remaining())
+        else:
+            result = send()
+
+        if ttl != cache.NEVER:
+            responseCache.set(cacheKey, result, ttl)
+        return result
+
+    def _callTimeouts(self, connectTimeout=None, readTimeout=None, deadline=None):
+        """ Return the Timeouts of a call starting now """
+        if connectTimeout is None:
+            connectTimeout = self.options.get('connectTimeout')
+        if readTimeout is None:
+            readTimeout = self.options.get('readTimeout')
+        if deadline is None:
+            deadline = self.options.get('deadline')
+        return utils.Timeouts.start(connectTimeout, readTimeout, deadline)
+
+    def _callPriority(self, methodName=None, priority=None):
+        """ Return the priority class of a call of methodName """
+        if priority is None:
+            priority = transport.priorityFor(type(self).__name__, methodName,
+                                             self.options.get('priorities'))
+        if priority not in transport.PRIORITIES:
+            raise exceptions.TaskclusterFailure('Unknown priority %r' % (priority,))
+        return priority
+
+    def _callResponseMode(self, responseMode=None, responseFile=None):
+        """ Return the ResponseMode of a call """
+        if responseMode is None:
+            responseMode = 'json' if responseFile is None else 'stream'
+        if responseMode not in RESPONSE_MODES:
+            raise exceptions.TaskclusterFailure('Unknown response mode %r' % (responseMode,))
+        if (responseMode == 'stream') != (responseFile is not None):
+            raise exceptions.TaskclusterFailure(
+                "responseFile must be given for, and only for, the 'stream' response mode")
+        return ResponseMode(responseMode, responseFile)
+
+    def _checkDeadline(self, timeouts, delay=0, superExc=None):
+        """ Raise TaskclusterDeadlineExceeded if the deadline passes within
+        delay seconds """
+        timeouts.check(delay, superExc)
+
+    def _retryPolicy(self):
+        """ Return the retry policy for this client's requests """
+        policy = self.options.get('retryPolicy')
+        if policy is None:
+            policy = retry.ExponentialBackoff(maxRetries=self.options['maxRetries'])
+        return policy
+
+    def _checkCircuitBreaker(self, breaker):
+        """ Raise TaskclusterCircuitOpen if breaker does not allow a request """
+        if breaker is not None and not breaker.allow():
+            baseUrl = self.options['baseUrl']
+            raise exceptions.TaskclusterCircuitOpen(
+                'Circuit breaker for %s is open' % baseUrl, baseUrl=baseUrl)
+
+    def _makeAttempt(self, limiter, method, url, payload, headers, timeouts,
+                     priority=None, stream=False):
+        """ Make a single request, within the adaptive concurrency limit if
+        limiter is given """
+        if limiter is None:
+            return utils.makeSingleHttpRequest(method, url, payload, headers, self.session,
+                                               timeouts, priority, stream)
+        token = limiter.acquire(timeouts.remaining())
+        success = False
+        try:
+            response = utils.makeSingleHttpRequest(method, url, payload, headers, self.session,
+                                                   timeouts, priority, stream)
+            success = isHealthyStatus(response.status_code)
+            return response
+        finally:
+            limiter.release(token, success)
+
+    def _encodePayload(self, payload):
+        """ Serialize the payload of a request.  Return it, its Hawk payload
+        hash if that was made while serializing it, and its Content-Encoding.
+
+        With the streamPayloads option the payload is encoded in chunks into a
+        utils.SpooledPayload, hashing each chunk as it is made, so that large
+        payloads are only walked once and never held in memory whole.
+
+        With the gzipThreshold option payloads of at least that many bytes are
+        gzip compressed, and so are all streamed payloads since their size is
+        only known once they are encoded.  The Hawk hash covers the compressed
+        bytes, which are the body of the request.
+        """
+        if payload is None:
+            return None, None, None
+        threshold = self.options.get('gzipThreshold')
+        level = self.options.get('gzipLevel')
+        if not self.options.get('streamPayloads'):
             payload = utils.dumpJson(payload)
-
-        # Do a loop of retries
-        retry = -1  # we plus first in the loop, and attempt 1 is retry 0
-        retries = self.options['maxRetries']
-        while retry < retries:
-            retry += 1
-            time.sleep(utils.calculateSleepTime(retry))
-            # Construct header
-            if self._hasCredentials():
-                sender = mohawk.Sender(
-                    credentials={
-                        'id': self.options['credentials']['clientId'],
-                        'key': self.options['credentials']['accessToken'],
-                        'algorithm': 'sha256',
-                    },
-                    ext=hawkExt if hawkExt else {},
-                    url=url,
-                    content=payload if payload else '',
-                    content_type='application/json' if payload else '',
-                    method=method,
-                )
-
-                headers = {'Authorization': sender.request_header}
-            else:
-                log.debug('Not using hawk!')
-                headers = {}
-            if payload:
-                # Set header for JSON if payload is given, note that we serialize
-                # outside this loop.
-                headers['Content-Type'] = 'application/json'
-
-            log.debug('Making attempt %d', retry)
+            if threshold is None or len(payload) < threshold:
+                return payload, None, None
+            payload = utils.gzipBytes(payload.encode('utf-8'), level)
+            return payload, hawk.payloadHash(payload, 'application/json'), 'gzip'
+        hasher = hawk.payloadHasher('application/json')
+        compressLevel = level if threshold is not None else None
+        payload = utils.SpooledPayload(payload, hashers=[hasher], compressLevel=compressLevel)
+        return payload, hawk.payloadDigest(hasher), payload.contentEncoding
+
+    def _sendHttpRequest(self, method, url, payload=None, methodName=None, timeouts=None,
+                         priority=None, responseMode=JSON_RESPONSE):
+        """ Make the HTTP request to url, retrying it when that might help """
+
+        if timeouts is None:
+            timeouts = self._callTimeouts()
+
+        payload, contentHash, contentEncoding = self._encodePayload(payload)
+        try:
+            return self._retryHttpRequest(method, url, payload, contentHash, contentEncoding,
+                                          methodName, timeouts, priority, responseMode)
+        finally:
+            if isinstance(payload, utils.SpooledPayload):
+                payload.close()
+
+    def _retryHttpRequest(self, method, url, payload, contentHash, contentEncoding, methodName,
+                          timeouts, priority, responseMode):
+        hawkCredentials = self._hawkCredentials()
+        breaker = circuitbreaker.getBreakerForOptions(self.options)
+        buckets = ratelimit.getBucketsForOptions(self.options, methodName)
+        limiter = ratelimit.getLimiterForOptions(self.options)
+        retryState = self._retryPolicy().begin()
+        while True:
+            self._checkCircuitBreaker(breaker)
             try:
-                response = utils.makeSingleHttpRequest(method, url, payload, headers)
+                if buckets:
+                    delay = ratelimit.reserve(buckets)
+                    if delay > 0:
+                        self._checkDeadline(timeouts, delay)
+                        log.debug('Rate limited, waiting %.3fs', delay)
+                        time.sleep(delay)
+                self._checkDeadline(timeouts)
+                headers = self._makeHeaders(method, url, payload, hawkCredentials, contentHash,
+                                            contentEncoding)
+
+                log.debug('Making attempt %d', retryState.retries)
+                response = self._makeAttempt(limiter, method, url, payload, headers,
+                                             timeouts, priority, responseMode.stream)
             except requests.exceptions.RequestException as rerr:
-                if retry < retries:
+                if breaker is not None:
+                    breaker.record(False)
+                delay = retryState.nextDelay(error=rerr)
+                # The attempt may have timed out because the deadline passed
+                self._checkDeadline(timeouts, delay or 0, rerr)
+                if delay is not None:
                     log.warn('Retrying because of: %s' % rerr)
+                    time.sleep(delay)
                     continue
                 # raise a connection exception
                 raise exceptions.TaskclusterConnectionError(
                     "Failed to establish connection",
                     superExc=rerr
                 )
+            except BaseException:
+                # No attempt was made, or its outcome is unknown
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record(isHealthyStatus(response.status_code))
 
             # Handle non 2xx status code and retry if possible
             try:
@@ -352,45 +986,21 @@ class BaseClient(object):
 
             except requests.exceptions.RequestException as rerr:
                 status = response.status_code
-                if 500 <= status and status < 600 and retry < retries:
+                delay = retryState.nextDelay(
+                    status=status, retryAfter=response.headers.get('Retry-After'))
+                if delay is not None:
+                    # A streamed response holds on to its connection until closed
+                    response.close()
+                    self._checkDeadline(timeouts, delay, rerr)
                     log.warn('Retrying because of: %s' % rerr)
+                    time.sleep(delay)
                     continue
                 # Parse messages from errors
                 data = {}
                 try:
-                    data = response.json()
+                    data = utils.loadJson(response.content)
                 except:
                     pass  # Ignore JSON errors in error messages
-                # Find error message
-                message = "Unknown Server Error"
-                if isinstance(data, dict):
-                    message = data.get('message')
-                else:
-                    if status == 401:
-                        message = "Authentication Error"
-                    elif status == 500:
-                        message = "Internal Server Error"
-                # Raise TaskclusterAuthFailure if this is an auth issue
-                if status == 401:
-                    raise exceptions.TaskclusterAuthFailure(
-                        message,
-                        status_code=status,
-                        body=data,
-                        superExc=rerr
-                    )
-                # Raise TaskclusterRestFailure for all other issues
-                raise exceptions.TaskclusterRestFailure(
-                    message,
-                    status_code=status,
-                    body=data,
-                    superExc=rerr
-                )
-
-            # Try to load JSON
-            try:
-                return response.json()
-            except ValueError:
-                return {"response": response}
+                raise self._makeApiFailure(status, data, rerr)
 
-        # This code-path should be unreachable
-        assert False, "Error from last retry should have been raised!"
+            return responseMode.read(response)
@@ -0,0 +1,290 @@
+"""Response caches for API calls whose results do not change
+
+A cache is enabled by passing an instance as the 'cache' client option.  Only
+GET calls for which a time-to-live is known are cached, see DEFAULT_TTLS and
+the 'cacheTtls' client option.  MemoryCache lives in a single process while
+SqliteCache is stored on disk and can be shared by many processes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import taskcluster.utils as utils
+
+log = logging.getLogger(__name__)
+
+# Time-to-live values, in seconds.  FOREVER is for immutable resources, a
+# time-to-live of NEVER disables caching.
+FOREVER = None
+NEVER = 0
+
+# Default time-to-live per service and method name.  Methods which are not
+# listed here are not cached unless the 'cacheTtls' client option says so.
+DEFAULT_TTLS = {
+    'Queue': {
+        # Task definitions are immutable
+        'task': FOREVER,
+        'status': 5,
+        'pendingTasks': 5,
+        # Artifacts can still be added while the run is not resolved
+        'listArtifacts': 10,
+    },
+    'Scheduler': {
+        'info': FOREVER,
+        'status': 5,
+    },
+}
+
+
+def ttlFor(serviceName, methodName, overrides=None):
+    """ Return the time-to-live for responses of serviceName's methodName,
+    looking at overrides (a dict of methodName to time-to-live) first """
+    if overrides and methodName in overrides:
+        return overrides[methodName]
+    return DEFAULT_TTLS.get(serviceName, {}).get(methodName, NEVER)
+
+
+class MemoryCache(object):
+    """ An in-memory, thread safe, least recently used response cache
+
+    The cache is bounded both by the number of entries and by the total size
+    of the cached responses (measured as their JSON encoding).  Values are
+    stored encoded, so each hit returns a fresh copy of the response.
+    """
+
+    def __init__(self, maxEntries=1024, maxBytes=64 * 1024 * 1024):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self._lock = threading.Lock()
+        # key -> (expires, encoded value), least recently used first
+        self._entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """ Return the value cached for key, or None """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Mark as most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+        return utils.loadJson(entry[1])
+
+    def set(self, key, value, ttl=FOREVER):
+        """ Cache value for key, for ttl seconds or forever """
+        if value is None or ttl == NEVER:
+            return
+        try:
+            encoded = utils.dumpJson(value)
+        except (TypeError, ValueError):
+            log.debug('Not caching response for %s, it is not JSON', key)
+            return
+        if len(encoded) > self.maxBytes:
+            return
+        expires = None if ttl is FOREVER else time.time() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, encoded)
+            self.bytes += len(encoded)
+            while len(self._entries) > self.maxEntries or self.bytes > self.maxBytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, encoded = self._entries.pop(key)
+        self.bytes -= len(encoded)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """ Return the cache counters, for monitoring """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class SqliteCache(object):
+    """ A persistent response cache stored in a sqlite database
+
+    The database can be shared by any number of threads and processes, e.g.
+    short lived tools which would otherwise fetch the same task definitions
+    over and over.  When the cached responses grow beyond maxBytes, the least
+    recently used ones are evicted.  compact() removes expired entries and
+    returns the freed space to the filesystem; run it from time to time.
+
+    The cache is optional, so sqlite errors while reading or writing it (a
+    locked database, a full disk, ...) are logged and handled as a miss or
+    not caching the response.
+    """
+
+    def __init__(self, path, maxBytes=256 * 1024 * 1024, timeout=30):
+        self.path = path
+        self.maxBytes = maxBytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._connect() as conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL,
+                accessed REAL NOT NULL
+            )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed "
+                         "ON responses (accessed)")
+            # The total size of the responses, kept up to date by triggers so
+            # that it is right whichever process changed the cache
+            conn.execute("""CREATE TABLE IF NOT EXISTS total (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                size INTEGER NOT NULL
+            )""")
+            conn.execute("INSERT OR IGNORE INTO total "
+                         "SELECT 0, COALESCE(SUM(size), 0) FROM responses")
+            conn.execute("""CREATE TRIGGER IF NOT EXISTS responses_insert
+                AFTER INSERT ON responses BEGIN
+                    UPDATE total SET size = size + NEW.size WHERE id = 0;
+                END""")
+            conn.execute("""CREATE TRIGGER IF NOT EXISTS responses_delete
+                AFTER DELETE ON responses BEGIN
+                    UPDATE total SET size = size - OLD.size WHERE id = 0;
+                END""")
+
+    def _connect(self):
+        """ Return this thread's connection to the database.  sqlite
+        connections can be used neither from other threads nor after a fork """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            # Readers and a writer can use the database at the same time
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key):
+        """ Return the value cached for key, or None """
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute('SELECT value, expires FROM responses WHERE key = ?',
+                                   (key,)).fetchone()
+                if row is not None and row[1] is not None and row[1] <= now:
+                    conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    row = None
+                if row is not None:
+                    conn.execute('UPDATE responses SET accessed = ? WHERE key = ?',
+                                 (now, key))
+        except sqlite3.Error as e:
+            log.warning('Could not read the response cache %s: %s', self.path, e)
+            row = None
+        if row is None:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return utils.loadJson(row[0])
+
+    def set(self, key, value, ttl=FOREVER):
+        """ Cache value for key, for ttl seconds or forever """
+        if value is None or ttl == NEVER:
+            return
+        try:
+            encoded = utils.dumpJson(value)
+        except (TypeError, ValueError):
+            log.debug('Not caching response for %s, it is not JSON', key)
+            return
+        if len(encoded) > self.maxBytes:
+            return
+        now = time.time()
+        expires = None if ttl is FOREVER else now + ttl
+        try:
+            with self._connect() as conn:
+                # A replaced row would not go through the delete trigger
+                conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                conn.execute('INSERT INTO responses VALUES (?, ?, ?, ?, ?)',
+                             (key, encoded, len(encoded), expires, now))
+                self._evict(conn)
+        except sqlite3.Error as e:
+            log.warning('Could not write to the response cache %s: %s', self.path, e)
+
+    def _evict(self, conn):
+        """ Evict least recently used entries until we are within maxBytes """
+        total = conn.execute('SELECT size FROM total').fetchone()[0]
+        if total <= self.maxBytes:
+            return
+        rows = conn.execute('SELECT key, size FROM responses ORDER BY accessed')
+        evict = []
+        for key, size in rows:
+            if total <= self.maxBytes:
+                break
+            evict.append((key,))
+            total -= size
+        conn.executemany('DELETE FROM responses WHERE key = ?', evict)
+        with self._lock:
+            self.evictions += len(evict)
+
+    def compact(self):
+        """ Remove expired entries, enforce maxBytes and shrink the database
+        file.  This is safe to run while other processes use the cache """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?',
+                         (time.time(),))
+            self._evict(conn)
+        self._connect().execute('VACUUM')
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM responses')
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def stats(self):
+        """ Return the cache counters, for monitoring.  Hits, misses and
+        evictions are counted for this process only """
+        conn = self._connect()
+        entries = conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        size = conn.execute('SELECT size FROM total').fetchone()[0]
+        with self._lock:
+            return {
+                'entries': entries,
+                'bytes': size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,197 @@
+"""Circuit breakers for failing services
+
+When too many recent requests to a service have failed, its circuit breaker
+opens and further calls fail immediately with TaskclusterCircuitOpen instead
+of going through the whole retry loop.  After openTimeout seconds the breaker
+half-opens and lets a few probe requests through: if they succeed the breaker
+closes again, otherwise it re-opens.
+
+Breakers are shared by all clients with the same baseUrl in this process.  A
+client uses one when its 'circuitBreaker' option is True or a dict of
+CircuitBreaker settings.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import logging
+import threading
+import time
+
+import taskcluster.exceptions as exceptions
+
+log = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+    """ Track the outcome of requests to one service
+
+    failureRate: fraction of failed requests which opens the breaker
+    minimumRequests: the breaker does not open before this many requests were
+        made within the window
+    window: only requests of the last window seconds are considered
+    openTimeout: seconds to wait before half-opening an open breaker
+    halfOpenProbes: requests let through, and which must all succeed, while
+        half-open
+    """
+
+    def __init__(self, failureRate=0.5, minimumRequests=10, window=30, openTimeout=30,
+                 halfOpenProbes=1):
+        self.failureRate = failureRate
+        self.minimumRequests = minimumRequests
+        self.window = window
+        self.openTimeout = openTimeout
+        self.halfOpenProbes = halfOpenProbes
+        self._lock = threading.Lock()
+        # (time, failed) for each recent request, oldest first
+        self._outcomes = collections.deque()
+        self._failures = 0
+        self._state = CLOSED
+        self._openedAt = None
+        self._probes = 0
+        self._probeSuccesses = 0
+        self.rejected = 0
+
+    def settings(self):
+        """ Return the settings this breaker was created with """
+        return {
+            'failureRate': self.failureRate,
+            'minimumRequests': self.minimumRequests,
+            'window': self.window,
+            'openTimeout': self.openTimeout,
+            'halfOpenProbes': self.halfOpenProbes,
+        }
+
+    def _expire(self, now):
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            _, failed = self._outcomes.popleft()
+            self._failures -= failed
+
+    def _open(self, now):
+        self._state = OPEN
+        self._openedAt = now
+        self._outcomes.clear()
+        self._failures = 0
+
+    def allow(self):
+        """ Return True if a request may be made now """
+        now = time.time()
+        with self._lock:
+            if self._state == OPEN and now - self._openedAt >= self.openTimeout:
+                log.info('Circuit breaker half-open, probing')
+                self._state = HALF_OPEN
+                self._probes = 0
+                self._probeSuccesses = 0
+            if self._state == HALF_OPEN and self._probes < self.halfOpenProbes:
+                self._probes += 1
+                return True
+            if self._state == CLOSED:
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self):
+        """ Give back a request which allow() let through but which was not
+        made, e.g. because its deadline passed, so that no outcome will be
+        recorded for it.  Otherwise a half-open breaker would wait for the
+        outcome of that probe forever """
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > self._probeSuccesses:
+                self._probes -= 1
+
+    def record(self, success):
+        """ Record the outcome of a request which allow() let through """
+        now = time.time()
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if not success:
+                    log.warn('Circuit breaker probe failed, re-opening')
+                    self._open(now)
+                    return
+                self._probeSuccesses += 1
+                if self._probeSuccesses >= self.halfOpenProbes:
+                    log.info('Circuit breaker closed')
+                    self._state = CLOSED
+                return
+            if self._state == OPEN:
+                # A request made before the breaker opened
+                return
+            self._expire(now)
+            self._outcomes.append((now, not success))
+            self._failures += not success
+            count = len(self._outcomes)
+            if count >= self.minimumRequests and \
+                    self._failures >= self.failureRate * count:
+                log.warn('Circuit breaker opened after %d failures in %d requests',
+                         self._failures, count)
+                self._open(now)
+
+    def state(self):
+        """ Return CLOSED, OPEN or HALF_OPEN """
+        with self._lock:
+            if self._state == OPEN and time.time() - self._openedAt >= self.openTimeout:
+                return HALF_OPEN
+            return self._state
+
+    def stats(self):
+        """ Return the state and counters of this breaker, for monitoring """
+        state = self.state()
+        with self._lock:
+            self._expire(time.time())
+            return {
+                'state': state,
+                'requests': len(self._outcomes),
+                'failures': self._failures,
+                'rejected': self.rejected,
+            }
+
+
+_breakers = {}
+# The settings each breaker was asked for, by baseUrl
+_breakerSettings = {}
+_breakersLock = threading.Lock()
+
+
+def getBreaker(baseUrl, **settings):
+    """ Return the circuit breaker for baseUrl, creating it with the given
+    settings if there is none yet.  There is a single breaker per service,
+    so asking for it with other settings raises TaskclusterFailure """
+    with _breakersLock:
+        breaker = _breakers.get(baseUrl)
+        if breaker is None:
+            breaker = _breakers[baseUrl] = CircuitBreaker(**settings)
+            _breakerSettings[baseUrl] = settings
+        elif (settings != _breakerSettings[baseUrl] and
+                CircuitBreaker(**settings).settings() != breaker.settings()):
+            raise exceptions.TaskclusterFailure(
+                'The circuit breaker for %s already uses other settings: %r'
+                % (baseUrl, breaker.settings()))
+        return breaker
+
+
+def getBreakerForOptions(options):
+    """ Return the circuit breaker a client with these options uses, or None """
+    settings = options.get('circuitBreaker')
+    if not settings or not options.get('baseUrl'):
+        return None
+    if settings is True:
+        settings = {}
+    return getBreaker(options['baseUrl'], **settings)
+
+
+def states():
+    """ Return the stats() of every breaker, keyed by baseUrl """
+    with _breakersLock:
+        breakers = list(_breakers.items())
+    return dict((baseUrl, breaker.stats()) for baseUrl, breaker in breakers)
+
+
+def reset():
+    """ Forget all circuit breakers """
+    with _breakersLock:
+        _breakers.clear()
+        _breakerSettings.clear()
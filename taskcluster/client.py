@@ -8,6 +8,9 @@ import hashlib
 import hmac
 import datetime
 import calendar
+import importlib
+import sys
+
 import six
 
 from taskcluster.baseclient import API_CONFIG, config
@@ -91,10 +94,20 @@ def createTemporaryCredentials(clientId, accessToken, start, expiry, scopes, nam
     }
 
 __all__ = ['createTemporaryCredentials', 'config', 'RuntimeClient', 'createApiClient']
-# This has to be done after the Client class is declared
-for key, value in API_CONFIG.items():
-    # import buildtime generated code
-    module = __import__('taskcluster.sync.{key}'.format(key=key), globals(),
-                        locals(), [key], 0)
-    globals()[key] = getattr(module, key)
-    __all__.append(key)
+# The service classes are generated code, in taskcluster.sync, and are only
+# imported when first used
+services = sorted(API_CONFIG)
+__all__.extend(services)
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in services:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+        value = globals()[name] = getattr(importlib.import_module('taskcluster.sync'), name)
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    for key in services:
+        globals()[key] = getattr(importlib.import_module('taskcluster.sync'), key)
@@ -34,3 +34,17 @@ class TaskclusterAuthFailure(TaskclusterFailure):
 class TaskclusterTopicExchangeFailure(TaskclusterFailure):
     """ Error while creating a Topic Exchange routing key """
     pass
+
+
+class TaskclusterCircuitOpen(TaskclusterConnectionError):
+    """ Request not made because the service's circuit breaker is open """
+    def __init__(self, msg, baseUrl=None):
+        TaskclusterConnectionError.__init__(self, msg, None)
+        self.baseUrl = baseUrl
+
+
+class TaskclusterDeadlineExceeded(TaskclusterFailure):
+    """ The call did not succeed before its deadline """
+    def __init__(self, msg, superExc=None):
+        TaskclusterFailure.__init__(self, msg)
+        self.superExc = superExc
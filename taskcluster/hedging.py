@@ -0,0 +1,234 @@
+"""Hedged requests
+
+A hedged call makes its request and, if no response arrived after a delay,
+makes a second identical request and uses whichever response comes first.
+This cuts the latency added by the occasional slow backend, at the price of a
+few extra requests.  The delay is either fixed or a percentile of the
+latencies observed so far, and the fraction of calls which are hedged is
+capped.  The asyncio clients cancel the slower of the two requests, the
+synchronous clients let it finish and discard its response.
+
+Only idempotent GET calls are hedged.  A client hedges when its
+'hedgeRequests' option is True or a dict of Hedger settings, with one Hedger
+per baseUrl and method name shared by all clients in this process.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import collections
+import logging
+import threading
+import time
+from concurrent import futures
+
+import taskcluster.exceptions as exceptions
+
+log = logging.getLogger(__name__)
+
+
+class Hedger(object):
+    """ Hedge calls of one API method
+
+    delay: seconds to wait before hedging, or None to use the percentile of
+        recent latencies
+    percentile: latency percentile used when delay is None
+    minSamples: do not hedge before this many latencies were observed, when
+        delay is None
+    maxHedgeRate: at most this fraction of calls is hedged
+    maxWorkers: size of the thread pool running the hedges
+    """
+
+    def __init__(self, delay=None, percentile=0.95, minSamples=20, maxHedgeRate=0.1,
+                 maxWorkers=16, window=200):
+        self.delay = delay
+        self.percentile = percentile
+        self.minSamples = minSamples
+        self.maxHedgeRate = maxHedgeRate
+        self.maxWorkers = maxWorkers
+        self.window = window
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=window)
+        self._percentileDelay = None
+        self._executor = None
+        self.calls = 0
+        self.hedges = 0
+        self.hedgeWins = 0
+
+    def settings(self):
+        """ Return the settings this hedger was created with """
+        return {
+            'delay': self.delay,
+            'percentile': self.percentile,
+            'minSamples': self.minSamples,
+            'maxHedgeRate': self.maxHedgeRate,
+            'maxWorkers': self.maxWorkers,
+            'window': self.window,
+        }
+
+    def hedgeDelay(self):
+        """ Return how long to wait before hedging, or None if we cannot
+        tell yet """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.minSamples:
+                return None
+            if self._percentileDelay is None:
+                latencies = sorted(self._latencies)
+                index = min(len(latencies) - 1, int(len(latencies) * self.percentile))
+                self._percentileDelay = latencies[index]
+            return self._percentileDelay
+
+    def record(self, latency, hedgeWon=False):
+        """ Record the latency of a call, and whether its hedge won """
+        with self._lock:
+            self._latencies.append(latency)
+            self._percentileDelay = None
+            if hedgeWon:
+                self.hedgeWins += 1
+
+    def start(self):
+        """ Count a call and return its hedge delay, or None if it must not
+        be hedged """
+        with self._lock:
+            self.calls += 1
+        return self.hedgeDelay()
+
+    def canHedge(self):
+        """ Return True if the hedge rate allows one more hedge, without
+        counting it """
+        with self._lock:
+            return self.hedges + 1 <= self.maxHedgeRate * self.calls
+
+    def allowHedge(self):
+        """ Return True, and count a hedge, if the hedge rate allows one more """
+        with self._lock:
+            if self.hedges + 1 > self.maxHedgeRate * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def _getExecutor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(max_workers=self.maxWorkers)
+            return self._executor
+
+    def call(self, fn):
+        """ Return fn(), hedging it if it takes too long
+
+        Calls which cannot be hedged run on the calling thread.  Otherwise
+        the request runs on a thread of its own, so that the caller can
+        return as soon as either it or the hedge responds, and only the hedge
+        waits for a worker of the shared pool.
+        """
+        delay = self.start()
+        start = time.time()
+        if delay is None or not self.canHedge():
+            result = fn()
+            self.record(time.time() - start)
+            return result
+
+        primary = _runInThread(fn)
+        done, _ = futures.wait([primary], timeout=delay)
+        if done or not self.allowHedge():
+            result = primary.result()
+            self.record(time.time() - start)
+            return result
+
+        log.debug('No response after %.3fs, hedging', delay)
+        hedge = self._getExecutor().submit(fn)
+        pending = set([primary, hedge])
+        error = None
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for f in done:
+                if f.exception() is None:
+                    for other in pending:
+                        # The other request keeps running if it already
+                        # started, its result is discarded
+                        other.cancel()
+                    self.record(time.time() - start, hedgeWon=f is hedge)
+                    return f.result()
+                error = error or f.exception()
+        raise error
+
+    def stats(self):
+        """ Return the hedging counters, for monitoring """
+        delay = self.hedgeDelay()
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'hedges': self.hedges,
+                'hedgeWins': self.hedgeWins,
+                'delay': delay,
+            }
+
+
+def _runInThread(fn):
+    """ Return a Future of fn(), called on a new daemon thread """
+    future = futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    return future
+
+
+_hedgers = {}
+# The settings each hedger was asked for, by (baseUrl, methodName)
+_hedgerSettings = {}
+_hedgersLock = threading.Lock()
+
+
+def getHedger(baseUrl, methodName, **settings):
+    """ Return the hedger for methodName of the service at baseUrl, creating
+    it with the given settings if there is none yet.  Asking for it with
+    other settings raises TaskclusterFailure """
+    key = (baseUrl, methodName)
+    with _hedgersLock:
+        hedger = _hedgers.get(key)
+        if hedger is None:
+            hedger = _hedgers[key] = Hedger(**settings)
+            _hedgerSettings[key] = settings
+        elif (settings != _hedgerSettings[key] and
+                Hedger(**settings).settings() != hedger.settings()):
+            raise exceptions.TaskclusterFailure(
+                'The hedger for %s of %s already uses other settings: %r'
+                % (methodName, baseUrl, hedger.settings()))
+        return hedger
+
+
+def getHedgerForCall(options, method, methodName):
+    """ Return the hedger for a call by a client with these options, or None
+    if the call must not be hedged """
+    settings = options.get('hedgeRequests')
+    if not settings or method.upper() != 'GET' or not options.get('baseUrl'):
+        return None
+    if settings is True:
+        settings = {}
+    return getHedger(options['baseUrl'], methodName, **settings)
+
+
+def states():
+    """ Return the stats() of every hedger, keyed by (baseUrl, methodName) """
+    with _hedgersLock:
+        hedgers = list(_hedgers.items())
+    return dict((key, hedger.stats()) for key, hedger in hedgers)
+
+
+def reset():
+    """ Forget all hedgers """
+    with _hedgersLock:
+        _hedgers.clear()
+        _hedgerSettings.clear()
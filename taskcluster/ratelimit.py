@@ -0,0 +1,259 @@
+"""Client side rate limiting
+
+Token buckets pace the requests made to a service, so that bulk jobs do not
+get throttled by it.  Buckets are shared by all clients in this process with
+the same baseUrl (and method name, for per-method limits) and settings.
+
+A client is rate limited when its 'rateLimit' option is set, to a number of
+requests per second or a dict with 'rate' and 'burst' keys.  The
+'methodRateLimits' option is a dict of method name to such a limit, which
+applies to calls of that method in addition to 'rateLimit'.
+
+AdaptiveLimiter limits the number of requests in flight to a service instead,
+adjusting the limit to how the service copes: it grows while requests
+succeed and is cut down when they fail or get slow.  Clients use one when
+their 'adaptiveConcurrency' option is True or a dict of AdaptiveLimiter
+settings.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import time
+
+import taskcluster.exceptions as exceptions
+
+
+class TokenBucket(object):
+    """ A thread safe token bucket allowing rate requests per second on
+    average and bursts of up to burst requests """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.time()
+
+    def _refill(self, now):
+        elapsed = max(0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """ Take tokens from the bucket and return the number of seconds the
+        caller must wait before making its request.  The tokens are reserved
+        even if the bucket is empty, so callers are served in order """
+        with self._lock:
+            self._refill(time.time())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """ Wait until tokens are available and take them """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def available(self):
+        """ Return the number of tokens currently in the bucket """
+        with self._lock:
+            self._refill(time.time())
+            return self._tokens
+
+
+_buckets = {}
+_bucketsLock = threading.Lock()
+
+
+def _parseLimit(limit):
+    """ Return (rate, burst) for a rate limit option value """
+    if isinstance(limit, dict):
+        return limit['rate'], limit.get('burst')
+    return limit, None
+
+
+def getBucket(baseUrl, rate, burst=None, methodName=None):
+    """ Return the shared bucket for baseUrl (and methodName, if given) with
+    these settings """
+    key = (baseUrl, methodName, rate, burst)
+    with _bucketsLock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+def getBucketsForOptions(options, methodName=None):
+    """ Return the buckets a call of methodName by a client with these
+    options must take a token from """
+    baseUrl = options.get('baseUrl')
+    buckets = []
+    if options.get('rateLimit'):
+        rate, burst = _parseLimit(options['rateLimit'])
+        buckets.append(getBucket(baseUrl, rate, burst))
+    methodLimits = options.get('methodRateLimits')
+    if methodName and methodLimits and methodLimits.get(methodName):
+        rate, burst = _parseLimit(methodLimits[methodName])
+        buckets.append(getBucket(baseUrl, rate, burst, methodName))
+    return buckets
+
+
+def reserve(buckets):
+    """ Reserve a token from each of buckets and return how long to wait """
+    delay = 0
+    for bucket in buckets:
+        delay = max(delay, bucket.reserve())
+    return delay
+
+
+class AdaptiveLimiter(object):
+    """ A concurrency limit adjusted by additive increase / multiplicative
+    decrease (AIMD)
+
+    While requests succeed and the limit is reached, the limit grows by
+    increase for every limit requests.  A failed request, or one slower than
+    latencyThreshold seconds, multiplies the limit by decreaseFactor, at most
+    once for all requests which were in flight at that time.
+    """
+
+    def __init__(self, initialLimit=10, minLimit=1, maxLimit=100, increase=1.0,
+                 decreaseFactor=0.5, latencyThreshold=None):
+        self.initialLimit = initialLimit
+        self.minLimit = minLimit
+        self.maxLimit = maxLimit
+        self.increase = increase
+        self.decreaseFactor = decreaseFactor
+        self.latencyThreshold = latencyThreshold
+        self._limit = float(initialLimit)
+        self._cond = threading.Condition()
+        self._lastDecrease = None
+        self.inFlight = 0
+        self.successes = 0
+        self.failures = 0
+        self.decreases = 0
+
+    def settings(self):
+        """ Return the settings this limiter was created with """
+        return {
+            'initialLimit': self.initialLimit,
+            'minLimit': self.minLimit,
+            'maxLimit': self.maxLimit,
+            'increase': self.increase,
+            'decreaseFactor': self.decreaseFactor,
+            'latencyThreshold': self.latencyThreshold,
+        }
+
+    @property
+    def limit(self):
+        """ The number of requests currently allowed in flight """
+        return max(self.minLimit, int(self._limit))
+
+    def tryAcquire(self):
+        """ Start a request if the limit allows it, returning a token to pass
+        to release(), otherwise return None """
+        with self._cond:
+            if self.inFlight >= self.limit:
+                return None
+            self.inFlight += 1
+            return time.time()
+
+    def acquire(self, timeout=None):
+        """ Wait until the limit allows a request and start it, returning a
+        token to pass to release().  Raise TaskclusterDeadlineExceeded if
+        that takes more than timeout seconds """
+        expires = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while self.inFlight >= self.limit:
+                remaining = None if expires is None else expires - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise exceptions.TaskclusterDeadlineExceeded(
+                        'Deadline exceeded waiting for the concurrency limit')
+                self._cond.wait(remaining)
+            self.inFlight += 1
+            return time.time()
+
+    def release(self, token, success):
+        """ Finish the request started with token, which failed unless
+        success is True, and adjust the limit """
+        now = time.time()
+        with self._cond:
+            saturated = self.inFlight >= self.limit
+            self.inFlight -= 1
+            slow = self.latencyThreshold is not None and now - token > self.latencyThreshold
+            if success and not slow:
+                self.successes += 1
+                if saturated:
+                    self._limit = min(self.maxLimit, self._limit + self.increase / self._limit)
+            else:
+                self.failures += 1
+                if self._lastDecrease is None or token > self._lastDecrease:
+                    self._limit = max(self.minLimit, self._limit * self.decreaseFactor)
+                    self._lastDecrease = now
+                    self.decreases += 1
+            self._cond.notify_all()
+
+    def stats(self):
+        """ Return the current limit and counters, for monitoring """
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'inFlight': self.inFlight,
+                'successes': self.successes,
+                'failures': self.failures,
+                'decreases': self.decreases,
+            }
+
+
+_limiters = {}
+# The settings each limiter was asked for, by baseUrl
+_limiterSettings = {}
+_limitersLock = threading.Lock()
+
+
+def getLimiter(baseUrl, **settings):
+    """ Return the adaptive limiter for baseUrl, creating it with the given
+    settings if there is none yet.  There is a single limiter per service,
+    so asking for it with other settings raises TaskclusterFailure """
+    with _limitersLock:
+        limiter = _limiters.get(baseUrl)
+        if limiter is None:
+            limiter = _limiters[baseUrl] = AdaptiveLimiter(**settings)
+            _limiterSettings[baseUrl] = settings
+        elif (settings != _limiterSettings[baseUrl] and
+                AdaptiveLimiter(**settings).settings() != limiter.settings()):
+            raise exceptions.TaskclusterFailure(
+                'The adaptive concurrency limiter for %s already uses other settings: %r'
+                % (baseUrl, limiter.settings()))
+        return limiter
+
+
+def getLimiterForOptions(options):
+    """ Return the adaptive limiter a client with these options uses, or None """
+    settings = options.get('adaptiveConcurrency')
+    if not settings or not options.get('baseUrl'):
+        return None
+    if settings is True:
+        settings = {}
+    return getLimiter(options['baseUrl'], **settings)
+
+
+def limits():
+    """ Return the stats() of every adaptive limiter, keyed by baseUrl """
+    with _limitersLock:
+        limiters = list(_limiters.items())
+    return dict((baseUrl, limiter.stats()) for baseUrl, limiter in limiters)
+
+
+def reset():
+    """ Forget all buckets and adaptive limiters """
+    with _bucketsLock:
+        _buckets.clear()
+    with _limitersLock:
+        _limiters.clear()
+        _limiterSettings.clear()
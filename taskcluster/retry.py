@@ -0,0 +1,169 @@
+"""Retry policies for failed HTTP requests
+
+A retry policy decides whether a failed attempt is retried and how long to wait
+before doing so.  The same policies are used by BaseClient._makeHttpRequest,
+the asyncio clients and utils.makeHttpRequest.  Pass one as the 'retryPolicy'
+client option, otherwise ExponentialBackoff with the 'maxRetries' option is
+used.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import email.utils
+import math
+import random
+import time
+
+DELAY_FACTOR = 0.1
+RANDOMIZATION_FACTOR = 0.25
+MAX_DELAY = 30
+
+
+def isRetryableStatus(status):
+    """ By default we retry when the service asks us to slow down and on
+    server errors which are likely to be transient """
+    return status == 429 or (500 <= status < 600 and status not in (501, 505))
+
+
+def parseRetryAfter(value, now=None):
+    """ Return the number of seconds a Retry-After header value asks us to
+    wait, or None if it cannot be parsed.  The value is either a number of
+    seconds or an HTTP date """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+    if now is None:
+        now = time.time()
+    return max(0, email.utils.mktime_tz(parsed) - now)
+
+
+def exponentialDelay(attempts, delayFactor=DELAY_FACTOR,
+                     randomizationFactor=RANDOMIZATION_FACTOR, maxDelay=MAX_DELAY):
+    """ From the go client
+    https://github.com/taskcluster/go-got/blob/031f55c/backoff.go#L24-L29
+    """
+    if attempts <= 0:
+        return 0
+
+    # We subtract one to get exponents: 1, 2, 3, 4, 5, ..
+    delay = math.pow(float(2), float(attempts - 1)) * float(delayFactor)
+    # Apply randomization factor
+    delay = delay * (randomizationFactor * (random.random() * 2 - 1) + 1)
+    # Always limit with a maximum delay
+    return min(delay, maxDelay)
+
+
+class RetryPolicy(object):
+    """ Base class for retry policies.  Subclasses implement delay().
+
+    maxRetries: number of retries after the first attempt
+    maxElapsed: give up rather than retry if the retry would start more than
+        this many seconds after the first attempt (None for no limit)
+    maxDelay: longest delay between two attempts, unless the service asks
+        for a longer one with Retry-After
+    retryStatuses: HTTP status codes which are retried, by default those
+        accepted by isRetryableStatus().  Connection errors are always retried
+    honorRetryAfter: wait at least as long as a Retry-After header says
+    """
+
+    def __init__(self, maxRetries=5, maxElapsed=None, maxDelay=MAX_DELAY,
+                 retryStatuses=None, honorRetryAfter=True):
+        self.maxRetries = maxRetries
+        self.maxElapsed = maxElapsed
+        self.maxDelay = maxDelay
+        self.retryStatuses = None if retryStatuses is None else frozenset(retryStatuses)
+        self.honorRetryAfter = honorRetryAfter
+
+    def isRetryable(self, status=None, error=None):
+        if error is not None:
+            return True
+        if self.retryStatuses is None:
+            return isRetryableStatus(status)
+        return status in self.retryStatuses
+
+    def delay(self, retry, previousDelay):
+        """ Return the number of seconds to wait before retry number retry
+        (starting at 1).  previousDelay is the delay used before the previous
+        retry, or None """
+        raise NotImplementedError
+
+    def begin(self):
+        """ Start tracking the attempts of one request """
+        return RetryState(self)
+
+
+class ExponentialBackoff(RetryPolicy):
+    """ Exponentially growing delays, randomized by +/- randomizationFactor.
+    This is the default policy """
+
+    def __init__(self, delayFactor=DELAY_FACTOR, randomizationFactor=RANDOMIZATION_FACTOR,
+                 **kwargs):
+        super(ExponentialBackoff, self).__init__(**kwargs)
+        self.delayFactor = delayFactor
+        self.randomizationFactor = randomizationFactor
+
+    def delay(self, retry, previousDelay):
+        return exponentialDelay(retry, self.delayFactor, self.randomizationFactor,
+                                self.maxDelay)
+
+
+class DecorrelatedJitter(RetryPolicy):
+    """ Delays drawn at random between baseDelay and three times the previous
+    delay.  This spreads out the retries of many clients which failed at the
+    same moment, instead of having them retry in lockstep.  See
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+
+    def __init__(self, baseDelay=DELAY_FACTOR, **kwargs):
+        super(DecorrelatedJitter, self).__init__(**kwargs)
+        self.baseDelay = baseDelay
+
+    def delay(self, retry, previousDelay):
+        previousDelay = previousDelay or self.baseDelay
+        return min(self.maxDelay, random.uniform(self.baseDelay, previousDelay * 3))
+
+
+class FixedDelay(RetryPolicy):
+    """ The same delay before every retry """
+
+    def __init__(self, delay=1, **kwargs):
+        super(FixedDelay, self).__init__(**kwargs)
+        self.fixedDelay = delay
+
+    def delay(self, retry, previousDelay):
+        return min(self.fixedDelay, self.maxDelay)
+
+
+class RetryState(object):
+    """ The retries of a single request """
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.retries = 0
+        self.start = time.time()
+        self.lastDelay = None
+
+    def nextDelay(self, status=None, error=None, retryAfter=None):
+        """ Given a failed attempt, which either got an HTTP status or raised
+        error, return how many seconds to wait before retrying or None if the
+        request should not be retried.  retryAfter is the value of the
+        Retry-After response header, if any """
+        policy = self.policy
+        if self.retries >= policy.maxRetries or not policy.isRetryable(status, error):
+            return None
+        self.retries += 1
+        delay = policy.delay(self.retries, self.lastDelay)
+        if policy.honorRetryAfter:
+            requested = parseRetryAfter(retryAfter)
+            if requested is not None:
+                delay = max(delay, requested)
+        if policy.maxElapsed is not None and \
+                time.time() - self.start + delay > policy.maxElapsed:
+            return None
+        self.lastDelay = delay
+        return delay
@@ -10,8 +10,9 @@ import datetime
 import calendar
 import six
 
-from taskcluster.baseclient import BaseClient, config
+from taskcluster.baseclient import BaseClient, CALL_OPTIONS, config, routeTemplate
 import taskcluster.exceptions as exceptions
+import taskcluster.tracing as tracing
 import taskcluster.utils as utils
 
 log = logging.getLogger(__name__)
@@ -21,92 +22,129 @@ _defaultConfig = copy.deepcopy(config)
 ROUTING_KEY_BLACKLIST = ("summary", )
 
 
-class RuntimeClient(BaseClient):
+# The types API arguments can have, they are all rendered to strings
+_argumentTypes = six.string_types + (int,)
 
-    def _makeApiCall(self, entry, *args, **kwargs):
-        """ This function is used to dispatch calls to other functions
-        for a given API Reference entry"""
 
-        payload = None
-        _args = list(args)
-        _kwargs = copy.deepcopy(kwargs)
+class RequestPlan(object):
+    """ How to call one API method, worked out once from its reference entry:
+    the names of its arguments, whether it takes a payload, the query options
+    it accepts and its route template """
 
-        if 'input' in entry:
-            if len(args) > 0:
-                payload = _args.pop()
-            else:
-                raise exceptions.TaskclusterFailure('Payload is required as last positional arg')
-        apiArgs = self._processArgs(entry, *_args, **_kwargs)
-        route = self._subArgsInRoute(entry, apiArgs)
-        log.debug('Route is: %s', route)
+    __slots__ = ('entry', 'name', 'method', 'args', 'argNames', 'hasInput', 'query', 'route')
 
-        return self._makeHttpRequest(entry['method'], route, payload)
+    def __init__(self, entry):
+        self.entry = entry
+        self.name = entry['name']
+        self.method = entry.get('method')
+        self.args = tuple(entry.get('args') or ())
+        self.argNames = frozenset(self.args)
+        self.hasInput = 'input' in entry
+        self.query = frozenset(entry.get('query') or ()) or None
+        self.route = routeTemplate(entry['route']) if 'route' in entry else None
 
-    def _processArgs(self, entry, *args, **kwargs):
-        """ Take the list of required arguments, positional arguments
-        and keyword arguments and return a dictionary which maps the
-        value of the given arguments to the required parameters.
+    def bindArgs(self, args, kwargs):
+        """ Return a dictionary mapping the name of each argument of the API
+        method to its value, given either as positional arguments or as
+        keyword arguments """
+        for arg in args:
+            if not isinstance(arg, _argumentTypes):
+                self._badArgument(arg)
+        if not kwargs:
+            if len(args) == len(self.args):
+                return dict(zip(self.args, args))
+        else:
+            for arg in six.itervalues(kwargs):
+                if not isinstance(arg, _argumentTypes):
+                    self._badArgument(arg)
+            if not args and len(kwargs) == len(self.args) and self.argNames.issuperset(kwargs):
+                return dict(kwargs)
+            if args:
+                raise exceptions.TaskclusterFailure(
+                    'Specify either positional or key word arguments')
 
-        Keyword arguments will overwrite positional arguments.
-        """
+        # We know for sure that if we don't give enough arguments that the call
+        # should fail
+        given = len(args) + len(kwargs)
+        if len(self.args) > given:
+            raise exceptions.TaskclusterFailure(
+                '%s takes %d args, only %d were given' % (self.name, len(self.args), given))
+        if len(args) > len(self.args):
+            raise exceptions.TaskclusterFailure(
+                '%s called with too many positional args' % self.name)
+        errMsg = '%s takes %s args, %s given' % (
+            self.name, ','.join(self.args), list(kwargs))
+        log.error(errMsg)
+        raise exceptions.TaskclusterFailure(errMsg)
 
-        reqArgs = entry['args']
-        data = {}
+    def _badArgument(self, arg):
+        raise exceptions.TaskclusterFailure(
+            'Arguments "%s" to %s is not a string or int' % (arg, self.name))
 
-        # These all need to be rendered down to a string, let's just check that
-        # they are up front and fail fast
-        for arg in list(args) + [kwargs[x] for x in kwargs]:
-            if not isinstance(arg, six.string_types) and not isinstance(arg, int):
-                raise exceptions.TaskclusterFailure(
-                    'Arguments "%s" to %s is not a string or int' % (arg, entry['name']))
 
-        if len(args) > 0 and len(kwargs) > 0:
-            raise exceptions.TaskclusterFailure('Specify either positional or key word arguments')
+def compilePlans(api):
+    """ Return the RequestPlan of each API method of the reference api, by
+    method name """
+    return dict((entry['name'], RequestPlan(entry))
+                for entry in api['entries'] if entry['type'] == 'function')
 
-        # We know for sure that if we don't give enough arguments that the call
-        # should fail.  We don't yet know if we should fail because of two many
-        # arguments because we might be overwriting positional ones with kw ones
-        if len(reqArgs) > len(args) + len(kwargs):
-            raise exceptions.TaskclusterFailure(
-                '%s takes %d args, only %d were given' % (
-                    entry['name'], len(reqArgs), len(args) + len(kwargs)))
-
-        # We also need to error out when we have more positional args than required
-        # because we'll need to go through the lists of provided and required args
-        # at the same time.  Not disqualifying early means we'll get IndexErrors if
-        # there are more positional arguments than required
-        if len(args) > len(reqArgs):
-            raise exceptions.TaskclusterFailure('%s called with too many positional args',
-                                                entry['name'])
-
-        i = 0
-        for arg in args:
-            log.debug('Found a positional argument: %s', arg)
-            data[reqArgs[i]] = arg
-            i += 1
 
-        log.debug('After processing positional arguments, we have: %s', data)
+class RuntimeClient(BaseClient):
 
-        data.update(kwargs)
+    # The RequestPlan of each API method, by name, set by createApiClient
+    _plans = None
 
-        log.debug('After keyword arguments, we have: %s', data)
+    def _planFor(self, methodName):
+        """ Return the RequestPlan of the API method methodName, or None """
+        cls = type(self)
+        plans = cls.__dict__.get('_plans')
+        if plans is None:
+            plans = cls._plans = compilePlans(self._api)
+        return plans.get(methodName)
 
-        if len(reqArgs) != len(data):
-            errMsg = '%s takes %s args, %s given' % (
-                entry['name'],
-                ','.join(reqArgs),
-                data.keys())
-            log.error(errMsg)
-            raise exceptions.TaskclusterFailure(errMsg)
+    def _makeApiCall(self, entry, *args, **kwargs):
+        """ This function is used to dispatch calls to other functions
+        for a given API Reference entry"""
+        plan = self._planFor(entry['name'])
+        if plan is None or plan.entry is not entry:
+            plan = RequestPlan(entry)
+        return self._callPlan(plan, args, kwargs)
+
+    def _callPlan(self, plan, args, kwargs):
+        """ Call the API method of plan with the arguments given to its
+        method """
+        payload = None
+        callOptions = {}
+        if kwargs:
+            for k in CALL_OPTIONS:
+                if k in kwargs:
+                    callOptions[k] = kwargs.pop(k)
+            if plan.query and 'options' in kwargs and 'options' not in plan.argNames:
+                query = kwargs.pop('options')
+                if query:
+                    callOptions['options'] = query
+                    callOptions['validOptions'] = plan.query
+
+        if plan.hasInput:
+            if args:
+                payload = args[-1]
+                args = args[:-1]
+            else:
+                raise exceptions.TaskclusterFailure('Payload is required as last positional arg')
+        apiArgs = plan.bindArgs(args, kwargs)
+        tracing.trace(log, 'args', methodName=plan.name, positional=args, keyword=kwargs)
+        route = plan.route.render(apiArgs, plan.name)
+        tracing.trace(log, 'route', methodName=plan.name, route=route)
 
-        for reqArg in reqArgs:
-            if reqArg not in data:
-                errMsg = '%s requires a "%s" argument which was not provided' % (
-                    entry['name'], reqArg)
-                log.error(errMsg)
-                raise exceptions.TaskclusterFailure(errMsg)
+        return self._makeHttpRequest(plan.method, route, payload, methodName=plan.name,
+                                     **callOptions)
 
-        return data
+    def _processArgs(self, entry, *args, **kwargs):
+        """ Take the list of required arguments, positional arguments
+        and keyword arguments and return a dictionary which maps the
+        value of the given arguments to the required parameters.
+        """
+        return RequestPlan(entry).bindArgs(args, kwargs)
 
     def _makeTopicExchange(self, entry, *args, **kwargs):
         if len(args) == 0 and not kwargs:
@@ -126,16 +164,12 @@ class RuntimeClient(BaseClient):
         )
 
     def buildUrl(self, methodName, *args, **kwargs):
-        entry = None
-        for x in self._api['entries']:
-            if x['name'] == methodName:
-                entry = x
-        if not entry:
+        plan = self._planFor(methodName)
+        if plan is None:
             raise exceptions.TaskclusterFailure(
                 'Requested method "%s" not found in API Reference' % methodName)
-        apiArgs = self._processArgs(entry, *args, **kwargs)
-        route = self._subArgsInRoute(entry, apiArgs)
-        return self.makeFullUrl(route)
+        apiArgs = plan.bindArgs(args, kwargs)
+        return self.makeFullUrl(plan.route.render(apiArgs, methodName))
 
     def buildSignedUrl(self, methodName, *args, **kwargs):
         expiration = kwargs.get('expiration')
@@ -155,9 +189,11 @@ class RuntimeClient(BaseClient):
 
 
 def createApiClient(name, api):
+    plans = compilePlans(api['reference'])
     attributes = dict(
         name=name,
         _api=api['reference'],
+        _plans=plans,
         __doc__=api.get('description'),
         classOptions={},
     )
@@ -170,12 +206,12 @@ def createApiClient(name, api):
     for entry in api['reference']['entries']:
         if entry['type'] == 'function':
 
-            def addApiCall(e):
+            def addApiCall(plan):
                 def apiCall(self, *args, **kwargs):
-                    return self._makeApiCall(e, *args, **kwargs)
+                    return self._callPlan(plan, args, kwargs)
                 return apiCall
 
-            f = addApiCall(entry)
+            f = addApiCall(plans[entry['name']])
             docStr = "Call the %s api's %s method.  " % (name, entry['name'])
 
             if entry['args'] and len(entry['args']) > 0:
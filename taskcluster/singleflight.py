@@ -0,0 +1,85 @@
+"""Coalescing of identical concurrent calls
+
+When several threads make the same call at the same time, only the first one
+actually runs it and the others wait for, and share, its outcome.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import copy
+import logging
+import threading
+
+import taskcluster.exceptions as exceptions
+
+log = logging.getLogger(__name__)
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+        self.waiters = 0
+
+
+class Group(object):
+    """ A set of in-flight calls, keyed by an arbitrary hashable key """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None):
+        """ Call fn() and return its result, unless a call with the same key is
+        already in flight, in which case wait for that call and return (a copy
+        of) its result or raise its exception.  Raise
+        TaskclusterDeadlineExceeded if that call takes more than timeout
+        seconds """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            log.debug('Waiting for in-flight call %s', key[:2])
+            if not call.done.wait(timeout):
+                with self._lock:
+                    call.waiters -= 1
+                raise exceptions.TaskclusterDeadlineExceeded(
+                    'Deadline exceeded waiting for an in-flight call')
+            if call.exception is not None:
+                raise call.exception
+            # Callers get their own copy, so that they are free to modify it
+            try:
+                return copy.deepcopy(call.result)
+            except Exception:
+                return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def inFlight(self):
+        """ Return the number of distinct calls currently in flight """
+        with self._lock:
+            return len(self._calls)
+
+
+# The group shared by all clients in this process
+defaultGroup = Group()
+
+
+def do(key, fn, timeout=None):
+    """ Run fn() through the process wide group of in-flight calls """
+    return defaultGroup.do(key, fn, timeout)
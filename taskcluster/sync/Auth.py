@@ -86,12 +86,11 @@ class Auth(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://auth.taskcluster.net/v1'
-        super(Auth, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://auth.taskcluster.net/v1',
+    }
 
-    def listClients(self, options=None):
+    def listClients(self, options=None, **callOptions):
         '''
         List Clients
 
@@ -102,9 +101,11 @@ class Auth(baseclient.BaseClient):
         '''
         route = self.makeRoute('listClients')
         validOptions = ['prefix']
-        return self._makeHttpRequest('get', route, options=options, validOptions=validOptions)
+        return self._makeHttpRequest(
+            'get', route, methodName='listClients',
+            options=options, validOptions=validOptions, **callOptions)
 
-    def client(self, clientId):
+    def client(self, clientId, **callOptions):
         '''
         Get Client
 
@@ -116,9 +117,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('client', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='client', **callOptions)
 
-    def createClient(self, clientId, payload):
+    def createClient(self, clientId, payload, **callOptions):
         '''
         Create Client
 
@@ -141,9 +143,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('createClient', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createClient', **callOptions)
 
-    def resetAccessToken(self, clientId):
+    def resetAccessToken(self, clientId, **callOptions):
         '''
         Reset `accessToken`
 
@@ -160,9 +163,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('resetAccessToken', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='resetAccessToken', **callOptions)
 
-    def updateClient(self, clientId, payload):
+    def updateClient(self, clientId, payload, **callOptions):
         '''
         Update Client
 
@@ -178,9 +182,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('updateClient', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='updateClient', **callOptions)
 
-    def enableClient(self, clientId):
+    def enableClient(self, clientId, **callOptions):
         '''
         Enable Client
 
@@ -196,9 +201,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('enableClient', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='enableClient', **callOptions)
 
-    def disableClient(self, clientId):
+    def disableClient(self, clientId, **callOptions):
         '''
         Disable Client
 
@@ -213,9 +219,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('disableClient', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='disableClient', **callOptions)
 
-    def deleteClient(self, clientId):
+    def deleteClient(self, clientId, **callOptions):
         '''
         Delete Client
 
@@ -228,9 +235,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('deleteClient', replDict={
             'clientId': clientId,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='deleteClient', **callOptions)
 
-    def listRoles(self):
+    def listRoles(self, **callOptions):
         '''
         List Roles
 
@@ -240,9 +248,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('listRoles')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listRoles', **callOptions)
 
-    def role(self, roleId):
+    def role(self, roleId, **callOptions):
         '''
         Get Role
 
@@ -255,9 +264,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('role', replDict={
             'roleId': roleId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='role', **callOptions)
 
-    def createRole(self, roleId, payload):
+    def createRole(self, roleId, payload, **callOptions):
         '''
         Create Role
 
@@ -274,9 +284,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('createRole', replDict={
             'roleId': roleId,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createRole', **callOptions)
 
-    def updateRole(self, roleId, payload):
+    def updateRole(self, roleId, payload, **callOptions):
         '''
         Update Role
 
@@ -291,9 +302,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('updateRole', replDict={
             'roleId': roleId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='updateRole', **callOptions)
 
-    def deleteRole(self, roleId):
+    def deleteRole(self, roleId, **callOptions):
         '''
         Delete Role
 
@@ -306,9 +318,10 @@ class Auth(baseclient.BaseClient):
         route = self.makeRoute('deleteRole', replDict={
             'roleId': roleId,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='deleteRole', **callOptions)
 
-    def expandScopes(self, payload):
+    def expandScopes(self, payload, **callOptions):
         '''
         Expand Scopes
 
@@ -318,9 +331,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('expandScopes')
-        return self._makeHttpRequest('get', route, payload)
+        return self._makeHttpRequest(
+            'get', route, payload, methodName='expandScopes', **callOptions)
 
-    def currentScopes(self):
+    def currentScopes(self, **callOptions):
         '''
         Get Current Scopes
 
@@ -331,9 +345,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('currentScopes')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='currentScopes', **callOptions)
 
-    def awsS3Credentials(self, level, bucket, prefix):
+    def awsS3Credentials(self, level, bucket, prefix, **callOptions):
         '''
         Get Temporary Read/Write Credentials S3
 
@@ -367,9 +382,10 @@ class Auth(baseclient.BaseClient):
             'bucket': bucket,
             'prefix': prefix,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='awsS3Credentials', **callOptions)
 
-    def azureTableSAS(self, account, table):
+    def azureTableSAS(self, account, table, **callOptions):
         '''
         Get Shared-Access-Signature for Azure Table
 
@@ -385,9 +401,10 @@ class Auth(baseclient.BaseClient):
             'account': account,
             'table': table,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='azureTableSAS', **callOptions)
 
-    def authenticateHawk(self, payload):
+    def authenticateHawk(self, payload, **callOptions):
         '''
         Authenticate Hawk Request
 
@@ -401,9 +418,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('authenticateHawk')
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='authenticateHawk', **callOptions)
 
-    def testAuthenticate(self, payload):
+    def testAuthenticate(self, payload, **callOptions):
         '''
         Test Authentication
 
@@ -422,9 +440,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('testAuthenticate')
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='testAuthenticate', **callOptions)
 
-    def testAuthenticateGet(self):
+    def testAuthenticateGet(self, **callOptions):
         '''
         Test Authentication (GET)
 
@@ -447,9 +466,10 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('testAuthenticateGet')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='testAuthenticateGet', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -460,4 +480,5 @@ class Auth(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
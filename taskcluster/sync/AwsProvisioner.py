@@ -63,12 +63,11 @@ class AwsProvisioner(baseclient.BaseClient):
         'apiReference': '/api-reference',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://aws-provisioner.taskcluster.net/v1'
-        super(AwsProvisioner, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://aws-provisioner.taskcluster.net/v1',
+    }
 
-    def createWorkerType(self, workerType, payload):
+    def createWorkerType(self, workerType, payload, **callOptions):
         '''
         Create new Worker Type
 
@@ -102,9 +101,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('createWorkerType', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createWorkerType', **callOptions)
 
-    def updateWorkerType(self, workerType, payload):
+    def updateWorkerType(self, workerType, payload, **callOptions):
         '''
         Update Worker Type
 
@@ -126,9 +126,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('updateWorkerType', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='updateWorkerType', **callOptions)
 
-    def workerType(self, workerType):
+    def workerType(self, workerType, **callOptions):
         '''
         Get Worker Type
 
@@ -144,9 +145,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('workerType', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='workerType', **callOptions)
 
-    def removeWorkerType(self, workerType):
+    def removeWorkerType(self, workerType, **callOptions):
         '''
         Delete Worker Type
 
@@ -167,9 +169,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('removeWorkerType', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='removeWorkerType', **callOptions)
 
-    def listWorkerTypes(self):
+    def listWorkerTypes(self, **callOptions):
         '''
         List Worker Types
 
@@ -181,9 +184,10 @@ class AwsProvisioner(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('listWorkerTypes')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listWorkerTypes', **callOptions)
 
-    def createSecret(self, token, payload):
+    def createSecret(self, token, payload, **callOptions):
         '''
         Create new Secret
 
@@ -200,9 +204,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('createSecret', replDict={
             'token': token,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createSecret', **callOptions)
 
-    def getSecret(self, token):
+    def getSecret(self, token, **callOptions):
         '''
         Get a Secret
 
@@ -220,9 +225,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('getSecret', replDict={
             'token': token,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getSecret', **callOptions)
 
-    def instanceStarted(self, instanceId, token):
+    def instanceStarted(self, instanceId, token, **callOptions):
         '''
         Report an instance starting
 
@@ -240,9 +246,10 @@ class AwsProvisioner(baseclient.BaseClient):
             'instanceId': instanceId,
             'token': token,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='instanceStarted', **callOptions)
 
-    def removeSecret(self, token):
+    def removeSecret(self, token, **callOptions):
         '''
         Remove a Secret
 
@@ -259,9 +266,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('removeSecret', replDict={
             'token': token,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='removeSecret', **callOptions)
 
-    def getLaunchSpecs(self, workerType):
+    def getLaunchSpecs(self, workerType, **callOptions):
         '''
         Get All Launch Specifications for WorkerType
 
@@ -277,9 +285,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('getLaunchSpecs', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getLaunchSpecs', **callOptions)
 
-    def awsState(self):
+    def awsState(self, **callOptions):
         '''
         Get AWS State for all worker types
 
@@ -291,9 +300,10 @@ class AwsProvisioner(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('awsState')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='awsState', **callOptions)
 
-    def state(self, workerType):
+    def state(self, workerType, **callOptions):
         '''
         Get AWS State for a worker type
 
@@ -308,9 +318,10 @@ class AwsProvisioner(baseclient.BaseClient):
         route = self.makeRoute('state', replDict={
             'workerType': workerType,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='state', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -321,9 +332,10 @@ class AwsProvisioner(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
 
-    def backendStatus(self):
+    def backendStatus(self, **callOptions):
         '''
         Backend Status
 
@@ -332,9 +344,10 @@ class AwsProvisioner(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('backendStatus')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='backendStatus', **callOptions)
 
-    def apiReference(self):
+    def apiReference(self, **callOptions):
         '''
         api reference
 
@@ -345,4 +358,5 @@ class AwsProvisioner(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('apiReference')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='apiReference', **callOptions)
@@ -76,10 +76,9 @@ class AwsProvisionerEvents(baseclient.BaseClient):
         ],
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['exchangePrefix'] = 'exchange/taskcluster-aws-provisioner/'
-        super(AwsProvisionerEvents, self).__init__(*args, **kwargs)
+    classOptions = {
+        'exchangePrefix': 'exchange/taskcluster-aws-provisioner/',
+    }
 
     def workerTypeCreated(self, routingKeyPattern=None):
         '''
@@ -29,12 +29,11 @@ class Github(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://github.taskcluster.net/v1'
-        super(Github, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://github.taskcluster.net/v1',
+    }
 
-    def githubWebHookConsumer(self):
+    def githubWebHookConsumer(self, **callOptions):
         '''
         Consume GitHub WebHook
 
@@ -44,9 +43,10 @@ class Github(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('githubWebHookConsumer')
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='githubWebHookConsumer', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -57,4 +57,5 @@ class Github(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
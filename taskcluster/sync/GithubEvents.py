@@ -68,10 +68,9 @@ class GithubEvents(baseclient.BaseClient):
         ],
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['exchangePrefix'] = 'exchange/taskcluster-github/v1/'
-        super(GithubEvents, self).__init__(*args, **kwargs)
+    classOptions = {
+        'exchangePrefix': 'exchange/taskcluster-github/v1/',
+    }
 
     def pullRequest(self, routingKeyPattern=None):
         '''
@@ -43,12 +43,11 @@ class Hooks(baseclient.BaseClient):
         'removeHook': '/hooks/{hookGroupId}/{hookId}',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://hooks.taskcluster.net/v1'
-        super(Hooks, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://hooks.taskcluster.net/v1',
+    }
 
-    def listHookGroups(self):
+    def listHookGroups(self, **callOptions):
         '''
         List hook groups
 
@@ -57,9 +56,10 @@ class Hooks(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('listHookGroups')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listHookGroups', **callOptions)
 
-    def listHooks(self, hookGroupId):
+    def listHooks(self, hookGroupId, **callOptions):
         '''
         List hooks in a given group
 
@@ -72,9 +72,10 @@ class Hooks(baseclient.BaseClient):
         route = self.makeRoute('listHooks', replDict={
             'hookGroupId': hookGroupId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listHooks', **callOptions)
 
-    def hook(self, hookGroupId, hookId):
+    def hook(self, hookGroupId, hookId, **callOptions):
         '''
         Get hook definition
 
@@ -89,9 +90,10 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='hook', **callOptions)
 
-    def getHookStatus(self, hookGroupId, hookId):
+    def getHookStatus(self, hookGroupId, hookId, **callOptions):
         '''
         Get hook status
 
@@ -106,9 +108,10 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getHookStatus', **callOptions)
 
-    def getHookSchedule(self, hookGroupId, hookId):
+    def getHookSchedule(self, hookGroupId, hookId, **callOptions):
         '''
         Get hook schedule
 
@@ -123,9 +126,10 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getHookSchedule', **callOptions)
 
-    def createHook(self, hookGroupId, hookId, payload):
+    def createHook(self, hookGroupId, hookId, payload, **callOptions):
         '''
         Create a hook
 
@@ -143,9 +147,10 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createHook', **callOptions)
 
-    def updateHook(self, hookGroupId, hookId, payload):
+    def updateHook(self, hookGroupId, hookId, payload, **callOptions):
         '''
         Update a hook
 
@@ -160,9 +165,10 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='updateHook', **callOptions)
 
-    def removeHook(self, hookGroupId, hookId):
+    def removeHook(self, hookGroupId, hookId, **callOptions):
         '''
         Delete a hook
 
@@ -176,4 +182,5 @@ class Hooks(baseclient.BaseClient):
             'hookGroupId': hookGroupId,
             'hookId': hookId,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='removeHook', **callOptions)
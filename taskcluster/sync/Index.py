@@ -116,12 +116,11 @@ class Index(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://index.taskcluster.net/v1'
-        super(Index, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://index.taskcluster.net/v1',
+    }
 
-    def findTask(self, namespace):
+    def findTask(self, namespace, **callOptions):
         '''
         Find Indexed Task
 
@@ -134,9 +133,10 @@ class Index(baseclient.BaseClient):
         route = self.makeRoute('findTask', replDict={
             'namespace': namespace,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='findTask', **callOptions)
 
-    def listNamespaces(self, namespace, payload):
+    def listNamespaces(self, namespace, payload, **callOptions):
         '''
         List Namespaces
 
@@ -155,9 +155,10 @@ class Index(baseclient.BaseClient):
         route = self.makeRoute('listNamespaces', replDict={
             'namespace': namespace,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='listNamespaces', **callOptions)
 
-    def listTasks(self, namespace, payload):
+    def listTasks(self, namespace, payload, **callOptions):
         '''
         List Tasks
 
@@ -176,9 +177,10 @@ class Index(baseclient.BaseClient):
         route = self.makeRoute('listTasks', replDict={
             'namespace': namespace,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='listTasks', **callOptions)
 
-    def insertTask(self, namespace, payload):
+    def insertTask(self, namespace, payload, **callOptions):
         '''
         Insert Task into Index
 
@@ -191,9 +193,10 @@ class Index(baseclient.BaseClient):
         route = self.makeRoute('insertTask', replDict={
             'namespace': namespace,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='insertTask', **callOptions)
 
-    def findArtifactFromTask(self, namespace, name):
+    def findArtifactFromTask(self, namespace, name, **callOptions):
         '''
         Get Artifact From Indexed Task
 
@@ -209,9 +212,10 @@ class Index(baseclient.BaseClient):
             'namespace': namespace,
             'name': name,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='findArtifactFromTask', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -222,4 +226,5 @@ class Index(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
@@ -29,12 +29,11 @@ class PurgeCache(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://purge-cache.taskcluster.net/v1'
-        super(PurgeCache, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://purge-cache.taskcluster.net/v1',
+    }
 
-    def purgeCache(self, provisionerId, workerType, payload):
+    def purgeCache(self, provisionerId, workerType, payload, **callOptions):
         '''
         Purge Worker Cache
 
@@ -50,9 +49,10 @@ class PurgeCache(baseclient.BaseClient):
             'provisionerId': provisionerId,
             'workerType': workerType,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='purgeCache', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -63,4 +63,5 @@ class PurgeCache(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
@@ -45,10 +45,9 @@ class PurgeCacheEvents(baseclient.BaseClient):
         ],
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['exchangePrefix'] = 'exchange/taskcluster-purge-cache/v1/'
-        super(PurgeCacheEvents, self).__init__(*args, **kwargs)
+    classOptions = {
+        'exchangePrefix': 'exchange/taskcluster-purge-cache/v1/',
+    }
 
     def purgeCache(self, routingKeyPattern=None):
         '''
@@ -51,12 +51,11 @@ class Queue(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://queue.taskcluster.net/v1'
-        super(Queue, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://queue.taskcluster.net/v1',
+    }
 
-    def task(self, taskId):
+    def task(self, taskId, **callOptions):
         '''
         Get Task Definition
 
@@ -70,9 +69,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('task', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='task', **callOptions)
 
-    def status(self, taskId):
+    def status(self, taskId, **callOptions):
         '''
         Get task status
 
@@ -84,9 +84,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('status', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='status', **callOptions)
 
-    def listTaskGroup(self, taskGroupId, options=None):
+    def listTaskGroup(self, taskGroupId, options=None, **callOptions):
         '''
         List Task Group
 
@@ -114,9 +115,11 @@ class Queue(baseclient.BaseClient):
             'taskGroupId': taskGroupId,
         })
         validOptions = ['continuationToken', 'limit']
-        return self._makeHttpRequest('get', route, options=options, validOptions=validOptions)
+        return self._makeHttpRequest(
+            'get', route, methodName='listTaskGroup',
+            options=options, validOptions=validOptions, **callOptions)
 
-    def createTask(self, taskId, payload):
+    def createTask(self, taskId, payload, **callOptions):
         '''
         Create New Task
 
@@ -147,9 +150,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('createTask', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createTask', **callOptions)
 
-    def defineTask(self, taskId, payload):
+    def defineTask(self, taskId, payload, **callOptions):
         '''
         Define Task
 
@@ -177,9 +181,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('defineTask', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='defineTask', **callOptions)
 
-    def scheduleTask(self, taskId):
+    def scheduleTask(self, taskId, **callOptions):
         '''
         Schedule Defined Task
 
@@ -198,9 +203,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('scheduleTask', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='scheduleTask', **callOptions)
 
-    def rerunTask(self, taskId):
+    def rerunTask(self, taskId, **callOptions):
         '''
         Rerun a Resolved Task
 
@@ -223,9 +229,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('rerunTask', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='rerunTask', **callOptions)
 
-    def cancelTask(self, taskId):
+    def cancelTask(self, taskId, **callOptions):
         '''
         Cancel Task
 
@@ -248,9 +255,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('cancelTask', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='cancelTask', **callOptions)
 
-    def pollTaskUrls(self, provisionerId, workerType):
+    def pollTaskUrls(self, provisionerId, workerType, **callOptions):
         '''
         Get Urls to Poll Pending Tasks
 
@@ -266,9 +274,10 @@ class Queue(baseclient.BaseClient):
             'provisionerId': provisionerId,
             'workerType': workerType,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='pollTaskUrls', **callOptions)
 
-    def claimTask(self, taskId, runId, payload):
+    def claimTask(self, taskId, runId, payload, **callOptions):
         '''
         Claim task
 
@@ -282,9 +291,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='claimTask', **callOptions)
 
-    def reclaimTask(self, taskId, runId):
+    def reclaimTask(self, taskId, runId, **callOptions):
         '''
         Reclaim task
 
@@ -298,9 +308,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='reclaimTask', **callOptions)
 
-    def reportCompleted(self, taskId, runId):
+    def reportCompleted(self, taskId, runId, **callOptions):
         '''
         Report Run Completed
 
@@ -314,9 +325,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='reportCompleted', **callOptions)
 
-    def reportFailed(self, taskId, runId):
+    def reportFailed(self, taskId, runId, **callOptions):
         '''
         Report Run Failed
 
@@ -336,9 +348,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('post', route)
+        return self._makeHttpRequest(
+            'post', route, methodName='reportFailed', **callOptions)
 
-    def reportException(self, taskId, runId, payload):
+    def reportException(self, taskId, runId, payload, **callOptions):
         '''
         Report Task Exception
 
@@ -363,9 +376,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='reportException', **callOptions)
 
-    def createArtifact(self, taskId, runId, name, payload):
+    def createArtifact(self, taskId, runId, name, payload, **callOptions):
         '''
         Create Artifact
 
@@ -439,9 +453,10 @@ class Queue(baseclient.BaseClient):
             'runId': runId,
             'name': name,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='createArtifact', **callOptions)
 
-    def getArtifact(self, taskId, runId, name):
+    def getArtifact(self, taskId, runId, name, **callOptions):
         '''
         Get Artifact from Run
 
@@ -467,9 +482,10 @@ class Queue(baseclient.BaseClient):
             'runId': runId,
             'name': name,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getArtifact', **callOptions)
 
-    def getLatestArtifact(self, taskId, name):
+    def getLatestArtifact(self, taskId, name, **callOptions):
         '''
         Get Artifact from Latest Run
 
@@ -497,9 +513,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'name': name,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='getLatestArtifact', **callOptions)
 
-    def listArtifacts(self, taskId, runId):
+    def listArtifacts(self, taskId, runId, **callOptions):
         '''
         Get Artifacts from Run
 
@@ -513,9 +530,10 @@ class Queue(baseclient.BaseClient):
             'taskId': taskId,
             'runId': runId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listArtifacts', **callOptions)
 
-    def listLatestArtifacts(self, taskId):
+    def listLatestArtifacts(self, taskId, **callOptions):
         '''
         Get Artifacts from Latest Run
 
@@ -528,9 +546,10 @@ class Queue(baseclient.BaseClient):
         route = self.makeRoute('listLatestArtifacts', replDict={
             'taskId': taskId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='listLatestArtifacts', **callOptions)
 
-    def pendingTasks(self, provisionerId, workerType):
+    def pendingTasks(self, provisionerId, workerType, **callOptions):
         '''
         Get Number of Pending Tasks
 
@@ -550,9 +569,10 @@ class Queue(baseclient.BaseClient):
             'provisionerId': provisionerId,
             'workerType': workerType,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='pendingTasks', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -563,4 +583,5 @@ class Queue(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
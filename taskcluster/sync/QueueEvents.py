@@ -445,10 +445,9 @@ class QueueEvents(baseclient.BaseClient):
         ],
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['exchangePrefix'] = 'exchange/taskcluster-queue/v1/'
-        super(QueueEvents, self).__init__(*args, **kwargs)
+    classOptions = {
+        'exchangePrefix': 'exchange/taskcluster-queue/v1/',
+    }
 
     def taskDefined(self, routingKeyPattern=None):
         '''
@@ -38,12 +38,11 @@ class Scheduler(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://scheduler.taskcluster.net/v1'
-        super(Scheduler, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://scheduler.taskcluster.net/v1',
+    }
 
-    def createTaskGraph(self, taskGraphId, payload):
+    def createTaskGraph(self, taskGraphId, payload, **callOptions):
         '''
         Create new task-graph
 
@@ -117,9 +116,10 @@ class Scheduler(baseclient.BaseClient):
         route = self.makeRoute('createTaskGraph', replDict={
             'taskGraphId': taskGraphId,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='createTaskGraph', **callOptions)
 
-    def extendTaskGraph(self, taskGraphId, payload):
+    def extendTaskGraph(self, taskGraphId, payload, **callOptions):
         '''
         Extend existing task-graph
 
@@ -143,9 +143,10 @@ class Scheduler(baseclient.BaseClient):
         route = self.makeRoute('extendTaskGraph', replDict={
             'taskGraphId': taskGraphId,
         })
-        return self._makeHttpRequest('post', route, payload)
+        return self._makeHttpRequest(
+            'post', route, payload, methodName='extendTaskGraph', **callOptions)
 
-    def status(self, taskGraphId):
+    def status(self, taskGraphId, **callOptions):
         '''
         Task Graph Status
 
@@ -161,9 +162,10 @@ class Scheduler(baseclient.BaseClient):
         route = self.makeRoute('status', replDict={
             'taskGraphId': taskGraphId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='status', **callOptions)
 
-    def info(self, taskGraphId):
+    def info(self, taskGraphId, **callOptions):
         '''
         Task Graph Information
 
@@ -180,9 +182,10 @@ class Scheduler(baseclient.BaseClient):
         route = self.makeRoute('info', replDict={
             'taskGraphId': taskGraphId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='info', **callOptions)
 
-    def inspect(self, taskGraphId):
+    def inspect(self, taskGraphId, **callOptions):
         '''
         Inspect Task Graph
 
@@ -205,9 +208,10 @@ class Scheduler(baseclient.BaseClient):
         route = self.makeRoute('inspect', replDict={
             'taskGraphId': taskGraphId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='inspect', **callOptions)
 
-    def inspectTask(self, taskGraphId, taskId):
+    def inspectTask(self, taskGraphId, taskId, **callOptions):
         '''
         Inspect Task from a Task-Graph
 
@@ -232,9 +236,10 @@ class Scheduler(baseclient.BaseClient):
             'taskGraphId': taskGraphId,
             'taskId': taskId,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='inspectTask', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -245,4 +250,5 @@ class Scheduler(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
@@ -258,10 +258,9 @@ class SchedulerEvents(baseclient.BaseClient):
         ],
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['exchangePrefix'] = 'exchange/taskcluster-scheduler/v1/'
-        super(SchedulerEvents, self).__init__(*args, **kwargs)
+    classOptions = {
+        'exchangePrefix': 'exchange/taskcluster-scheduler/v1/',
+    }
 
     def taskGraphRunning(self, routingKeyPattern=None):
         '''
@@ -29,12 +29,11 @@ class Secrets(baseclient.BaseClient):
         'ping': '/ping',
     }
 
-    def __init__(self, *args, **kwargs):
-        self.classOptions = {}
-        self.classOptions['baseUrl'] = 'https://secrets.taskcluster.net/v1'
-        super(Secrets, self).__init__(*args, **kwargs)
+    classOptions = {
+        'baseUrl': 'https://secrets.taskcluster.net/v1',
+    }
 
-    def set(self, name, payload):
+    def set(self, name, payload, **callOptions):
         '''
         Create Secret
 
@@ -46,9 +45,10 @@ class Secrets(baseclient.BaseClient):
         route = self.makeRoute('set', replDict={
             'name': name,
         })
-        return self._makeHttpRequest('put', route, payload)
+        return self._makeHttpRequest(
+            'put', route, payload, methodName='set', **callOptions)
 
-    def remove(self, name):
+    def remove(self, name, **callOptions):
         '''
         Delete Secret
 
@@ -60,9 +60,10 @@ class Secrets(baseclient.BaseClient):
         route = self.makeRoute('remove', replDict={
             'name': name,
         })
-        return self._makeHttpRequest('delete', route)
+        return self._makeHttpRequest(
+            'delete', route, methodName='remove', **callOptions)
 
-    def get(self, name):
+    def get(self, name, **callOptions):
         '''
         Read Secret
 
@@ -74,9 +75,10 @@ class Secrets(baseclient.BaseClient):
         route = self.makeRoute('get', replDict={
             'name': name,
         })
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='get', **callOptions)
 
-    def list(self):
+    def list(self, **callOptions):
         '''
         List Secrets
 
@@ -85,9 +87,10 @@ class Secrets(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('list')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='list', **callOptions)
 
-    def ping(self):
+    def ping(self, **callOptions):
         '''
         Ping Server
 
@@ -98,4 +101,5 @@ class Secrets(baseclient.BaseClient):
         This method takes no arguments.
         '''
         route = self.makeRoute('ping')
-        return self._makeHttpRequest('get', route)
+        return self._makeHttpRequest(
+            'get', route, methodName='ping', **callOptions)
@@ -1,32 +1,37 @@
 #!/usr/bin/env python
 # This file is generated!  Do not edit!
-from taskcluster.sync.Auth import Auth
-from taskcluster.sync.AwsProvisioner import AwsProvisioner
-from taskcluster.sync.AwsProvisionerEvents import AwsProvisionerEvents
-from taskcluster.sync.Github import Github
-from taskcluster.sync.GithubEvents import GithubEvents
-from taskcluster.sync.Hooks import Hooks
-from taskcluster.sync.Index import Index
-from taskcluster.sync.PurgeCache import PurgeCache
-from taskcluster.sync.PurgeCacheEvents import PurgeCacheEvents
-from taskcluster.sync.Queue import Queue
-from taskcluster.sync.QueueEvents import QueueEvents
-from taskcluster.sync.Scheduler import Scheduler
-from taskcluster.sync.SchedulerEvents import SchedulerEvents
-from taskcluster.sync.Secrets import Secrets
+import importlib
+import sys
+
 __all__ = [
-    Auth,
-    AwsProvisioner,
-    AwsProvisionerEvents,
-    Github,
-    GithubEvents,
-    Hooks,
-    Index,
-    PurgeCache,
-    PurgeCacheEvents,
-    Queue,
-    QueueEvents,
-    Scheduler,
-    SchedulerEvents,
-    Secrets,
+    'Auth',
+    'AwsProvisioner',
+    'AwsProvisionerEvents',
+    'Github',
+    'GithubEvents',
+    'Hooks',
+    'Index',
+    'PurgeCache',
+    'PurgeCacheEvents',
+    'Queue',
+    'QueueEvents',
+    'Scheduler',
+    'SchedulerEvents',
+    'Secrets',
 ]
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in __all__:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(__name__, name))
+        module = importlib.import_module('{}.{}'.format(__name__, name))
+        value = globals()[name] = getattr(module, name)
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    for name in __all__:
+        module = importlib.import_module('taskcluster.sync.' + name)
+        globals()[name] = getattr(module, name)
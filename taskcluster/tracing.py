@@ -0,0 +1,91 @@
+"""Tracing of API calls and HTTP requests
+
+Trace events are logged at DEBUG level to the logger of the module emitting
+them, e.g. 'taskcluster.utils' for HTTP requests.  Each record carries the
+event name and a dict of its fields as the traceEvent and traceFields
+attributes, for handlers which want them structured, and reads as
+"event key=value ..." otherwise.
+
+Tracing costs nothing beyond a check of the logger's level when DEBUG logging
+is disabled.  Large values such as request and response bodies are wrapped in
+Truncated, which only converts (and decodes) the part that is shown, when the
+record is formatted.  Authorization headers are never shown.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+
+import six
+
+# Limits of the traced bodies, in characters
+PAYLOAD_LIMIT = 100
+RESPONSE_LIMIT = 1024
+
+_secretHeaders = frozenset(['authorization'])
+
+
+def enabled(log):
+    """ Return True if trace events sent to log are recorded """
+    return log.isEnabledFor(logging.DEBUG)
+
+
+def trace(log, event, **fields):
+    """ Record event, with fields, on log if tracing is enabled for it """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug('%s %s', event, _Fields(fields),
+                  extra={'traceEvent': event, 'traceFields': fields})
+
+
+class Truncated(object):
+    """ Shows at most limit characters of value when formatted.  Only that
+    part of bytes values is decoded """
+
+    __slots__ = ('value', 'limit')
+
+    def __init__(self, value, limit):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        value = self.value
+        if isinstance(value, six.binary_type):
+            text = value[:self.limit].decode('utf-8', 'replace')
+        elif isinstance(value, six.text_type):
+            text = value[:self.limit]
+        else:
+            text = six.text_type(value)[:self.limit]
+        size = len(value) if isinstance(value, (six.binary_type, six.text_type)) else len(text)
+        if size > self.limit:
+            text += u'... (%d more)' % (size - self.limit)
+        return text
+
+    __repr__ = __str__
+
+
+class Headers(object):
+    """ Shows a dict of HTTP headers, without secrets, when formatted """
+
+    __slots__ = ('headers',)
+
+    def __init__(self, headers):
+        self.headers = headers
+
+    def __str__(self):
+        headers = dict(
+            (k, '<redacted>' if k.lower() in _secretHeaders else v)
+            for k, v in (self.headers or {}).items())
+        return str(headers)
+
+    __repr__ = __str__
+
+
+class _Fields(object):
+
+    __slots__ = ('fields',)
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def __str__(self):
+        return ' '.join('%s=%s' % (k, self.fields[k]) for k in sorted(self.fields))
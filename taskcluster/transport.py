@@ -0,0 +1,264 @@
+"""Shared, pooled HTTP transport used by all Taskcluster clients
+
+Every client instance used to own its own requests.Session, and most code paths
+did not use it at all, so each API call paid for a fresh TCP and TLS handshake.
+This module keeps a process wide registry of sessions keyed by host so that all
+clients talking to the same service share one connection pool.
+
+The number of requests in flight to a host is not limited unless a pool size
+is given.  When such a pool is saturated, waiting requests get the next free
+slot in order of priority, and some slots can be reserved for the higher
+priority classes so that bulk background calls never occupy the whole pool.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+
+import requests
+import requests.adapters
+from six.moves import urllib
+
+import taskcluster.exceptions as exceptions
+
+log = logging.getLogger(__name__)
+
+# Maximum number of requests in flight to a single host, None for no limit
+DEFAULT_POOL_SIZE = None
+# Maximum number of idle connections kept open to a single host
+DEFAULT_MAX_IDLE_CONNECTIONS = 10
+DEFAULT_KEEP_ALIVE = True
+
+# Request priority classes, from the most to the least urgent
+PRIORITY_HIGH = 'high'
+PRIORITY_NORMAL = 'normal'
+PRIORITY_LOW = 'low'
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+# Default priority per service and method name, other methods are normal.
+# The 'priorities' client option overrides these
+DEFAULT_PRIORITIES = {
+    'Queue': {
+        # A task is lost if its claim is not renewed or resolved in time
+        'claimTask': PRIORITY_HIGH,
+        'reclaimTask': PRIORITY_HIGH,
+        'reportCompleted': PRIORITY_HIGH,
+        'reportFailed': PRIORITY_HIGH,
+        'reportException': PRIORITY_HIGH,
+        'listArtifacts': PRIORITY_LOW,
+        'listTaskGroup': PRIORITY_LOW,
+        'listDependentTasks': PRIORITY_LOW,
+    },
+}
+
+_pools = {}
+_poolsLock = threading.Lock()
+# (scheme, netloc) of the URLs sessions were looked up for, by URL
+_origins = {}
+_poolsPid = os.getpid()
+
+
+def priorityFor(serviceName, methodName, overrides=None):
+    """ Return the priority class of serviceName's methodName, looking at
+    overrides (a dict of methodName to priority class) first """
+    if overrides and methodName in overrides:
+        return overrides[methodName]
+    return DEFAULT_PRIORITIES.get(serviceName, {}).get(methodName, PRIORITY_NORMAL)
+
+
+class PrioritySlots(object):
+    """ A counting semaphore whose waiters are served by priority class, and
+    first come first served within a class
+
+    reservations is a dict of priority class to a number of slots which
+    requests of lower priority classes may not use.  With 10 slots and
+    {'high': 2}, normal and low priority requests use at most 8 slots.
+    """
+
+    def __init__(self, size, reservations=None):
+        reservations = reservations or {}
+        for priority in reservations:
+            if priority not in PRIORITIES:
+                raise ValueError('Unknown priority %r' % (priority,))
+        self.size = size
+        self.reservations = dict(reservations)
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._counter = itertools.count()
+        self.inFlight = 0
+
+    def limit(self, priority):
+        """ Return the number of slots requests of this priority can use """
+        rank = PRIORITIES.index(priority)
+        reserved = sum(n for p, n in self.reservations.items() if PRIORITIES.index(p) < rank)
+        return max(1, self.size - reserved)
+
+    def acquire(self, priority=PRIORITY_NORMAL, timeout=None):
+        """ Wait for a slot.  Raise TaskclusterDeadlineExceeded if that takes
+        more than timeout seconds """
+        # Higher priority classes have a lower rank, and a higher limit, so
+        # when the first waiter cannot run nobody else can either
+        entry = (PRIORITIES.index(priority), next(self._counter))
+        limit = self.limit(priority)
+        expires = None if timeout is None else time.time() + timeout
+        with self._cond:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while self._waiting[0] != entry or self.inFlight >= limit:
+                    remaining = None if expires is None else expires - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise exceptions.TaskclusterDeadlineExceeded(
+                            'Deadline exceeded waiting for a connection pool slot')
+                    self._cond.wait(remaining)
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self.inFlight += 1
+            # The next waiter might fit as well
+            self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self.inFlight -= 1
+            self._cond.notify_all()
+
+    def waiting(self):
+        """ Return the number of requests waiting for a slot """
+        with self._cond:
+            return len(self._waiting)
+
+
+class PooledSession(requests.Session):
+    """ A requests.Session which can bound the number of requests in flight
+
+    When poolSize is not None, at most poolSize requests are made
+    concurrently through this session and any further callers wait for a
+    slot, see PrioritySlots.  reservations and request priorities only apply
+    to such a bounded pool.  Up to maxIdleConnections connections are kept
+    open for reuse once their request is done.
+    """
+
+    def __init__(self, poolSize=DEFAULT_POOL_SIZE,
+                 maxIdleConnections=DEFAULT_MAX_IDLE_CONNECTIONS,
+                 keepAlive=DEFAULT_KEEP_ALIVE, reservations=None):
+        if reservations and poolSize is None:
+            raise ValueError('Pool reservations need a poolSize')
+        super(PooledSession, self).__init__()
+        self.poolSize = poolSize
+        self.maxIdleConnections = maxIdleConnections
+        self.keepAlive = keepAlive
+        self._slots = None
+        if poolSize is not None:
+            self._slots = PrioritySlots(poolSize, reservations)
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=maxIdleConnections,
+        )
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        if not keepAlive:
+            self.headers['Connection'] = 'close'
+
+    def request(self, *args, **kwargs):
+        """ Make a request, as requests.Session.request.  The priority
+        keyword argument is the priority class of the request, and the
+        timeouts keyword argument a taskcluster.utils.Timeouts which replaces
+        timeout: waiting for a slot ends at its deadline, and the timeout of
+        the request is only computed once the request has a slot """
+        priority = kwargs.pop('priority', None)
+        timeouts = kwargs.pop('timeouts', None)
+        if self._slots is not None:
+            self._slots.acquire(priority or PRIORITY_NORMAL,
+                                None if timeouts is None else timeouts.remaining())
+        if timeouts is not None:
+            kwargs['timeout'] = timeouts.forAttempt()
+        if self._slots is None:
+            return super(PooledSession, self).request(*args, **kwargs)
+        try:
+            return super(PooledSession, self).request(*args, **kwargs)
+        finally:
+            self._slots.release()
+
+
+def _origin(url):
+    """ Return the (scheme, netloc) of url, parsing each base URL only once """
+    origin = _origins.get(url)
+    if origin is None:
+        u = urllib.parse.urlsplit(url)
+        origin = (u.scheme, u.netloc)
+        if len(_origins) < 1000:
+            _origins[url] = origin
+    return origin
+
+
+def _poolKey(url, poolSize, maxIdleConnections, keepAlive, reservations):
+    reservations = tuple(sorted(reservations.items())) if reservations else None
+    return _origin(url) + (poolSize, maxIdleConnections, keepAlive, reservations)
+
+
+def getSession(url, poolSize=None, maxIdleConnections=None, keepAlive=None,
+               reservations=None):
+    """ Return the shared session used to talk to the host of url.
+
+    Clients using the same host and pool settings get the same session, and so
+    share its connections.  Settings which are None use the module defaults.
+    Raise ValueError if reservations are given for a pool without a
+    poolSize.
+    """
+    global _poolsPid
+    if poolSize is None:
+        poolSize = DEFAULT_POOL_SIZE
+    if maxIdleConnections is None:
+        maxIdleConnections = DEFAULT_MAX_IDLE_CONNECTIONS
+    if keepAlive is None:
+        keepAlive = DEFAULT_KEEP_ALIVE
+    key = _poolKey(url, poolSize, maxIdleConnections, keepAlive, reservations)
+
+    session = _pools.get(key)
+    if session is not None and _poolsPid == os.getpid():
+        return session
+
+    with _poolsLock:
+        # Sockets must never be shared with a forked child process
+        if _poolsPid != os.getpid():
+            _pools.clear()
+            _poolsPid = os.getpid()
+        session = _pools.get(key)
+        if session is None:
+            log.debug('Creating connection pool for %s://%s', key[0], key[1])
+            session = PooledSession(poolSize, maxIdleConnections, keepAlive, reservations)
+            _pools[key] = session
+        return session
+
+
+def getSessionForOptions(url, options):
+    """ Return the shared session for url, using the pool settings found in a
+    client options dictionary """
+    if options.get('priorities') and options.get('poolSize') is None:
+        log.warning('The priorities option has no effect without a poolSize')
+    return getSession(
+        url,
+        poolSize=options.get('poolSize'),
+        maxIdleConnections=options.get('maxIdleConnections'),
+        keepAlive=options.get('keepAlive'),
+        reservations=options.get('poolReservations'),
+    )
+
+
+def closeSessions():
+    """ Close and forget every pooled session.  New sessions are created on
+    demand after this is called """
+    with _poolsLock:
+        sessions = list(_pools.values())
+        _pools.clear()
+    for session in sessions:
+        session.close()
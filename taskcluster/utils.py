@@ -3,21 +3,84 @@ import re
 import json
 import datetime
 import base64
+import collections
+import io
 import logging
-import math
 import os
-import random
 import requests
 import slugid
 import time
 import six
 import sys
+import tempfile
+import zlib
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+import taskcluster.exceptions as exceptions
+import taskcluster.retry as retry
+import taskcluster.tracing as tracing
+import taskcluster.transport as transport
+
+# The public names of this module, not the modules it imports
+__all__ = [
+    'MAX_RETRIES',
+    'DELAY_FACTOR',
+    'RANDOMIZATION_FACTOR',
+    'MAX_DELAY',
+    'DEFAULT_CONNECT_TIMEOUT',
+    'DEFAULT_READ_TIMEOUT',
+    'PAYLOAD_CHUNK_SIZE',
+    'PAYLOAD_SPOOL_SIZE',
+    'toStr',
+    'fromNow',
+    'JsonCodec',
+    'OrjsonCodec',
+    'getJsonCodec',
+    'setJsonCodec',
+    'dumpJson',
+    'loadJson',
+    'iterJson',
+    'gzipBytes',
+    'SpooledPayload',
+    'stringDate',
+    'makeB64UrlSafe',
+    'makeB64UrlUnsafe',
+    'encodeStringForB64Header',
+    'slugId',
+    'stableSlugId',
+    'scope_match',
+    'calculateSleepTime',
+    'Timeouts',
+    'makeHttpRequest',
+    'makeSingleHttpRequest',
+    'writeResponse',
+    'LazyJson',
+    'putFile',
+    'encryptEnvVar',
+    'decryptMessage',
+    'isExpired',
+    'authenticate',
+]
 
 MAX_RETRIES = 5
 DELAY_FACTOR = 0.1
 RANDOMIZATION_FACTOR = 0.25
 MAX_DELAY = 30
 
+# Default time limits, in seconds, to connect to a service and to wait for
+# each read of its response
+DEFAULT_CONNECT_TIMEOUT = 30
+DEFAULT_READ_TIMEOUT = 300
+
+# Streamed payloads are encoded in chunks of about this many bytes, and moved
+# from memory to a temporary file once they are larger than the spool size
+PAYLOAD_CHUNK_SIZE = 64 * 1024
+PAYLOAD_SPOOL_SIZE = 1024 * 1024
+
 log = logging.getLogger(__name__)
 
 try:
@@ -27,6 +90,12 @@ except ImportError:
     pgpy = None
     log.debug("Encryption disabled. Install pgpy to enable.")
 
+try:
+    # Encode and decode JSON faster when orjson is installed
+    import orjson
+except ImportError:
+    orjson = None
+
 # Regular expression matching: X days Y hours Z minutes
 r = re.compile('^(\s*(\d+)\s*d(ays?)?)?' +
                '(\s*(\d+)\s*h(ours?)?)?' +
@@ -57,22 +126,181 @@ def fromNow(offset):
     return stringDate(date)
 
 
+def _handleDateAndBinaryForJs(x):
+    if six.PY3 and isinstance(x, six.binary_type):
+        x = x.decode()
+    if isinstance(x, datetime.datetime) or isinstance(x, datetime.date):
+        return stringDate(x)
+    else:
+        return x
+
+
+class JsonCodec(object):
+    """ Encodes and decodes JSON with the standard library.  dumps() makes
+    compact ASCII JSON, with dates as RFC 3339 strings and bytes decoded """
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'), default=_handleDateAndBinaryForJs)
+
+    def loads(self, data):
+        if isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """ Encodes and decodes JSON with orjson, which is faster.  Values orjson
+    cannot encode like JsonCodec, such as non-ASCII text which JsonCodec
+    escapes, are encoded by JsonCodec instead.  Floats can still be written
+    differently (1e16 rather than 1e+16, and NaN or Infinity as null), so
+    this codec is only used after setJsonCodec(OrjsonCodec()) """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("Install `orjson' to use OrjsonCodec")
+
+    def dumps(self, obj):
+        try:
+            d = orjson.dumps(obj, default=_handleDateAndBinaryForJs,
+                             option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return JsonCodec.dumps(self, obj)
+        if not d.isascii():
+            return JsonCodec.dumps(self, obj)
+        return d.decode('ascii')
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+_jsonCodec = JsonCodec()
+
+
+def getJsonCodec():
+    """ Return the codec used to encode and decode JSON """
+    return _jsonCodec
+
+
+def setJsonCodec(codec):
+    """ Use codec, an object with the dumps() and loads() methods of
+    JsonCodec, to encode and decode JSON from now on.  Return the codec
+    it replaces """
+    global _jsonCodec
+    previous, _jsonCodec = _jsonCodec, codec
+    return previous
+
+
 def dumpJson(obj, **kwargs):
     """ Match JS's JSON.stringify.  When using the default seperators,
     base64 encoding JSON results in \n sequences in the output.  Hawk
-    barfs in your face if you have that in the text"""
-    def handleDateAndBinaryForJs(x):
-        if six.PY3 and isinstance(x, six.binary_type):
-            x = x.decode()
-        if isinstance(x, datetime.datetime) or isinstance(x, datetime.date):
-            return stringDate(x)
-        else:
-            return x
-    d = json.dumps(obj, separators=(',', ':'), default=handleDateAndBinaryForJs, **kwargs)
+    barfs in your face if you have that in the text.
+
+    Encodes with the JSON codec (see setJsonCodec) unless keyword arguments
+    for json.dumps are given"""
+    if kwargs:
+        d = json.dumps(obj, separators=(',', ':'), default=_handleDateAndBinaryForJs, **kwargs)
+    else:
+        d = _jsonCodec.dumps(obj)
     assert '\n' not in d
     return d
 
 
+def loadJson(data):
+    """ Decode the JSON text or UTF-8 encoded bytes data with the JSON codec """
+    return _jsonCodec.loads(data)
+
+
+def iterJson(obj, chunkSize=PAYLOAD_CHUNK_SIZE):
+    """ Yield dumpJson(obj) as UTF-8 encoded bytes, in chunks of about
+    chunkSize bytes """
+    encoder = json.JSONEncoder(separators=(',', ':'), default=_handleDateAndBinaryForJs)
+    parts = []
+    size = 0
+    for part in encoder.iterencode(obj):
+        parts.append(part)
+        size += len(part)
+        if size >= chunkSize:
+            yield ''.join(parts).encode('utf-8')
+            parts = []
+            size = 0
+    if parts:
+        yield ''.join(parts).encode('utf-8')
+
+
+def _gzipCompressor(level):
+    # wbits of 16 + MAX_WBITS makes zlib write a gzip header and trailer
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def gzipBytes(data, level=6):
+    """ Return data gzip compressed with the given compression level """
+    compressor = _gzipCompressor(level)
+    return compressor.compress(data) + compressor.flush()
+
+
+class SpooledPayload(object):
+    """ The JSON encoding of obj, made in chunks by iterJson() and kept in
+    memory or, once it is larger than spoolSize bytes, in a temporary file.
+    Each chunk is also passed to the update() method of each of hashers.
+
+    When compressLevel is not None the payload is gzip compressed as it is
+    encoded, and hashers get the compressed chunks.
+
+    Requests send the payload from the file object returned by rewind().
+    """
+
+    def __init__(self, obj, hashers=(), spoolSize=PAYLOAD_SPOOL_SIZE,
+                 chunkSize=PAYLOAD_CHUNK_SIZE, compressLevel=None):
+        self.file = io.BytesIO()
+        self.contentEncoding = None
+        spooled = False
+        chunks = iterJson(obj, chunkSize)
+        if compressLevel is not None:
+            chunks = self._compress(chunks, compressLevel)
+            self.contentEncoding = 'gzip'
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if not spooled and self.file.tell() + len(chunk) > spoolSize:
+                f = tempfile.TemporaryFile()
+                f.write(self.file.getvalue())
+                self.file = f
+                spooled = True
+            self.file.write(chunk)
+            for hasher in hashers:
+                hasher.update(chunk)
+        self.length = self.file.tell()
+        self.spooled = spooled
+
+    @staticmethod
+    def _compress(chunks, level):
+        compressor = _gzipCompressor(level)
+        for chunk in chunks:
+            yield compressor.compress(chunk)
+        yield compressor.flush()
+
+    def rewind(self):
+        """ Return the file object holding the payload, at its start """
+        self.file.seek(0)
+        return self.file
+
+    def read(self):
+        """ Return the whole payload """
+        return self.rewind().read()
+
+    def close(self):
+        self.file.close()
+
+    def __str__(self):
+        return '<%d bytes of %sJSON%s>' % (self.length,
+                                           'gzipped ' if self.contentEncoding else '',
+                                           ' spooled to disk' if self.spooled else '')
+
+
 def stringDate(date):
     # Convert to isoFormat
     string = date.isoformat()
@@ -165,36 +393,74 @@ def calculateSleepTime(attempts):
     """ From the go client
     https://github.com/taskcluster/go-got/blob/031f55c/backoff.go#L24-L29
     """
-    if attempts <= 0:
-        return 0
-
-    # We subtract one to get exponents: 1, 2, 3, 4, 5, ..
-    delay = math.pow(float(2), float(attempts - 1)) * float(DELAY_FACTOR)
-    # Apply randomization factor
-    delay = delay * (RANDOMIZATION_FACTOR * (random.random() * 2 - 1) + 1)
-    # Always limit with a maximum delay
-    return min(delay, MAX_DELAY)
-
-
-def makeHttpRequest(method, url, payload, headers, retries=MAX_RETRIES, session=None):
-    """ Make an HTTP request and retry it until success, return request """
-    retry = -1
-    response = None
-    while retry < retries:
-        retry += 1
-        # if this isn't the first retry then we sleep
-        time.sleep(calculateSleepTime(retry))
-
+    return retry.exponentialDelay(attempts, DELAY_FACTOR, RANDOMIZATION_FACTOR, MAX_DELAY)
+
+
+class Timeouts(collections.namedtuple('Timeouts', ['connect', 'read', 'expires'])):
+    """ The time limits of one API call.  expires is the time.time() after
+    which the call's deadline is exceeded, or None """
+
+    @classmethod
+    def start(cls, connect=DEFAULT_CONNECT_TIMEOUT, read=DEFAULT_READ_TIMEOUT, deadline=None):
+        """ Return the Timeouts of a call starting now, which must be done
+        within deadline seconds if that is not None """
+        expires = None if deadline is None else time.time() + deadline
+        return cls(connect, read, expires)
+
+    def remaining(self):
+        """ Return the seconds left before the deadline, or None """
+        if self.expires is None:
+            return None
+        return self.expires - time.time()
+
+    def forAttempt(self):
+        """ Return the (connect, read) timeouts for the next attempt, which
+        must not outlast the deadline """
+        connect, read = self.connect, self.read
+        remaining = self.remaining()
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        if connect is None and read is None:
+            return None
+        return (connect, read)
+
+    def check(self, delay=0, superExc=None):
+        """ Raise TaskclusterDeadlineExceeded if the deadline passes within
+        delay seconds """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= delay:
+            raise exceptions.TaskclusterDeadlineExceeded(
+                'Deadline exceeded', superExc=superExc)
+
+
+def makeHttpRequest(method, url, payload, headers, retries=MAX_RETRIES, session=None,
+                    retryPolicy=None, timeouts=None):
+    """ Make an HTTP request and retry it until success, return request.
+    retryPolicy is a taskcluster.retry.RetryPolicy, by default exponential
+    backoff with the given number of retries.  timeouts is a Timeouts, by
+    default the default connect and read timeouts without a deadline """
+    if retryPolicy is None:
+        retryPolicy = retry.ExponentialBackoff(maxRetries=retries)
+    if timeouts is None:
+        timeouts = Timeouts.start()
+    retryState = retryPolicy.begin()
+    while True:
         # Seek payload to start, if it is a file
         if hasattr(payload, 'seek'):
             payload.seek(0)
 
-        log.debug('Making attempt %d', retry)
+        timeouts.check()
+        log.debug('Making attempt %d', retryState.retries)
         try:
-            response = makeSingleHttpRequest(method, url, payload, headers, session)
+            response = makeSingleHttpRequest(method, url, payload, headers, session, timeouts)
         except requests.exceptions.RequestException as rerr:
-            if retry < retries:
+            delay = retryState.nextDelay(error=rerr)
+            # The attempt may have timed out because the deadline passed
+            timeouts.check(delay or 0, rerr)
+            if delay is not None:
                 log.warn('Retrying because of: %s' % rerr)
+                time.sleep(delay)
                 continue
             # raise a connection exception
             raise rerr
@@ -202,41 +468,106 @@ def makeHttpRequest(method, url, payload, headers, retries=MAX_RETRIES, session=
         try:
             response.raise_for_status()
         except requests.exceptions.RequestException as rerr:
-            status = response.status_code
-            if 500 <= status and status < 600 and retry < retries:
+            delay = retryState.nextDelay(status=response.status_code,
+                                         retryAfter=response.headers.get('Retry-After'))
+            if delay is not None:
+                timeouts.check(delay, rerr)
                 log.warn('Retrying because of: %s' % rerr)
+                time.sleep(delay)
                 continue
             raise rerr
 
         # Otherwise return the result
         return response
 
-    # This code-path should be unreachable
-    assert False, "Error from last retry should have been raised!"
 
-
-def makeSingleHttpRequest(method, url, payload, headers, session=None):
+def makeSingleHttpRequest(method, url, payload, headers, session=None, timeout=None,
+                          priority=None, stream=False):
+    """ Make a single HTTP request.  timeout is passed to requests: a number
+    of seconds or a (connect, read) tuple, or is a Timeouts which also bounds
+    the wait for a slot of a pooled session.  priority is the request's
+    priority class for pooled sessions (see taskcluster.transport).  When
+    stream is True the body of the response is not read """
     method = method.upper()
-    log.debug('Making a %s request to %s', method, url)
-    log.debug('HTTP Headers: %s' % str(headers))
-    log.debug('HTTP Payload: %s (limit 100 char)' % str(payload)[:100])
-    obj = session if session else requests
-    response = obj.request(method.upper(), url, data=payload, headers=headers)
-    log.debug('Received HTTP Status:    %s' % response.status_code)
-    log.debug('Received HTTP Headers: %s' % str(response.headers))
-    log.debug('Received HTTP Payload: %s (limit 1024 char)' %
-              six.text_type(response.content)[:1024])
+    traced = tracing.enabled(log)
+    if traced:
+        tracing.trace(log, 'request', method=method, url=url, headers=tracing.Headers(headers),
+                      payload=tracing.Truncated(payload, tracing.PAYLOAD_LIMIT))
+    if session is None:
+        session = transport.getSession(url)
+    kwargs = {}
+    if priority is not None and isinstance(session, transport.PooledSession):
+        kwargs['priority'] = priority
+    if isinstance(timeout, Timeouts):
+        if isinstance(session, transport.PooledSession):
+            kwargs['timeouts'] = timeout
+            timeout = None
+        else:
+            timeout = timeout.forAttempt()
+    if isinstance(payload, SpooledPayload):
+        # requests streams file objects, with a Content-Length header
+        payload = payload.rewind()
+    if stream:
+        kwargs['stream'] = True
+    response = session.request(method, url, data=payload, headers=headers, timeout=timeout,
+                               **kwargs)
+    if traced:
+        # Streamed bodies have not been read yet
+        body = None if stream else tracing.Truncated(response.content, tracing.RESPONSE_LIMIT)
+        tracing.trace(log, 'response', status=response.status_code,
+                      headers=tracing.Headers(response.headers), body=body)
 
     return response
 
 
-def putFile(filename, url, contentType):
+def writeResponse(response, f, chunkSize=PAYLOAD_CHUNK_SIZE):
+    """ Write the body of a streamed requests response to the file object f,
+    and return the number of bytes written """
+    written = 0
+    for chunk in response.iter_content(chunkSize):
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+class LazyJson(Mapping):
+    """ The JSON body of a response, only decoded when it is first used.  It
+    behaves like a read only dict, value() returns the decoded object and
+    content the body as bytes """
+
+    _notDecoded = object()
+
+    def __init__(self, content):
+        self.content = content
+        self._value = self._notDecoded
+
+    def value(self):
+        if self._value is self._notDecoded:
+            self._value = loadJson(self.content)
+        return self._value
+
+    def __getitem__(self, key):
+        return self.value()[key]
+
+    def __iter__(self):
+        return iter(self.value())
+
+    def __len__(self):
+        return len(self.value())
+
+    def __repr__(self):
+        if self._value is self._notDecoded:
+            return '<LazyJson of %d bytes>' % len(self.content)
+        return 'LazyJson(%r)' % (self._value,)
+
+
+def putFile(filename, url, contentType, session=None, timeouts=None):
     with open(filename, 'rb') as f:
         contentLength = os.fstat(f.fileno()).st_size
         return makeHttpRequest('put', url, f, headers={
             'Content-Length': contentLength,
             'Content-Type': contentType,
-        })
+        }, session=session, timeouts=timeouts)
 
 
 def _messageForEncryptedEnvVar(taskId, startTime, endTime, name, value):
@@ -251,6 +582,8 @@ def _messageForEncryptedEnvVar(taskId, startTime, endTime, name, value):
 
 
 def encryptEnvVar(taskId, startTime, endTime, name, value, keyFile):
+    # The encrypted message is always serialized by the standard library, so
+    # that it does not depend on the JSON codec in use
     message = toStr(json.dumps(_messageForEncryptedEnvVar(
         taskId, startTime, endTime, name, value)))
     return base64.b64encode(_encrypt(message, keyFile))
@@ -284,7 +617,7 @@ def decryptMessage(message, privateKey):
     :return: decrypted message dictionary
     """
     decodedMessage = base64.b64decode(message)
-    return json.loads(_decrypt(decodedMessage, privateKey))
+    return loadJson(_decrypt(decodedMessage, privateKey))
 
 
 def _decrypt(blob, privateKey):
@@ -312,7 +645,7 @@ def _decrypt(blob, privateKey):
 def isExpired(certificate):
     """ Check if certificate is expired """
     if isinstance(certificate, six.string_types):
-        certificate = json.loads(certificate)
+        certificate = loadJson(certificate)
     expiry = certificate.get('expiry', 0)
     return expiry < int(time.time() * 1000) + 20 * 60
 
@@ -8,6 +8,7 @@ import time
 import json
 import mock
 import re
+import requests
 from operator import itemgetter
 from taskcluster.runtimeclient import ROUTING_KEY_BLACKLIST
 
@@ -99,6 +100,27 @@ def createTopicExchangeKey(name, constant=None, multipleWords=False, maxSize=5,
     return default
 
 
+class FakeResponse(object):
+    """ What utils.makeSingleHttpRequest returns, for tests which mock it.
+    The body is encoded as JSON """
+
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.body = {} if body is None else body
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        return json.dumps(self.body).encode('utf-8')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError()
+
+    def close(self):
+        pass
+
+
 class AuthClient(object):
     def __init__(self, clientId, accessToken, expires, scopes):
         self.clientId = clientId
@@ -153,6 +175,7 @@ class GeneratedTC(TCTest):
         replDict = self._get_replDict(argumentNames)
         expectedRoute = a.routes[functionName].format(**replDict).lstrip('/')
         getattr(a, functionName)(*argumentNames, **kwargs)
+        kwargs['methodName'] = functionName
         if validOptions:
             kwargs['validOptions'] = validOptions
             kwargs['options'] = None
@@ -0,0 +1,34 @@
+""" Measure the cost of making a client per incoming request: constructing a
+Queue with and without credentials, and deriving one from a shared client
+with withCredentials().
+
+    python test/benchmark/bench_construct.py [iterations]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+
+import taskcluster
+
+CREDENTIALS = {'clientId': 'tester', 'accessToken': 'no-secret'}
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    queue = taskcluster.Queue()
+    cases = [
+        ('Queue()', lambda: taskcluster.Queue()),
+        ('Queue(credentials)', lambda: taskcluster.Queue({'credentials': dict(CREDENTIALS)})),
+        ('withCredentials', lambda: queue.withCredentials(dict(CREDENTIALS))),
+        ('withCredentials + sign', lambda: queue.withCredentials(
+            dict(CREDENTIALS))._hawkCredentials()),
+    ]
+    for name, case in cases:
+        seconds = timeit.timeit(case, number=iterations)
+        print('%-24s %6.2f us' % (name, seconds / iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+""" Measure the per-call overhead of API methods, up to the point where the
+HTTP request would be made: for clients made by createApiClient and for the
+generated classes, and for RuntimeClient.buildUrl.
+
+    python test/benchmark/bench_dispatch.py [iterations]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+
+import taskcluster
+from taskcluster.baseclient import API_CONFIG
+
+
+def _noRequest(*args, **kwargs):
+    return None
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    runtime = taskcluster.createApiClient('Queue', API_CONFIG['Queue'])()
+    generated = taskcluster.Queue()
+    runtime._makeHttpRequest = generated._makeHttpRequest = _noRequest
+    cases = [
+        ('runtime status', lambda: runtime.status('fN1SbArXTPSVFNUvaOlinQ')),
+        ('runtime getArtifact', lambda: runtime.getArtifact(
+            'fN1SbArXTPSVFNUvaOlinQ', 0, 'public/build/target.tar.gz')),
+        ('runtime getArtifact kw', lambda: runtime.getArtifact(
+            taskId='fN1SbArXTPSVFNUvaOlinQ', runId=0, name='public/build/target.tar.gz')),
+        ('generated getArtifact', lambda: generated.getArtifact(
+            'fN1SbArXTPSVFNUvaOlinQ', 0, 'public/build/target.tar.gz')),
+        ('runtime buildUrl', lambda: runtime.buildUrl(
+            'getArtifact', 'fN1SbArXTPSVFNUvaOlinQ', 0, 'public/build/target.tar.gz')),
+    ]
+    for name, case in cases:
+        seconds = timeit.timeit(case, number=iterations)
+        print('%-24s %6.2f us' % (name, seconds / iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main()
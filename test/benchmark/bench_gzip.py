@@ -0,0 +1,122 @@
+""" Measure the bytes on the wire saved by gzip compressing request payloads,
+and the time compressing takes, for payloads shaped like real task graphs,
+hooks and worker types.
+
+    python test/benchmark/bench_gzip.py [tasks]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+
+from taskcluster import utils
+
+
+def task(index):
+    return {
+        'taskId': utils.slugId(),
+        'requires': [utils.slugId() for _ in range(index % 3)],
+        'reruns': 3,
+        'task': {
+            'provisionerId': 'aws-provisioner-v1',
+            'workerType': 'gecko-t-linux-large',
+            'schedulerId': 'task-graph-scheduler',
+            'created': '2017-06-01T10:00:00.000Z',
+            'deadline': '2017-06-02T10:00:00.000Z',
+            'routes': [
+                'index.gecko.v2.mozilla-central.latest.firefox.linux64-opt.test-%d' % index,
+                'tc-treeherder.v2.mozilla-central.ab12cd34ef56ab12cd34ef56ab12cd34ef56ab12.%d'
+                % index,
+            ],
+            'scopes': ['docker-worker:cache:level-3-checkouts', 'secrets:get:project/releng/*'],
+            'payload': {
+                'image': 'taskcluster/desktop-test:0.5.%d' % (index % 7),
+                'command': ['/home/worker/bin/run-task', '--', 'bash', '-cx',
+                            'cd /home/worker && ./bin/test-linux.sh --chunk=%d' % index],
+                'env': {
+                    'GECKO_HEAD_REPOSITORY': 'https://hg.mozilla.org/mozilla-central',
+                    'GECKO_HEAD_REV': 'ab12cd34ef56ab12cd34ef56ab12cd34ef56ab12',
+                    'MOZHARNESS_SCRIPT': 'desktop_unittest.py',
+                    'MOZHARNESS_CONFIG': 'unittests/linux_unittest.py remove_executables.py',
+                    'THIS_CHUNK': str(index),
+                },
+                'artifacts': {
+                    'public/logs': {'type': 'directory', 'path': '/home/worker/workspace/logs',
+                                    'expires': '2018-06-01T10:00:00.000Z'},
+                },
+                'maxRunTime': 3600,
+            },
+            'metadata': {
+                'name': 'test-linux64/opt-mochitest-%d' % index,
+                'description': 'Mochitest run, chunk %d' % index,
+                'owner': 'someone@example.com',
+                'source': 'https://hg.mozilla.org/mozilla-central/file/tip/taskcluster/ci',
+            },
+            'tags': {'createdForUser': 'someone@example.com'},
+        },
+    }
+
+
+def taskGraph(tasks):
+    return {
+        'scopes': ['queue:*', 'docker-worker:*', 'scheduler:*'],
+        'routes': ['tc-treeherder.mozilla-central.ab12cd34ef56'],
+        'tasks': [task(i) for i in range(tasks)],
+        'metadata': {'name': 'task graph', 'description': 'decision task graph',
+                     'owner': 'someone@example.com', 'source': 'https://hg.mozilla.org'},
+    }
+
+
+def hook():
+    return {
+        'metadata': {'name': 'nightly', 'description': 'Nightly build ' * 20,
+                     'owner': 'someone@example.com', 'emailOnError': True},
+        'schedule': ['0 0 %d * * *' % h for h in range(0, 24, 12)],
+        'expires': '1 day',
+        'deadline': '3 hours',
+        'task': task(0)['task'],
+    }
+
+
+def workerType():
+    instanceTypes = [{'instanceType': t, 'capacity': 1, 'utility': 1,
+                      'secrets': {}, 'scopes': [], 'userData': {},
+                      'launchSpec': {'BlockDeviceMappings': [
+                          {'DeviceName': '/dev/xvdb', 'Ebs': {'VolumeSize': 120}}]}}
+                     for t in ('m3.large', 'c3.xlarge', 'c4.xlarge', 'm4.xlarge')]
+    regions = [{'region': r, 'secrets': {}, 'scopes': [], 'userData': {},
+                'launchSpec': {'ImageId': 'ami-%08x' % i}}
+               for i, r in enumerate(('us-east-1', 'us-west-1', 'us-west-2', 'eu-central-1'))]
+    return {
+        'minCapacity': 0, 'maxCapacity': 500, 'scalingRatio': 0,
+        'minPrice': 0.1, 'maxPrice': 1.5, 'canUseOndemand': False, 'canUseSpot': True,
+        'instanceTypes': instanceTypes, 'regions': regions,
+        'launchSpec': {'SecurityGroups': ['docker-worker'], 'KeyName': 'worker'},
+        'userData': {'dockerConfig': {'allowPrivileged': False}},
+        'secrets': {}, 'scopes': ['docker-worker:cache:*'],
+        'description': 'Test worker type', 'owner': 'someone@example.com',
+    }
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    payloads = [
+        ('createTaskGraph(%d tasks)' % tasks, taskGraph(tasks)),
+        ('createHook', hook()),
+        ('createWorkerType', workerType()),
+    ]
+    for name, payload in payloads:
+        data = utils.dumpJson(payload).encode('utf-8')
+        print('%s: %d bytes' % (name, len(data)))
+        for level in (1, 6, 9):
+            number = max(1, 2000000 // len(data))
+            seconds = timeit.timeit(lambda: utils.gzipBytes(data, level), number=number)
+            compressed = len(utils.gzipBytes(data, level))
+            print('  level %d: %9d bytes (%5.1f%% saved) in %8.2f ms' % (
+                level, compressed, 100.0 * (len(data) - compressed) / len(data),
+                seconds / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
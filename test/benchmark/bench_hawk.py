@@ -0,0 +1,45 @@
+""" Compare the time taken to make the Hawk headers of a request with
+taskcluster.hawk.Signer and with mohawk.Sender.
+
+    python test/benchmark/bench_hawk.py [iterations]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import timeit
+
+import taskcluster
+
+URL = 'https://queue.taskcluster.net/v1/task/fN1SbArXTPSVFNUvaOlinQ/artifacts?limit=100'
+PAYLOAD = b'{"provisionerId": "aws-provisioner-v1", "workerType": "tutorial"}'
+
+
+def client(signer):
+    return taskcluster.Queue({
+        'credentials': {
+            'clientId': 'tester',
+            'accessToken': 'no-secret',
+            'certificate': '{"version": 1, "scopes": ["queue:*"], "start": 0, "expiry": 0, '
+                           '"seed": "' + 'x' * 44 + '", "signature": "' + 'y' * 44 + '"}',
+        },
+        'authorizedScopes': ['queue:*'],
+        'hawkSigner': signer,
+    })
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for signer in ('mohawk', 'fast'):
+        queue = client(signer)
+        credentials = queue._hawkCredentials()
+        for payload in (None, PAYLOAD):
+            seconds = timeit.timeit(
+                lambda: queue._makeHeaders('GET', URL, payload, credentials),
+                number=iterations)
+            print('%-6s %-10s %6.1f us/request' % (
+                signer, 'payload' if payload else 'no payload', seconds / iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+""" Measure what starting a process which uses the client costs: the wall time
+of `import taskcluster`, the modules it imports and the most expensive of
+them (as reported by `python -X importtime`), the resident memory after the
+import, and the latency of a first `Queue().ping()` against a local stub
+server.  Each measurement is made in a fresh interpreter and the median of
+the runs is reported.
+
+    python test/benchmark/bench_startup.py [runs] [--save]
+
+The results are compared with startup_baseline.json, next to this file, and
+any metric more than `budget` times its baseline is reported; --save stores
+the results as the new baseline.  When TASKCLUSTER_STARTUP_BUDGET is set,
+test/test_startup.py fails if that budget is exceeded.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from six.moves import BaseHTTPServer
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_baseline.json')
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Metrics compared with the baseline, and their units
+METRICS = [
+    ('importTime', 'ms'),
+    ('modules', ''),
+    ('rss', 'MB'),
+    ('firstCall', 'ms'),
+]
+
+# Environment variable with the budget, as a multiple of the baseline
+BUDGET_ENV = 'TASKCLUSTER_STARTUP_BUDGET'
+DEFAULT_BUDGET = 2.0
+
+CHILD = r'''
+import json, sys, time
+before = set(sys.modules)
+start = time.time()
+import taskcluster
+importTime = time.time() - start
+modules = len(set(sys.modules) - before)
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = rss / 1024.0 / (1024.0 if sys.platform == 'darwin' else 1.0)
+except ImportError:
+    rss = None
+firstCall = None
+if len(sys.argv) > 1:
+    start = time.time()
+    taskcluster.Queue({'baseUrl': sys.argv[1], 'maxRetries': 0}).ping()
+    firstCall = time.time() - start
+sys.stdout.write(json.dumps({
+    'importTime': importTime * 1000,
+    'modules': modules,
+    'rss': rss,
+    'firstCall': firstCall * 1000 if firstCall is not None else None,
+}))
+'''
+
+
+class _PingHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = b'{"alive": true, "uptime": 1}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(object):
+    """ A local HTTP server answering every GET like the ping endpoint """
+
+    def __enter__(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), _PingHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return 'http://127.0.0.1:%d/v1' % self.server.server_address[1]
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _childEnv():
+    env = dict((k, v) for k, v in os.environ.items()
+               if not k.startswith('TASKCLUSTER_') and k != 'DEBUG_TASKCLUSTER_CLIENT')
+    env['PYTHONPATH'] = os.pathsep.join([ROOT] + [p for p in [env.get('PYTHONPATH')] if p])
+    return env
+
+
+def runOnce(baseUrl=None):
+    """ Return the metrics of one fresh interpreter, which pings baseUrl if
+    given """
+    args = [sys.executable, '-c', CHILD] + ([baseUrl] if baseUrl else [])
+    return json.loads(subprocess.check_output(args, env=_childEnv()).decode('utf-8'))
+
+
+def _median(values):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def measure(runs=5):
+    """ Return the median of each metric over runs fresh interpreters """
+    with StubServer() as baseUrl:
+        results = [runOnce(baseUrl) for _ in range(runs)]
+    return dict((name, _median(r[name] for r in results)) for name, _ in METRICS)
+
+
+def importTimes(top=15):
+    """ Return (self, cumulative, module) import times in microseconds, of the
+    `top` modules with the largest cumulative time, from -X importtime """
+    args = [sys.executable, '-X', 'importtime', '-c', 'import taskcluster']
+    proc = subprocess.Popen(args, env=_childEnv(), stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    times = []
+    for line in err.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        selfTime, cumulative, module = line[len('import time:'):].split('|')
+        times.append((int(selfTime), int(cumulative), module.rstrip()))
+    times.sort(key=lambda t: -t[1])
+    return times[:top]
+
+
+def loadBaseline(path=BASELINE_FILE):
+    with open(path) as f:
+        return json.load(f)
+
+
+def saveBaseline(results, path=BASELINE_FILE):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def getBudget(default=None):
+    """ Return the budget from the environment, or default if it is not set,
+    or None if it is 'off' """
+    budget = os.environ.get(BUDGET_ENV)
+    if budget is None:
+        return default
+    if budget.lower() in ('', '0', 'off'):
+        return None
+    return float(budget)
+
+
+def overBudget(results, baseline, budget):
+    """ Return a list of (metric, value, limit) for each metric of results
+    more than budget times its baseline """
+    over = []
+    for name, _ in METRICS:
+        value, base = results.get(name), baseline.get(name)
+        if value is None or base is None:
+            continue
+        if value > base * budget:
+            over.append((name, value, base * budget))
+    return over
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    runs = int(args[0]) if args else 10
+    if sys.version_info >= (3, 7):
+        print('Slowest imports (cumulative):')
+        for selfTime, cumulative, module in importTimes():
+            print('  %8.1f ms %8.1f ms self  %s' % (cumulative / 1000.0, selfTime / 1000.0, module))
+    results = measure(runs)
+    baseline = loadBaseline() if os.path.exists(BASELINE_FILE) else {}
+    print('Median of %d runs:' % runs)
+    for name, unit in METRICS:
+        if results[name] is None:
+            continue
+        base = baseline.get(name)
+        print('  %-10s %8.1f %-2s  (baseline %s)' % (
+            name, results[name], unit, '%.1f' % base if base is not None else '-'))
+    if '--save' in sys.argv:
+        saveBaseline(results)
+        print('Saved as the baseline')
+        return
+    budget = getBudget(DEFAULT_BUDGET)
+    if budget and baseline:
+        for name, value, limit in overBudget(results, baseline, budget):
+            print('OVER BUDGET: %s is %.1f, more than %.1f' % (name, value, limit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import io
+import unittest
+
+import mock
+
+import base
+import taskcluster.aio
+import taskcluster.asyncclient as subject
+import taskcluster.exceptions as exc
+import taskcluster.hedging as hedging
+
+
+def run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+class FakeHttp(object):
+    """Replaces asyncclient.makeSingleHttpRequest, returning the given
+    responses (or raising the given exceptions) in order"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.timeouts = []
+        self.responseFiles = []
+
+    async def __call__(self, method, url, payload, headers, session=None, timeout=None,
+                       responseFile=None):
+        self.calls.append((method, url, payload, headers))
+        self.timeouts.append(timeout)
+        self.responseFiles.append(responseFile)
+        r = self.responses.pop(0)
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+
+def response(status, content=b'{}'):
+    return subject.Response(status, {}, content)
+
+
+@unittest.skipIf(subject.aiohttp is None, 'aiohttp is not installed')
+class TestAsyncClient(base.TCTest):
+
+    def setUp(self):
+        self.client = taskcluster.aio.Queue({
+            'credentials': {'clientId': 'clientId', 'accessToken': 'accessToken'},
+        })
+        sleepPatcher = mock.patch('asyncio.sleep', new=self.fakeSleep)
+        sleepPatcher.start()
+        self.addCleanup(sleepPatcher.stop)
+        self.addCleanup(lambda: run(subject.closeSessions()))
+
+    async def fakeSleep(self, delay):
+        pass
+
+    def patchHttp(self, *responses):
+        fake = FakeHttp(*responses)
+        patcher = mock.patch.object(subject, 'makeSingleHttpRequest', new=fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return fake
+
+    def test_methods_are_coroutines(self):
+        self.assertTrue(asyncio.iscoroutinefunction(self.client.status))
+
+    def test_success(self):
+        fake = self.patchHttp(response(200, b'{"status": "ok"}'))
+        result = run(self.client.status('abc'))
+        self.assertEqual(result, {'status': 'ok'})
+        method, url, payload, headers = fake.calls[0]
+        self.assertEqual(method, 'get')
+        self.assertEqual(url, 'https://queue.taskcluster.net/v1/task/abc/status')
+        self.assertTrue(headers['Authorization'].startswith('Hawk '))
+
+    def test_response_modes(self):
+        self.patchHttp(response(200, b'{"status": "ok"}'), response(200, b'{"status": "ok"}'))
+        self.assertEqual(run(self.client.status('abc', responseMode='raw')),
+                         b'{"status": "ok"}')
+        lazy = run(self.client.status('abc', responseMode='lazy'))
+        self.assertEqual(lazy['status'], 'ok')
+
+    def test_stream_response(self):
+        f = io.BytesIO()
+        fake = self.patchHttp(subject.Response(200, {}, None, written=5))
+        self.assertEqual(run(self.client.status('abc', responseFile=f)), 5)
+        self.assertIs(fake.responseFiles[0].file, f)
+
+    def streamFailingOnce(self):
+        attempts = []
+
+        async def fake(method, url, payload, headers, session=None, timeout=None,
+                       responseFile=None):
+            attempts.append(responseFile)
+            if len(attempts) == 1:
+                responseFile.write(b'part')
+                raise subject.aiohttp.ClientPayloadError('connection lost')
+            responseFile.write(b'whole')
+            return subject.Response(200, {}, None, written=5)
+        patcher = mock.patch.object(subject, 'makeSingleHttpRequest', new=fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return attempts
+
+    def test_stream_retry_rewrites_file(self):
+        attempts = self.streamFailingOnce()
+        f = io.BytesIO(b'head:')
+        f.seek(0, io.SEEK_END)
+        self.assertEqual(run(self.client.status('abc', responseFile=f)), 5)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(f.getvalue(), b'head:whole')
+
+    def test_stream_not_retried_into_unseekable_file(self):
+        class Pipe(object):
+            def __init__(self):
+                self.data = b''
+
+            def write(self, data):
+                self.data += data
+
+        attempts = self.streamFailingOnce()
+        pipe = Pipe()
+        with self.assertRaises(exc.TaskclusterConnectionError):
+            run(self.client.status('abc', responseFile=pipe))
+        self.assertEqual(len(attempts), 1)
+
+    def test_payload(self):
+        fake = self.patchHttp(response(200))
+        run(self.client.createTask('abc', {'a': 1}))
+        self.assertEqual(fake.calls[0][2], '{"a":1}')
+        self.assertEqual(fake.calls[0][3]['Content-Type'], 'application/json')
+
+    def test_no_content(self):
+        self.patchHttp(response(204, b''))
+        self.assertEqual(run(self.client.ping()), None)
+
+    def test_retries_server_errors(self):
+        fake = self.patchHttp(response(500), response(503), response(200, b'{"x": 1}'))
+        self.assertEqual(run(self.client.status('abc')), {'x': 1})
+        self.assertEqual(len(fake.calls), 3)
+
+    def test_exhaust_retries(self):
+        retries = self.client.options['maxRetries']
+        fake = self.patchHttp(*[response(500, b'{"message": "msg"}')] * (retries + 1))
+        with self.assertRaises(exc.TaskclusterRestFailure) as cm:
+            run(self.client.status('abc'))
+        self.assertEqual(str(cm.exception), 'msg')
+        self.assertEqual(len(fake.calls), retries + 1)
+
+    def test_auth_failure_not_retried(self):
+        fake = self.patchHttp(response(401, b'{"message": "nope"}'))
+        with self.assertRaises(exc.TaskclusterAuthFailure):
+            run(self.client.status('abc'))
+        self.assertEqual(len(fake.calls), 1)
+
+    def test_connection_errors(self):
+        retries = self.client.options['maxRetries']
+        self.patchHttp(*[subject.aiohttp.ClientError()] * (retries + 1))
+        with self.assertRaises(exc.TaskclusterConnectionError):
+            run(self.client.status('abc'))
+
+    def test_timeouts(self):
+        fake = self.patchHttp(response(200))
+        run(self.client.status('abc', readTimeout=2, deadline=10))
+        timeout = fake.timeouts[0]
+        self.assertTrue(0 < timeout.sock_connect <= 10)
+        self.assertEqual(timeout.sock_read, 2)
+        self.assertTrue(0 < timeout.total <= 10)
+
+    def test_deadline(self):
+        timePatcher = mock.patch('time.time', return_value=1000)
+        now = timePatcher.start()
+        self.addCleanup(timePatcher.stop)
+
+        async def request(method, url, payload, headers, session=None, timeout=None,
+                          responseFile=None):
+            now.return_value += 11
+            raise asyncio.TimeoutError()
+
+        with mock.patch.object(subject, 'makeSingleHttpRequest', new=request):
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+                run(self.client.status('abc', deadline=10))
+
+    def test_shared_session(self):
+        async def sessions():
+            a = subject.getSession('https://queue.taskcluster.net/v1/ping')
+            b = subject.getSession('https://queue.taskcluster.net/v1/task/abc')
+            await subject.closeSessions()
+            return a, b
+        a, b = run(sessions())
+        self.assertIs(a, b)
+
+    def test_hedged_request(self):
+        hedging.reset()
+        self.addCleanup(hedging.reset)
+        client = taskcluster.aio.Queue({'hedgeRequests': {'delay': 0.01, 'maxHedgeRate': 1}})
+        cancelled = []
+
+        async def request(method, url, payload, headers, session=None, timeout=None,
+                          responseFile=None):
+            if not cancelled:
+                cancelled.append(False)
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled[0] = True
+                    raise
+            return response(200, b'{"hedged": true}')
+
+        with mock.patch.object(subject, 'makeSingleHttpRequest', new=request):
+            self.assertEqual(run(client.status('abc')), {'hedged': True})
+        self.assertEqual(cancelled, [True])
+
+    def test_coalesced_gets(self):
+        client = taskcluster.aio.Queue({'coalesceRequests': True, 'credentials': {}})
+        release = asyncio.Event()
+        calls = []
+
+        async def request(method, url, payload, headers, session=None, timeout=None,
+                          responseFile=None):
+            calls.append(url)
+            await release.wait()
+            return response(200, b'{"works": true}')
+
+        async def releaseLater():
+            release.set()
+
+        async def calls5():
+            return await asyncio.gather(*[client.status('abc') for _ in range(5)] +
+                                        [releaseLater()])
+
+        with mock.patch.object(subject, 'makeSingleHttpRequest', new=request):
+            results = run(calls5())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results[:5], [{'works': True}] * 5)
+        self.assertIsNot(results[0], results[1])
+
+    def test_coalesced_waiter_deadline(self):
+        client = taskcluster.aio.Queue({'coalesceRequests': True, 'credentials': {}})
+        release = asyncio.Event()
+
+        async def request(method, url, payload, headers, session=None, timeout=None,
+                          responseFile=None):
+            await release.wait()
+            return response(200)
+
+        async def waiter():
+            try:
+                await client.status('abc', deadline=0.01)
+            finally:
+                release.set()
+
+        async def calls():
+            return await asyncio.gather(client.status('abc'), waiter(),
+                                        return_exceptions=True)
+
+        with mock.patch.object(subject, 'makeSingleHttpRequest', new=request):
+            first, second = run(calls())
+        self.assertEqual(first, {})
+        self.assertIsInstance(second, exc.TaskclusterDeadlineExceeded)
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, division, print_function
 
+import json
+import os
 import unittest
 
 import taskcluster.baseclient as bc
@@ -52,3 +54,29 @@ class TestBaseClient(unittest.TestCase):
         route = "/asdf/foo/bar"
         url = client.makeFullUrl(route, validOptions=['a', 'b'], options={'a': 1})
         self.assertEqual(url, FAKE_URL + route + "?a=1")
+
+
+class TestApiReferences(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(bc.__file__), 'apis.json')) as f:
+            self.apis = json.load(f)
+
+    def test_same_as_apis_json(self):
+        self.assertEqual(sorted(bc.API_CONFIG), sorted(self.apis))
+        for name in self.apis:
+            self.assertEqual(bc.API_CONFIG[name], self.apis[name])
+
+    def test_loaded_when_used(self):
+        references = bc.ApiReferences()
+        self.assertIn('Queue', references)
+        self.assertEqual(len(references), len(self.apis))
+        self.assertEqual(references._references, {})
+        queue = references['Queue']
+        self.assertEqual(list(references._references), ['Queue'])
+        self.assertIs(references['Queue'], queue)
+
+    def test_unknown_service(self):
+        with self.assertRaises(KeyError):
+            bc.API_CONFIG['NoSuchService']
+        self.assertNotIn('NoSuchService', bc.API_CONFIG)
@@ -0,0 +1,249 @@
+from __future__ import absolute_import, division, print_function
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+import mock
+
+import base
+import taskcluster.cache as subject
+import taskcluster.client as client
+
+
+class TestTtlFor(base.TCTest):
+
+    def test_immutable(self):
+        self.assertIs(subject.ttlFor('Queue', 'task'), subject.FOREVER)
+
+    def test_short(self):
+        self.assertEqual(subject.ttlFor('Queue', 'status'), 5)
+
+    def test_unknown(self):
+        self.assertEqual(subject.ttlFor('Queue', 'createTask'), subject.NEVER)
+        self.assertEqual(subject.ttlFor('Index', 'task'), subject.NEVER)
+
+    def test_overrides(self):
+        self.assertEqual(subject.ttlFor('Queue', 'task', {'task': 30}), 30)
+        self.assertEqual(subject.ttlFor('Index', 'findTask', {'findTask': 30}), 30)
+
+
+class TestMemoryCache(base.TCTest):
+
+    def test_hit_and_miss(self):
+        c = subject.MemoryCache()
+        self.assertIsNone(c.get('a'))
+        c.set('a', {'x': 1})
+        self.assertEqual(c.get('a'), {'x': 1})
+        self.assertEqual(c.stats()['hits'], 1)
+        self.assertEqual(c.stats()['misses'], 1)
+
+    def test_hits_are_copies(self):
+        c = subject.MemoryCache()
+        c.set('a', {'x': [1]})
+        c.get('a')['x'].append(2)
+        self.assertEqual(c.get('a'), {'x': [1]})
+
+    def test_expiry(self):
+        c = subject.MemoryCache()
+        with mock.patch('time.time', return_value=1000):
+            c.set('a', {'x': 1}, ttl=5)
+        with mock.patch('time.time', return_value=1004):
+            self.assertEqual(c.get('a'), {'x': 1})
+        with mock.patch('time.time', return_value=1005):
+            self.assertIsNone(c.get('a'))
+        self.assertEqual(len(c), 0)
+
+    def test_lru_eviction_by_entries(self):
+        c = subject.MemoryCache(maxEntries=2)
+        c.set('a', 1)
+        c.set('b', 2)
+        c.get('a')
+        c.set('c', 3)
+        self.assertIsNone(c.get('b'))
+        self.assertEqual(c.get('a'), 1)
+        self.assertEqual(c.get('c'), 3)
+        self.assertEqual(c.evictions, 1)
+
+    def test_eviction_by_bytes(self):
+        c = subject.MemoryCache(maxBytes=20)
+        c.set('a', 'x' * 10)
+        c.set('b', 'y' * 10)
+        self.assertIsNone(c.get('a'))
+        self.assertEqual(c.bytes, 12)
+
+    def test_not_cached(self):
+        c = subject.MemoryCache(maxBytes=5)
+        c.set('big', 'x' * 10)
+        c.set('none', None)
+        c.set('never', 1, ttl=subject.NEVER)
+        c.set('object', {'response': object()})
+        self.assertEqual(len(c), 0)
+
+
+class TestSqliteCache(base.TCTest):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'cache.sqlite')
+
+    def test_hit_and_miss(self):
+        c = subject.SqliteCache(self.path)
+        self.assertIsNone(c.get('a'))
+        c.set('a', {'x': 1})
+        self.assertEqual(c.get('a'), {'x': 1})
+        self.assertEqual(c.stats()['hits'], 1)
+        self.assertEqual(c.stats()['misses'], 1)
+        self.assertEqual(c.stats()['entries'], 1)
+
+    def test_errors_are_misses(self):
+        c = subject.SqliteCache(self.path)
+        with mock.patch.object(c, '_connect',
+                               side_effect=sqlite3.OperationalError('database is locked')):
+            c.set('a', {'x': 1})
+            self.assertIsNone(c.get('a'))
+        self.assertEqual(c.stats()['misses'], 1)
+        self.assertEqual(len(c), 0)
+
+    def test_total_size(self):
+        c = subject.SqliteCache(self.path)
+
+        def total():
+            return c._connect().execute('SELECT SUM(size) FROM responses').fetchone()[0] or 0
+        with mock.patch('time.time', return_value=1000):
+            c.set('a', 'x' * 10)
+            c.set('a', 'x' * 20)
+            c.set('b', 'y' * 10, ttl=5)
+        self.assertEqual(c.stats()['bytes'], total())
+        with mock.patch('time.time', return_value=2000):
+            self.assertIsNone(c.get('b'))
+        self.assertEqual(c.stats()['bytes'], total())
+        c.clear()
+        self.assertEqual(c.stats()['bytes'], 0)
+
+    def test_total_of_existing_database(self):
+        c = subject.SqliteCache(self.path)
+        c.set('a', 'x' * 10)
+        with c._connect() as conn:
+            conn.execute('DROP TABLE total')
+        self.assertEqual(subject.SqliteCache(self.path).stats()['bytes'], 12)
+
+    def test_shared_between_instances(self):
+        subject.SqliteCache(self.path).set('a', {'x': 1})
+        self.assertEqual(subject.SqliteCache(self.path).get('a'), {'x': 1})
+
+    def test_shared_between_threads(self):
+        c = subject.SqliteCache(self.path)
+        c.set('a', {'x': 1})
+        results = []
+        t = threading.Thread(target=lambda: results.append(c.get('a')))
+        t.start()
+        t.join()
+        self.assertEqual(results, [{'x': 1}])
+
+    def test_expiry(self):
+        c = subject.SqliteCache(self.path)
+        with mock.patch('time.time', return_value=1000):
+            c.set('a', {'x': 1}, ttl=5)
+            c.set('b', {'x': 1}, ttl=subject.FOREVER)
+        with mock.patch('time.time', return_value=1004):
+            self.assertEqual(c.get('a'), {'x': 1})
+        with mock.patch('time.time', return_value=1005):
+            self.assertIsNone(c.get('a'))
+            self.assertEqual(c.get('b'), {'x': 1})
+
+    def test_lru_eviction(self):
+        c = subject.SqliteCache(self.path, maxBytes=30)
+        with mock.patch('time.time', return_value=1000):
+            c.set('a', 'x' * 10)
+        with mock.patch('time.time', return_value=1001):
+            c.set('b', 'y' * 10)
+        with mock.patch('time.time', return_value=1002):
+            c.get('a')
+        with mock.patch('time.time', return_value=1003):
+            c.set('c', 'z' * 10)
+        self.assertIsNone(c.get('b'))
+        self.assertEqual(c.get('a'), 'x' * 10)
+        self.assertEqual(c.evictions, 1)
+
+    def test_compact(self):
+        c = subject.SqliteCache(self.path)
+        with mock.patch('time.time', return_value=1000):
+            c.set('a', {'x': 1}, ttl=5)
+            c.set('b', {'x': 1})
+        with mock.patch('time.time', return_value=2000):
+            c.compact()
+        self.assertEqual(len(c), 1)
+
+    def test_clear(self):
+        c = subject.SqliteCache(self.path)
+        c.set('a', 1)
+        c.clear()
+        self.assertEqual(len(c), 0)
+
+
+class TestClientCache(base.TCTest):
+
+    def setUp(self):
+        self.cache = subject.MemoryCache()
+
+    def queue(self, **options):
+        options['cache'] = self.cache
+        q = client.Queue(options)
+        patcher = mock.patch.object(q, '_sendHttpRequest', return_value={'works': True})
+        self.send = patcher.start()
+        self.addCleanup(patcher.stop)
+        return q
+
+    def test_immutable_route_cached(self):
+        q = self.queue()
+        self.assertEqual(q.task('abc'), {'works': True})
+        self.assertEqual(q.task('abc'), {'works': True})
+        self.assertEqual(self.send.call_count, 1)
+        q.task('def')
+        self.assertEqual(self.send.call_count, 2)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_uncacheable_route(self):
+        q = self.queue()
+        q.listTaskGroup('abc')
+        q.listTaskGroup('abc')
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_writes_not_cached(self):
+        q = self.queue(cacheTtls={'createTask': subject.FOREVER})
+        q.createTask('abc', {})
+        q.createTask('abc', {})
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_ttl_override(self):
+        q = self.queue(cacheTtls={'task': subject.NEVER})
+        q.task('abc')
+        q.task('abc')
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_credentials_in_key(self):
+        a = self.queue(credentials={'clientId': 'a', 'accessToken': 'x'})
+        b = self.queue(credentials={'clientId': 'b', 'accessToken': 'x'})
+        a.task('abc')
+        b.task('abc')
+        self.assertEqual(len(self.cache), 2)
+
+    def test_access_token_and_scopes_in_key(self):
+        self.queue(credentials={'clientId': 'a', 'accessToken': 'x'}).task('abc')
+        self.queue(credentials={'clientId': 'a', 'accessToken': 'y'}).task('abc')
+        self.queue(credentials={'clientId': 'a', 'accessToken': 'y'},
+                   authorizedScopes=['queue:get-task']).task('abc')
+        self.assertEqual(len(self.cache), 3)
+
+    def test_sqlite_backend(self):
+        d = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, d)
+        self.cache = subject.SqliteCache(os.path.join(d, 'cache.sqlite'))
+        self.queue().task('abc')
+        q = self.queue()
+        self.assertEqual(q.task('abc'), {'works': True})
+        self.assertEqual(self.send.call_count, 0)
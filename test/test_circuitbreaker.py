@@ -0,0 +1,143 @@
+from __future__ import absolute_import, division, print_function
+
+import mock
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.circuitbreaker as subject
+import taskcluster.exceptions as exc
+import taskcluster.utils as utils
+
+
+class TestCircuitBreaker(base.TCTest):
+
+    def setUp(self):
+        timePatcher = mock.patch('time.time', return_value=1000)
+        self.time = timePatcher.start()
+        self.addCleanup(timePatcher.stop)
+
+    def fail(self, breaker, count):
+        for _ in range(count):
+            self.assertTrue(breaker.allow())
+            breaker.record(False)
+
+    def test_opens_on_failure_rate(self):
+        breaker = subject.CircuitBreaker(failureRate=0.5, minimumRequests=4)
+        breaker.record(True)
+        breaker.record(True)
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state(), subject.CLOSED)
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state(), subject.OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.stats()['rejected'], 1)
+
+    def test_minimum_requests(self):
+        breaker = subject.CircuitBreaker(minimumRequests=5)
+        self.fail(breaker, 4)
+        self.assertEqual(breaker.state(), subject.CLOSED)
+
+    def test_window(self):
+        breaker = subject.CircuitBreaker(minimumRequests=3, window=10)
+        self.fail(breaker, 2)
+        self.time.return_value = 1010
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state(), subject.CLOSED)
+        self.assertEqual(breaker.stats()['requests'], 1)
+
+    def test_half_open_probe_success(self):
+        breaker = subject.CircuitBreaker(minimumRequests=1, openTimeout=30)
+        self.fail(breaker, 1)
+        self.time.return_value = 1030
+        self.assertEqual(breaker.state(), subject.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        # only one probe at a time
+        self.assertFalse(breaker.allow())
+        breaker.record(True)
+        self.assertEqual(breaker.state(), subject.CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_released_probe(self):
+        breaker = subject.CircuitBreaker(minimumRequests=1, openTimeout=30)
+        self.fail(breaker, 1)
+        self.time.return_value = 1030
+        self.assertTrue(breaker.allow())
+        breaker.release()
+        self.assertTrue(breaker.allow())
+        breaker.record(True)
+        self.assertEqual(breaker.state(), subject.CLOSED)
+
+    def test_half_open_probe_failure(self):
+        breaker = subject.CircuitBreaker(minimumRequests=1, openTimeout=30)
+        self.fail(breaker, 1)
+        self.time.return_value = 1030
+        self.fail(breaker, 1)
+        self.assertEqual(breaker.state(), subject.OPEN)
+        self.time.return_value = 1059
+        self.assertFalse(breaker.allow())
+
+
+class TestClientCircuitBreaker(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def setUp(self):
+        subject.reset()
+        self.addCleanup(subject.reset)
+        sleepPatcher = mock.patch('time.sleep')
+        sleepPatcher.start()
+        self.addCleanup(sleepPatcher.stop)
+
+    def test_fails_fast(self):
+        client = self.BC({'circuitBreaker': {'minimumRequests': 3}, 'maxRetries': 5})
+        with mock.patch.object(utils, 'makeSingleHttpRequest',
+                               return_value=base.FakeResponse(503)) as p:
+            with self.assertRaises(exc.TaskclusterCircuitOpen):
+                client._makeHttpRequest('get', 'task/abc')
+            self.assertEqual(p.call_count, 3)
+            with self.assertRaises(exc.TaskclusterCircuitOpen) as cm:
+                client._makeHttpRequest('get', 'task/abc')
+            self.assertEqual(p.call_count, 3)
+        self.assertEqual(cm.exception.baseUrl, 'https://queue.example.com/v1')
+        self.assertEqual(subject.states()['https://queue.example.com/v1']['state'],
+                         subject.OPEN)
+
+    def test_probe_not_made_is_released(self):
+        client = self.BC({'circuitBreaker': {'minimumRequests': 1, 'openTimeout': 30},
+                          'maxRetries': 0})
+        breaker = subject.getBreakerForOptions(client.options)
+        with mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse(503)):
+            with self.assertRaises(exc.TaskclusterRestFailure):
+                client._makeHttpRequest('get', 'task/abc')
+        self.assertEqual(breaker.state(), subject.OPEN)
+        breaker._openedAt -= 30
+        # The probe is let through, but the deadline passes before it is made
+        with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+            client._makeHttpRequest('get', 'task/abc', deadline=0)
+        with mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse(200)):
+            client._makeHttpRequest('get', 'task/abc')
+        self.assertEqual(breaker.state(), subject.CLOSED)
+
+    def test_client_errors_are_not_failures(self):
+        client = self.BC({'circuitBreaker': {'minimumRequests': 1}})
+        with mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse(404)):
+            with self.assertRaises(exc.TaskclusterRestFailure):
+                client._makeHttpRequest('get', 'task/abc')
+        self.assertEqual(subject.getBreakerForOptions(client.options).state(), subject.CLOSED)
+
+    def test_shared_by_base_url(self):
+        a = self.BC({'circuitBreaker': True})
+        b = self.BC({'circuitBreaker': True})
+        self.assertIs(subject.getBreakerForOptions(a.options),
+                      subject.getBreakerForOptions(b.options))
+
+    def test_shared_breaker_settings_must_match(self):
+        breaker = subject.getBreakerForOptions(self.BC({'circuitBreaker': True}).options)
+        self.assertIs(subject.getBreakerForOptions(
+            self.BC({'circuitBreaker': {'openTimeout': 30}}).options), breaker)
+        with self.assertRaises(exc.TaskclusterFailure):
+            subject.getBreakerForOptions(self.BC({'circuitBreaker': {'openTimeout': 5}}).options)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(subject.getBreakerForOptions(self.BC().options))
@@ -7,15 +7,23 @@ from six.moves import urllib
 import os
 import re
 import json
+import base64
+import io
+import subprocess
+import sys
+import zlib
 
 import mock
 import httmock
 import requests
 
 import base
+import taskcluster.baseclient as baseclient
 import taskcluster.client as subject
 import taskcluster.runtimeclient as rtclient
 import taskcluster.exceptions as exc
+import taskcluster.hawk as hawk
+import taskcluster.retry as retry
 import taskcluster.utils as utils
 
 
@@ -156,20 +164,76 @@ class TestProcessArgs(ClientTest):
             self.client._processArgs({'args': ['test'], 'name': 'test'}, {'john': 'ford'})
 
 
+class TestRequestPlan(ClientTest):
+
+    def plan(self, **entry):
+        e = {'name': 'test', 'type': 'function', 'method': 'get',
+             'route': '/task/<taskId>/runs/<runId>', 'args': ['taskId', 'runId']}
+        e.update(entry)
+        return rtclient.RequestPlan(e)
+
+    def test_route_template(self):
+        template = self.plan().route
+        self.assertEqual(template.parts, ('task/', 'taskId', '/runs/', 'runId', ''))
+        self.assertEqual(template.render({'taskId': 'a/b', 'runId': 0}), 'task/a%2Fb/runs/0')
+        self.assertIs(template, self.plan().route)
+
+    def test_generated_routes(self):
+        template = rtclient.routeTemplate('/task/{taskId}/artifacts/{name}')
+        self.assertEqual(template.render({'taskId': 'abc', 'name': 'public/x'}),
+                         'task/abc/artifacts/public%2Fx')
+
+    def test_bind_args(self):
+        plan = self.plan()
+        self.assertEqual(plan.bindArgs(('abc', 1), {}), {'taskId': 'abc', 'runId': 1})
+        self.assertEqual(plan.bindArgs((), {'runId': 1, 'taskId': 'abc'}),
+                         {'taskId': 'abc', 'runId': 1})
+        with self.assertRaises(exc.TaskclusterFailure):
+            plan.bindArgs((), {'taskId': 'abc', 'other': 1})
+
+    def test_plans_compiled_with_class(self):
+        self.assertEqual(self.clientClass._plans['two_args_no_input'].args, ('arg0', 'arg1'))
+        with mock.patch.object(rtclient, 'RequestPlan') as RequestPlan:
+            with mock.patch.object(self.client, '_makeHttpRequest'):
+                self.client.two_args_no_input('argone', 'argtwo')
+        self.assertFalse(RequestPlan.called)
+
+    def test_query_options(self):
+        client = subject.createApiClient('Queue', {'reference': {
+            'baseUrl': 'https://queue.example.com/v1',
+            'entries': [{'type': 'function', 'name': 'listArtifacts', 'method': 'get',
+                         'route': '/task/<taskId>/artifacts', 'args': ['taskId'],
+                         'query': ['continuationToken', 'limit']}],
+        }})()
+        with mock.patch.object(client, '_makeHttpRequest') as patcher:
+            client.listArtifacts('abc', options={'limit': 5})
+        patcher.assert_called_once_with('get', 'task/abc/artifacts', None,
+                                        methodName='listArtifacts', options={'limit': 5},
+                                        validOptions=frozenset(['continuationToken', 'limit']))
+        with self.assertRaises(exc.TaskclusterRestFailure):
+            client.makeFullUrl('task/abc/artifacts', validOptions=frozenset(['limit']),
+                               options={'nope': 1})
+
+
 # This could probably be done better with Mock
 class ObjWithDotJson(object):
 
     def __init__(self, status_code, x):
         self.status_code = status_code
         self.x = x
+        self.headers = {}
 
-    def json(self):
-        return self.x
+    @property
+    def content(self):
+        return json.dumps(self.x).encode('utf-8')
 
     def raise_for_status(self):
         if self.status_code >= 300 or self.status_code < 200:
             raise requests.exceptions.HTTPError()
 
+    def close(self):
+        pass
+
 
 class TestMakeHttpRequest(ClientTest):
 
@@ -183,7 +247,8 @@ class TestMakeHttpRequest(ClientTest):
             p.return_value = ObjWithDotJson(200, expected)
 
             v = self.client._makeHttpRequest('GET', 'http://www.example.com', None)
-            p.assert_called_once_with('GET', 'http://www.example.com', None, mock.ANY)
+            p.assert_called_once_with('GET', 'http://www.example.com', None,
+                                      mock.ANY, mock.ANY, mock.ANY, 'normal', False)
             self.assertEqual(expected, v)
 
     def test_success_first_try_payload(self):
@@ -193,7 +258,8 @@ class TestMakeHttpRequest(ClientTest):
 
             v = self.client._makeHttpRequest('GET', 'http://www.example.com', {'payload': 2})
             p.assert_called_once_with('GET', 'http://www.example.com',
-                                      utils.dumpJson({'payload': 2}), mock.ANY)
+                                      utils.dumpJson({'payload': 2}), mock.ANY, mock.ANY,
+                                      mock.ANY, 'normal', False)
             self.assertEqual(expected, v)
 
     def test_success_fifth_try_status_code(self):
@@ -207,7 +273,8 @@ class TestMakeHttpRequest(ClientTest):
                 ObjWithDotJson(200, expected)
             ]
             p.side_effect = sideEffect
-            expectedCalls = [mock.call('GET', 'http://www.example.com', None, mock.ANY)
+            expectedCalls = [mock.call('GET', 'http://www.example.com', None,
+                                       mock.ANY, mock.ANY, mock.ANY, 'normal', False)
                              for x in range(self.client.options['maxRetries'])]
 
             v = self.client._makeHttpRequest('GET', 'http://www.example.com', None)
@@ -232,7 +299,8 @@ class TestMakeHttpRequest(ClientTest):
                 ObjWithDotJson(200, {'got this': 'wrong'})
             ]
             p.side_effect = sideEffect
-            expectedCalls = [mock.call('GET', 'http://www.example.com', None, mock.ANY)
+            expectedCalls = [mock.call('GET', 'http://www.example.com', None,
+                                       mock.ANY, mock.ANY, mock.ANY, 'normal', False)
                              for x in range(self.client.options['maxRetries'] + 1)]
 
             with self.assertRaises(exc.TaskclusterRestFailure):
@@ -256,7 +324,8 @@ class TestMakeHttpRequest(ClientTest):
                 ObjWithDotJson(200, expected)
             ]
             p.side_effect = sideEffect
-            expectedCalls = [mock.call('GET', 'http://www.example.com', None, mock.ANY)
+            expectedCalls = [mock.call('GET', 'http://www.example.com', None,
+                                       mock.ANY, mock.ANY, mock.ANY, 'normal', False)
                              for x in range(self.client.options['maxRetries'])]
 
             v = self.client._makeHttpRequest('GET', 'http://www.example.com', None)
@@ -266,7 +335,8 @@ class TestMakeHttpRequest(ClientTest):
     def test_failure_status_code(self):
         with mock.patch.object(utils, 'makeSingleHttpRequest') as p:
             p.return_value = ObjWithDotJson(500, None)
-            expectedCalls = [mock.call('GET', 'http://www.example.com', None, mock.ANY)
+            expectedCalls = [mock.call('GET', 'http://www.example.com', None,
+                                       mock.ANY, mock.ANY, mock.ANY, 'normal', False)
                              for x in range(self.client.options['maxRetries'])]
             with self.assertRaises(exc.TaskclusterRestFailure):
                 self.client._makeHttpRequest('GET', 'http://www.example.com', None)
@@ -275,13 +345,204 @@ class TestMakeHttpRequest(ClientTest):
     def test_failure_connection_errors(self):
         with mock.patch.object(utils, 'makeSingleHttpRequest') as p:
             p.side_effect = requests.exceptions.RequestException
-            expectedCalls = [mock.call('GET', 'http://www.example.com', None, mock.ANY)
+            expectedCalls = [mock.call('GET', 'http://www.example.com', None,
+                                       mock.ANY, mock.ANY, mock.ANY, 'normal', False)
                              for x in range(self.client.options['maxRetries'])]
             with self.assertRaises(exc.TaskclusterConnectionError):
                 self.client._makeHttpRequest('GET', 'http://www.example.com', None)
             p.assert_has_calls(expectedCalls)
 
 
+class TestStreamPayloads(ClientTest):
+
+    def sentRequests(self, signer, streamPayloads):
+        client = self.clientClass({'hawkSigner': signer, 'streamPayloads': streamPayloads})
+        sent = []
+
+        def request(method, url, payload, headers, *args):
+            if isinstance(payload, utils.SpooledPayload):
+                payload = payload.read().decode('utf-8')
+            sent.append((payload, headers))
+            return ObjWithDotJson(500 if len(sent) == 1 else 200, {})
+
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request), \
+                mock.patch('time.time', return_value=1500000000), \
+                mock.patch('mohawk.base.utc_now', return_value=1500000000), \
+                mock.patch('taskcluster.hawk.makeNonce', return_value='AbC-12'), \
+                mock.patch('mohawk.base.random_string', return_value=b'AbC-12'):
+            client._makeHttpRequest('POST', 'task', {'tasks': list(range(100))})
+        return sent
+
+    def test_same_requests(self):
+        expected = self.sentRequests('mohawk', False)
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(self.sentRequests('fast', True), expected)
+        self.assertEqual(self.sentRequests('mohawk', True), expected)
+
+    def test_payload_closed(self):
+        with mock.patch.object(utils, 'makeSingleHttpRequest',
+                               return_value=ObjWithDotJson(200, {})) as p:
+            self.clientClass({'streamPayloads': True})._makeHttpRequest('POST', 'task', {})
+        self.assertTrue(p.call_args[0][2].file.closed)
+
+
+class TestGzipPayloads(ClientTest):
+
+    def sent(self, options, payload):
+        client = self.clientClass(options)
+        sent = []
+
+        def request(method, url, body, headers, *args):
+            if isinstance(body, utils.SpooledPayload):
+                body = body.read()
+            sent.append((body, headers))
+            return ObjWithDotJson(200, {})
+
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request):
+            client._makeHttpRequest('POST', 'task', payload)
+        return sent[0]
+
+    def assertHashCovers(self, body, headers):
+        contentHash = hawk.payloadHash(body, 'application/json')
+        self.assertIn('hash="%s"' % contentHash, headers['Authorization'])
+
+    def test_small_payloads_not_compressed(self):
+        body, headers = self.sent({'gzipThreshold': 1000}, {'a': 1})
+        self.assertEqual(body, '{"a":1}')
+        self.assertNotIn('Content-Encoding', headers)
+
+    def test_large_payloads_compressed(self):
+        payload = {'tasks': ['task'] * 500}
+        for signer in ('fast', 'mohawk'):
+            body, headers = self.sent({'gzipThreshold': 1000, 'hawkSigner': signer}, payload)
+            self.assertEqual(headers['Content-Encoding'], 'gzip')
+            self.assertEqual(zlib.decompress(body, 16 + zlib.MAX_WBITS),
+                             utils.dumpJson(payload).encode('utf-8'))
+            self.assertHashCovers(body, headers)
+
+    def test_streamed_payloads_compressed(self):
+        payload = {'tasks': ['task'] * 500}
+        body, headers = self.sent({'gzipThreshold': 1000, 'gzipLevel': 1,
+                                   'streamPayloads': True}, payload)
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(zlib.decompress(body, 16 + zlib.MAX_WBITS),
+                         utils.dumpJson(payload).encode('utf-8'))
+        self.assertHashCovers(body, headers)
+
+
+class TestResponseModes(ClientTest):
+
+    body = b'{"workerTypes": {"a": {"running": 3}}}'
+
+    def call(self, **callOptions):
+        @httmock.all_requests
+        def response_content(url, request):
+            return {'status_code': 200, 'content': self.body}
+
+        with httmock.HTTMock(response_content):
+            return self.client._makeHttpRequest('GET', 'state', **callOptions)
+
+    def test_json(self):
+        self.assertEqual(self.call(), json.loads(self.body.decode('utf-8')))
+
+    def test_raw(self):
+        self.assertEqual(self.call(responseMode='raw'), self.body)
+
+    def test_lazy(self):
+        with mock.patch.object(utils, 'loadJson', wraps=utils.loadJson) as loads:
+            result = self.call(responseMode='lazy')
+            self.assertIsInstance(result, utils.LazyJson)
+            self.assertEqual(loads.call_count, 0)
+            self.assertEqual(result['workerTypes']['a']['running'], 3)
+            self.assertEqual(list(result), ['workerTypes'])
+            self.assertEqual(loads.call_count, 1)
+
+    def test_stream(self):
+        f = io.BytesIO()
+        self.assertEqual(self.call(responseFile=f), len(self.body))
+        self.assertEqual(f.getvalue(), self.body)
+
+    def test_stream_retry_closes_response(self):
+        failed = mock.Mock(status_code=503, headers={})
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError()
+        ok = mock.Mock(status_code=200, headers={})
+        ok.iter_content.return_value = [self.body]
+        f = io.BytesIO()
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=[failed, ok]):
+            self.assertEqual(self.client._makeHttpRequest('GET', 'state', responseFile=f),
+                             len(self.body))
+        self.assertTrue(failed.close.called)
+        self.assertEqual(f.getvalue(), self.body)
+
+    def test_stream_needs_file(self):
+        with self.assertRaises(exc.TaskclusterFailure):
+            self.call(responseMode='stream')
+        with self.assertRaises(exc.TaskclusterFailure):
+            self.call(responseMode='raw', responseFile=io.BytesIO())
+        with self.assertRaises(exc.TaskclusterFailure):
+            self.call(responseMode='xml')
+
+    def test_not_cached(self):
+        client = self.clientClass({'cache': mock.Mock()})
+        with mock.patch.object(client, '_responseCacheTtl', return_value=60), \
+                mock.patch.object(client, '_sendHttpRequest', return_value=b'{}') as send:
+            client._makeHttpRequest('GET', 'state', methodName='task', responseMode='raw')
+        self.assertEqual(client.options['cache'].get.call_count, 0)
+        self.assertEqual(send.call_args[0][6].mode, 'raw')
+
+
+class TestDeadlines(ClientTest):
+
+    def setUp(self):
+        ClientTest.setUp(self)
+        timePatcher = mock.patch('time.time', return_value=1000)
+        self.time = timePatcher.start()
+        self.addCleanup(timePatcher.stop)
+
+    def test_default_timeouts(self):
+        with mock.patch.object(utils, 'makeSingleHttpRequest') as p:
+            p.return_value = ObjWithDotJson(200, {})
+            self.client._makeHttpRequest('GET', 'http://www.example.com')
+            self.assertEqual(p.call_args[0][5].forAttempt(), (30, 300))
+
+    def test_call_timeouts(self):
+        with mock.patch.object(utils, 'makeSingleHttpRequest') as p:
+            p.return_value = ObjWithDotJson(200, {})
+            self.client._makeHttpRequest('GET', 'http://www.example.com',
+                                         connectTimeout=1, readTimeout=2)
+            self.assertEqual(p.call_args[0][5].forAttempt(), (1, 2))
+
+    def test_timeouts_capped_by_deadline(self):
+        with mock.patch.object(utils, 'makeSingleHttpRequest') as p:
+            p.return_value = ObjWithDotJson(200, {})
+            self.client._makeHttpRequest('GET', 'http://www.example.com', deadline=10)
+            self.assertEqual(p.call_args[0][5].forAttempt(), (10, 10))
+
+    def test_deadline_stops_retries(self):
+        def request(*args):
+            self.time.return_value += 4
+            return ObjWithDotJson(500, {})
+
+        client = self.clientClass({'retryPolicy': retry.FixedDelay(delay=1)})
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request) as p:
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded) as cm:
+                client._makeHttpRequest('GET', 'http://www.example.com', deadline=10)
+        # Attempts end at 4s and 8s, a retry after the third would end past 10s
+        self.assertEqual(p.call_count, 3)
+        self.assertIsInstance(cm.exception.superExc, requests.exceptions.HTTPError)
+
+    def test_deadline_option(self):
+        def request(*args):
+            self.time.return_value += 6
+            raise requests.exceptions.ConnectTimeout()
+
+        client = self.clientClass({'deadline': 5})
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request) as p:
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+                client._makeHttpRequest('GET', 'http://www.example.com')
+        self.assertEqual(p.call_count, 1)
+
+
 class TestOptions(ClientTest):
 
     def setUp(self):
@@ -307,6 +568,123 @@ class TestOptions(ClientTest):
             subject.Index({'credentials': badCredentials})
 
 
+class TestHawkCredentials(ClientTest):
+
+    def setUp(self):
+        ClientTest.setUp(self)
+        baseclient._hawkCredentialsCache.clear()
+        self.client = self.clientClass({'credentials': {
+            'clientId': 'tester',
+            'accessToken': 'no-secret',
+            'certificate': json.dumps({'version': 1, 'scopes': ['test:*']}),
+        }})
+
+    def ext(self, hawkExt):
+        return json.loads(base64.b64decode(utils.makeB64UrlUnsafe(hawkExt)).decode())
+
+    def test_ext_made_once(self):
+        with mock.patch.object(utils, 'dumpJson', wraps=utils.dumpJson) as dumpJson:
+            first = self.client.makeHawkExt()
+            self.assertIs(self.client.makeHawkExt(), first)
+            self.assertEqual(dumpJson.call_count, 1)
+        self.assertEqual(self.ext(first)['certificate']['scopes'], ['test:*'])
+
+    def test_ext_changes_with_options(self):
+        first = self.client.makeHawkExt()
+        self.client.options['authorizedScopes'] = ['test:a']
+        ext = self.ext(self.client.makeHawkExt())
+        self.assertEqual(ext['authorizedScopes'], ['test:a'])
+        del self.client.options['authorizedScopes']
+        self.assertEqual(self.client.makeHawkExt(), first)
+
+    def test_empty_authorized_scopes(self):
+        self.client.setCredentials({'clientId': u'other', 'accessToken': u'secret'},
+                                   authorizedScopes=[])
+        self.assertEqual(self.ext(self.client.makeHawkExt()), {'authorizedScopes': []})
+
+    def test_none_authorized_scopes(self):
+        self.client.setCredentials({'clientId': u'other', 'accessToken': u'secret'})
+        self.client.options['authorizedScopes'] = None
+        self.assertEqual(self.ext(self.client.makeHawkExt()), {})
+
+    def test_set_credentials(self):
+        self.client.setCredentials({'clientId': u'other', 'accessToken': u'secret'},
+                                   authorizedScopes=['test:b'])
+        hawk = self.client._hawkCredentials()
+        self.assertEqual(hawk.clientId, b'other')
+        self.assertEqual(hawk.accessToken, b'secret')
+        self.assertEqual(self.ext(hawk.ext), {'authorizedScopes': ['test:b']})
+
+    def test_set_no_credentials(self):
+        self.client.setCredentials(None)
+        self.assertIsNone(self.client._hawkCredentials())
+        self.assertEqual(self.client.makeHawkExt(), {})
+        self.assertEqual(self.client._makeHeaders('GET', 'https://x/', None, None), {})
+
+
+class TestWithCredentials(ClientTest):
+
+    def setUp(self):
+        ClientTest.setUp(self)
+        self.client = self.clientClass({'maxRetries': 2, 'authorizedScopes': ['test:*']})
+
+    def test_derived_client(self):
+        derived = self.client.withCredentials({'clientId': u'other', 'accessToken': u'secret'})
+        self.assertIsInstance(derived, self.clientClass)
+        self.assertIs(derived.session, self.client.session)
+        self.assertEqual(derived.options['maxRetries'], 2)
+        self.assertNotIn('authorizedScopes', derived.options)
+        self.assertEqual(derived.options['credentials'],
+                         {'clientId': b'other', 'accessToken': b'secret'})
+        self.assertEqual(self.client.options['credentials'], subject.config['credentials'])
+        self.assertEqual(self.client.options['authorizedScopes'], ['test:*'])
+
+    def test_authorized_scopes(self):
+        derived = self.client.withCredentials({'clientId': 'other', 'accessToken': 'secret'},
+                                              authorizedScopes=['test:a'])
+        self.assertEqual(derived.options['authorizedScopes'], ['test:a'])
+
+    def test_hawk_credentials_shared(self):
+        credentials = {'clientId': 'other', 'accessToken': 'secret'}
+        first = self.client.withCredentials(dict(credentials))._hawkCredentials()
+        self.assertIs(self.client.withCredentials(dict(credentials))._hawkCredentials(), first)
+        other = self.client.withCredentials({'clientId': 'other', 'accessToken': 'changed'})
+        self.assertIsNot(other._hawkCredentials(), first)
+
+
+class TestSharedOptions(base.TCTest):
+
+    class BC(baseclient.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def tearDown(self):
+        baseclient._defaultConfig.pop('testOption', None)
+
+    def test_merged_once(self):
+        with mock.patch.object(baseclient, '_mergeOptions', wraps=baseclient._mergeOptions) \
+                as merge:
+            self.BC()
+            self.BC({'maxRetries': 1})
+        self.assertLessEqual(merge.call_count, 1)
+
+    def test_instances_do_not_share_changes(self):
+        first = self.BC()
+        first.options['maxRetries'] = 1
+        self.assertEqual(self.BC().options['maxRetries'], baseclient.config['maxRetries'])
+
+    def test_default_config_changes(self):
+        self.BC()
+        baseclient._defaultConfig['testOption'] = 'yes'
+        self.assertEqual(self.BC().options['testOption'], 'yes')
+
+    def test_instance_class_options(self):
+        class Old(baseclient.BaseClient):
+            def __init__(self, *args, **kwargs):
+                self.classOptions = {'baseUrl': 'https://old.example.com/v1'}
+                super(Old, self).__init__(*args, **kwargs)
+        self.assertEqual(Old().options['baseUrl'], 'https://old.example.com/v1')
+
+
 class TestMakeApiCall(ClientTest):
     """ This class covers both the _makeApiCall function logic as well as the
     logic involved in setting up the api member functions since these are very
@@ -336,7 +714,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.no_args_no_input()
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'no_args_no_input', None)
+            patcher.assert_called_once_with('get', 'no_args_no_input', None,
+                                            methodName='no_args_no_input')
 
     def test_hits_two_args_no_input(self):
         expected = 'works'
@@ -346,7 +725,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.two_args_no_input('argone', 'argtwo')
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'two_args_no_input/argone/argtwo', None)
+            patcher.assert_called_once_with('get', 'two_args_no_input/argone/argtwo', None,
+                                            methodName='two_args_no_input')
 
     def test_hits_no_args_with_input(self):
         expected = 'works'
@@ -356,7 +736,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.no_args_with_input({})
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'no_args_with_input', {})
+            patcher.assert_called_once_with('get', 'no_args_with_input', {},
+                                            methodName='no_args_with_input')
 
     def test_hits_two_args_with_input(self):
         expected = 'works'
@@ -366,7 +747,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.two_args_with_input('argone', 'argtwo', {})
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'two_args_with_input/argone/argtwo', {})
+            patcher.assert_called_once_with('get', 'two_args_with_input/argone/argtwo', {},
+                                            methodName='two_args_with_input')
 
     def test_input_is_procesed(self):
         expected = 'works'
@@ -377,7 +759,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.no_args_with_input(expected_input)
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'no_args_with_input', expected_input)
+            patcher.assert_called_once_with('get', 'no_args_with_input', expected_input,
+                                            methodName='no_args_with_input')
 
     def test_kwargs(self):
         expected = 'works'
@@ -387,7 +770,8 @@ class TestMakeApiCall(ClientTest):
             actual = self.client.two_args_with_input({}, arg0='argone', arg1='argtwo')
             self.assertEqual(expected, actual)
 
-            patcher.assert_called_once_with('get', 'two_args_with_input/argone/argtwo', {})
+            patcher.assert_called_once_with('get', 'two_args_with_input/argone/argtwo', {},
+                                            methodName='two_args_with_input')
 
     def test_mixing_kw_and_positional_fails(self):
         with self.assertRaises(exc.TaskclusterFailure):
@@ -397,6 +781,56 @@ class TestMakeApiCall(ClientTest):
         with self.assertRaises(exc.TaskclusterFailure):
             self.client.no_args_with_input()
 
+    def test_call_options(self):
+        with mock.patch.object(self.client, '_makeHttpRequest') as patcher:
+            self.client.two_args_no_input('argone', 'argtwo', deadline=10, readTimeout=5)
+            patcher.assert_called_once_with('get', 'two_args_no_input/argone/argtwo', None,
+                                            methodName='two_args_no_input',
+                                            deadline=10, readTimeout=5)
+
+
+class TestMap(ClientTest):
+
+    def fakeRequest(self, method, route, payload=None, **kwargs):
+        if route.endswith('fail'):
+            raise exc.TaskclusterRestFailure('failed', None, status_code=404)
+        return {'route': route, 'payload': payload}
+
+    def test_runtime_client_ordered(self):
+        with mock.patch.object(self.client, '_makeHttpRequest', side_effect=self.fakeRequest):
+            args = [('a%d' % i, 'b%d' % i) for i in range(20)]
+            results = list(self.client.map('two_args_no_input', args, concurrency=3))
+        self.assertEqual([r.index for r in results], list(range(20)))
+        self.assertEqual(results[5].result, {'route': 'two_args_no_input/a5/b5', 'payload': None})
+        self.assertEqual(results[5].args, ('a5', 'b5'))
+        self.assertTrue(all(r.exception is None for r in results))
+
+    def test_single_arguments_and_payloads(self):
+        with mock.patch.object(self.client, '_makeHttpRequest', side_effect=self.fakeRequest):
+            results = list(self.client.map('no_args_with_input', [{'x': 1}]))
+            self.assertEqual(results[0].result['payload'], {'x': 1})
+
+    def test_exceptions_are_collected(self):
+        with mock.patch.object(self.client, '_makeHttpRequest', side_effect=self.fakeRequest):
+            args = [('a', 'ok'), ('b', 'fail'), ('c', 'ok')]
+            results = list(self.client.map('two_args_no_input', args, ordered=False))
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2])
+        failed = [r for r in results if r.exception]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].index, 1)
+        self.assertIsInstance(failed[0].exception, exc.TaskclusterRestFailure)
+
+    def test_generated_client(self):
+        queue = subject.Queue()
+        with mock.patch.object(queue, '_makeHttpRequest', side_effect=self.fakeRequest):
+            results = list(queue.map('status', ['t1', 't2', 't3'], concurrency=2))
+        self.assertEqual([r.result['route'] for r in results],
+                         ['task/t1/status', 'task/t2/status', 'task/t3/status'])
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(exc.TaskclusterFailure):
+            list(self.client.map('no_args_no_input', [()], concurrency=0))
+
 
 # TODO: I should run the same things through the node client and compare the output
 class TestTopicExchange(ClientTest):
@@ -908,3 +1342,41 @@ class TestBuildtimeAuthentication(BaseAuthentication):
 
     def test_temp_credentials_signed_url_authorizedScopes(self):
         self.temp_credentials_signed_url_authorizedScopes()
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'service classes are imported eagerly')
+class TestLazyImport(unittest.TestCase):
+
+    def imported(self, code):
+        """ Return the service modules imported after running code in a new
+        interpreter """
+        code += ('\nimport sys\n'
+                 'print(" ".join(sorted(m for m in sys.modules '
+                 'if m.startswith("taskcluster.sync."))))')
+        return subprocess.check_output([sys.executable, '-c', code]).decode().split()
+
+    def test_import_taskcluster(self):
+        self.assertEqual(self.imported('import taskcluster'), [])
+
+    def test_import_one_service(self):
+        self.assertEqual(self.imported('from taskcluster import Queue'),
+                         ['taskcluster.sync.Queue'])
+
+    def test_attributes(self):
+        import taskcluster
+        import taskcluster.sync
+        self.assertIs(taskcluster.Queue, taskcluster.sync.Queue)
+        self.assertIs(taskcluster.Queue, subject.Queue)
+        self.assertIn('Hooks', taskcluster.__all__)
+        self.assertIn('Hooks', dir(taskcluster))
+        with self.assertRaises(AttributeError):
+            taskcluster.NoSuchService
+
+    def test_all(self):
+        import taskcluster
+        for name in taskcluster.__all__:
+            self.assertTrue(hasattr(taskcluster, name), name)
+        self.assertIn('slugId', taskcluster.__all__)
+        # not the modules taskcluster.utils happens to import
+        self.assertNotIn('json', taskcluster.__all__)
+        self.assertNotIn('requests', taskcluster.__all__)
@@ -5,6 +5,7 @@ import json
 import os
 import unittest
 
+import taskcluster.aio
 import taskcluster.sync
 
 
@@ -55,3 +56,22 @@ class TestGenerated(unittest.TestCase):
         pyFiles.difference_update(expectedFiles)
         self.assertEqual(pyFiles, set([]),
                          "Unexpected files found: " + str(sorted(list(pyFiles))))
+
+    def test_all_async_classes_exist(self):
+        """test_generated | all apis have a class in taskcluster.aio
+        """
+        missingClasses = []
+        for api in sorted(APIS_JSON.keys()):
+            if api not in dir(taskcluster.aio):
+                missingClasses.append(api)
+        self.assertEqual(
+            [], missingClasses,
+            "The following classes are missing from taskcluster.aio: " + str(missingClasses)
+        )
+
+    def test_async_files_match_sync(self):
+        """test_generated | taskcluster/aio has the same python files as taskcluster/sync
+        """
+        def names(d):
+            return set(os.path.basename(f) for f in glob.glob(os.path.join(SOURCE_DIR, d, '*.py')))
+        self.assertEqual(names('sync'), names('aio'))
@@ -0,0 +1,92 @@
+from __future__ import absolute_import, division, print_function
+
+import mock
+import mohawk
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.hawk as subject
+
+URLS = [
+    'https://queue.taskcluster.net/v1/task/abc',
+    'https://queue.taskcluster.net/v1/task/abc/artifacts?continuationToken=x&limit=5',
+    'https://Queue.Taskcluster.NET:8443/v1/ping',
+    'http://localhost/v1/ping',
+    'http://localhost:8080',
+    'https://queue.taskcluster.net/v1/task/abc?',
+    'https://queue.taskcluster.net/v1/task;params?q=1#fragment',
+]
+
+
+def mohawkHeader(method, url, payload, ext, timestamp, nonce):
+    sender = mohawk.Sender(
+        credentials={'id': 'tester', 'key': 'no-secret', 'algorithm': 'sha256'},
+        ext=ext if ext else {},
+        url=url,
+        content=payload if payload else '',
+        content_type='application/json' if payload else '',
+        method=method,
+        nonce=nonce,
+        _timestamp=timestamp,
+    )
+    return sender.request_header
+
+
+class TestSigner(base.TCTest):
+
+    def assertSameHeader(self, method, url, payload=None, ext=None):
+        signer = subject.Signer(b'tester', b'no-secret', ext)
+        header = signer.header(method, url, payload, 'application/json' if payload else '',
+                               timestamp=1500000000, nonce='AbC-12')
+        self.assertEqual(header, mohawkHeader(method, url, payload, ext, 1500000000, 'AbC-12'))
+
+    def test_same_as_mohawk(self):
+        for url in URLS:
+            self.assertSameHeader('get', url)
+
+    def test_same_as_mohawk_with_payload(self):
+        self.assertSameHeader('POST', URLS[0], b'{"a": "\xc3\xa9"}')
+        self.assertSameHeader('PUT', URLS[0], u'{"b": 1}')
+
+    def test_same_as_mohawk_with_ext(self):
+        self.assertSameHeader('GET', URLS[0], ext=b'eyJhdXRob3JpemVkU2NvcGVzIjogW119')
+
+    def test_hosts_parsed_once(self):
+        signer = subject.Signer('tester', 'no-secret')
+        with mock.patch.object(subject.urllib.parse, 'urlsplit',
+                               wraps=subject.urllib.parse.urlsplit) as urlsplit:
+            signer.header('GET', URLS[0])
+            signer.header('GET', URLS[1])
+        self.assertEqual(urlsplit.call_count, 1)
+
+    def test_nonce(self):
+        self.assertEqual(len(subject.makeNonce()), 8)
+        self.assertNotEqual(subject.makeNonce(), subject.makeNonce())
+
+    def test_illegal_client_id(self):
+        with self.assertRaises(exc.TaskclusterAuthFailure):
+            subject.Signer('tester"', 'no-secret')
+
+
+class TestClientSigner(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.taskcluster.net/v1'}
+
+    def headers(self, signer):
+        client = self.BC({
+            'credentials': {'clientId': 'tester', 'accessToken': 'no-secret'},
+            'authorizedScopes': ['queue:*'],
+            'hawkSigner': signer,
+        })
+        with mock.patch('time.time', return_value=1500000000), \
+                mock.patch('mohawk.base.utc_now', return_value=1500000000), \
+                mock.patch.object(subject, 'makeNonce', return_value='AbC-12'), \
+                mock.patch('mohawk.base.random_string', return_value=b'AbC-12'):
+            return client._makeHeaders('POST', URLS[0], b'{}', client._hawkCredentials())
+
+    def test_signers_agree(self):
+        fast = self.headers('fast')
+        self.assertEqual(fast, self.headers('mohawk'))
+        self.assertIn('ext="', fast['Authorization'])
@@ -0,0 +1,138 @@
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import mock
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.hedging as subject
+import taskcluster.utils as utils
+
+
+class TestHedger(base.TCTest):
+
+    def test_no_hedge_without_samples(self):
+        hedger = subject.Hedger(minSamples=3)
+        self.assertIsNone(hedger.hedgeDelay())
+        self.assertEqual(hedger.call(lambda: 1), 1)
+        self.assertEqual(hedger.stats()['hedges'], 0)
+
+    def test_percentile_delay(self):
+        hedger = subject.Hedger(percentile=0.9, minSamples=10)
+        for i in range(1, 11):
+            hedger.record(i / 10.0)
+        self.assertEqual(hedger.hedgeDelay(), 1.0)
+        hedger.record(0.05)
+        self.assertEqual(hedger.hedgeDelay(), 0.9)
+        hedger = subject.Hedger(percentile=0.5, minSamples=10)
+        for i in range(1, 11):
+            hedger.record(i / 10.0)
+        self.assertEqual(hedger.hedgeDelay(), 0.6)
+
+    def test_fixed_delay(self):
+        self.assertEqual(subject.Hedger(delay=0.2).hedgeDelay(), 0.2)
+
+    def test_hedge_rate(self):
+        hedger = subject.Hedger(delay=0, maxHedgeRate=0.5)
+        hedger.start()
+        self.assertFalse(hedger.allowHedge())
+        hedger.start()
+        self.assertTrue(hedger.allowHedge())
+        self.assertFalse(hedger.allowHedge())
+
+    def test_unhedged_call_on_calling_thread(self):
+        hedger = subject.Hedger(delay=0.01, maxHedgeRate=0)
+        threads = []
+        hedger.call(lambda: threads.append(threading.current_thread()))
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_primary_not_on_pool(self):
+        hedger = subject.Hedger(delay=1, maxHedgeRate=1)
+        self.assertEqual(hedger.call(lambda: 1), 1)
+        self.assertIsNone(hedger._executor)
+
+    def slowThenFast(self):
+        """ Return a function which blocks the first time it is called and
+        returns immediately the second time """
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait()
+                return 'slow'
+            return 'fast'
+        return fn, calls
+
+    def test_hedge_wins(self):
+        hedger = subject.Hedger(delay=0.01, maxHedgeRate=1)
+        fn, calls = self.slowThenFast()
+        self.assertEqual(hedger.call(fn), 'fast')
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(hedger.stats()['hedgeWins'], 1)
+
+    def test_hedge_failure_falls_back(self):
+        hedger = subject.Hedger(delay=0.01, maxHedgeRate=1)
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait()
+                return 'slow'
+            release.set()
+            raise ValueError('broken')
+        self.assertEqual(hedger.call(fn), 'slow')
+
+
+class TestClientHedging(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def setUp(self):
+        subject.reset()
+        self.addCleanup(subject.reset)
+
+    def test_hedged_get(self):
+        client = self.BC({'hedgeRequests': {'delay': 0.01, 'maxHedgeRate': 1}})
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def request(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                release.wait()
+                return base.FakeResponse(body={'value': 'slow'})
+            return base.FakeResponse(body={'value': 'fast'})
+
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request):
+            result = client._makeHttpRequest('get', 'task/abc/status', methodName='status')
+        self.assertEqual(result, {'value': 'fast'})
+        self.assertEqual(calls[0][:2], calls[1][:2])
+        self.assertEqual(subject.states()[('https://queue.example.com/v1', 'status')]['hedges'],
+                         1)
+
+    def test_writes_not_hedged(self):
+        options = {'baseUrl': 'u', 'hedgeRequests': True}
+        self.assertIsNone(subject.getHedgerForCall(options, 'put', 'createTask'))
+        self.assertIsNotNone(subject.getHedgerForCall(options, 'get', 'task'))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(subject.getHedgerForCall(self.BC().options, 'get', 'task'))
+
+    def test_shared_hedger_settings_must_match(self):
+        options = {'baseUrl': 'https://queue.example.com/v1'}
+        hedger = subject.getHedgerForCall(dict(options, hedgeRequests=True), 'get', 'task')
+        self.assertIs(subject.getHedgerForCall(
+            dict(options, hedgeRequests={'percentile': 0.95}), 'get', 'task'), hedger)
+        with self.assertRaises(exc.TaskclusterFailure):
+            subject.getHedgerForCall(dict(options, hedgeRequests={'delay': 1}), 'get', 'task')
+        # hedgers of other methods have their own settings
+        subject.getHedgerForCall(dict(options, hedgeRequests={'delay': 1}), 'get', 'status')
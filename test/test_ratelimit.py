@@ -0,0 +1,194 @@
+from __future__ import absolute_import, division, print_function
+
+import mock
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.ratelimit as subject
+import taskcluster.utils as utils
+
+
+class TestTokenBucket(base.TCTest):
+
+    def setUp(self):
+        timePatcher = mock.patch('time.time', return_value=1000)
+        self.time = timePatcher.start()
+        self.addCleanup(timePatcher.stop)
+
+    def test_burst(self):
+        bucket = subject.TokenBucket(rate=2, burst=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertEqual(bucket.reserve(), 0.5)
+        # reservations queue up behind each other
+        self.assertEqual(bucket.reserve(), 1.0)
+
+    def test_refill(self):
+        bucket = subject.TokenBucket(rate=2, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        self.time.return_value = 1000.5
+        self.assertEqual(bucket.available(), 1)
+        self.time.return_value = 1100
+        self.assertEqual(bucket.available(), 2)
+
+    def test_default_burst(self):
+        self.assertEqual(subject.TokenBucket(rate=5).burst, 5)
+        self.assertEqual(subject.TokenBucket(rate=0.1).burst, 1)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            subject.TokenBucket(rate=0)
+
+    def test_acquire_sleeps(self):
+        bucket = subject.TokenBucket(rate=4, burst=1)
+        with mock.patch('time.sleep') as sleep:
+            bucket.acquire()
+            self.assertFalse(sleep.called)
+            bucket.acquire()
+            sleep.assert_called_once_with(0.25)
+
+
+class TestOptions(base.TCTest):
+
+    def setUp(self):
+        subject.reset()
+        self.addCleanup(subject.reset)
+
+    def test_no_limits(self):
+        self.assertEqual(subject.getBucketsForOptions({'baseUrl': 'u'}, 'task'), [])
+
+    def test_shared(self):
+        options = {'baseUrl': 'u', 'rateLimit': 10}
+        self.assertEqual(subject.getBucketsForOptions(options, 'task'),
+                         subject.getBucketsForOptions(dict(options), 'status'))
+
+    def test_per_method(self):
+        options = {'baseUrl': 'u', 'rateLimit': {'rate': 10, 'burst': 20},
+                   'methodRateLimits': {'insertTask': 1}}
+        buckets = subject.getBucketsForOptions(options, 'insertTask')
+        self.assertEqual([(b.rate, b.burst) for b in buckets], [(10, 20), (1, 1)])
+        self.assertEqual(len(subject.getBucketsForOptions(options, 'findTask')), 1)
+
+
+class TestClientRateLimit(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://index.example.com/v1'}
+
+    def setUp(self):
+        subject.reset()
+        self.addCleanup(subject.reset)
+
+    def test_paced(self):
+        a = self.BC({'methodRateLimits': {'insertTask': {'rate': 10, 'burst': 2}}})
+        b = self.BC({'methodRateLimits': {'insertTask': {'rate': 10, 'burst': 2}}})
+        with mock.patch('time.time', return_value=1000), \
+                mock.patch('time.sleep') as sleep, \
+                mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse()):
+            a._makeHttpRequest('put', 'task/a', {}, methodName='insertTask')
+            b._makeHttpRequest('put', 'task/b', {}, methodName='insertTask')
+            self.assertFalse(sleep.called)
+            a._makeHttpRequest('put', 'task/c', {}, methodName='insertTask')
+            sleep.assert_called_once_with(mock.ANY)
+            self.assertAlmostEqual(sleep.call_args[0][0], 0.1)
+            # other methods are not limited
+            a._makeHttpRequest('get', 'task/c', methodName='findTask')
+            self.assertEqual(sleep.call_count, 1)
+
+    def test_not_paced_past_the_deadline(self):
+        client = self.BC({'methodRateLimits': {'insertTask': {'rate': 10, 'burst': 1}}})
+        with mock.patch('time.time', return_value=1000), \
+                mock.patch('time.sleep') as sleep, \
+                mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse()):
+            client._makeHttpRequest('put', 'task/a', {}, methodName='insertTask')
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+                client._makeHttpRequest('put', 'task/b', {}, methodName='insertTask',
+                                        deadline=0.05)
+        self.assertFalse(sleep.called)
+
+
+class TestAdaptiveLimiter(base.TCTest):
+
+    def setUp(self):
+        timePatcher = mock.patch('time.time', return_value=1000)
+        self.time = timePatcher.start()
+        self.addCleanup(timePatcher.stop)
+
+    def test_limits_in_flight(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=2)
+        a = limiter.tryAcquire()
+        limiter.tryAcquire()
+        self.assertIsNone(limiter.tryAcquire())
+        limiter.release(a, True)
+        self.assertIsNotNone(limiter.tryAcquire())
+
+    def test_acquire_deadline(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=1)
+        limiter.acquire()
+        with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+            limiter.acquire(timeout=0)
+        self.assertEqual(limiter.inFlight, 1)
+
+    def test_additive_increase(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=2, maxLimit=3)
+        for _ in range(3):
+            tokens = [limiter.acquire() for _ in range(limiter.limit)]
+            for token in tokens:
+                limiter.release(token, True)
+        self.assertEqual(limiter.limit, 3)
+
+    def test_no_increase_when_not_saturated(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=4)
+        for _ in range(10):
+            limiter.release(limiter.acquire(), True)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_multiplicative_decrease(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=8, minLimit=2)
+        tokens = [limiter.acquire() for _ in range(4)]
+        self.time.return_value = 1001
+        # requests in flight at the same time only decrease the limit once
+        for token in tokens:
+            limiter.release(token, False)
+        self.assertEqual(limiter.limit, 4)
+        self.time.return_value = 1002
+        for _ in range(3):
+            limiter.release(limiter.acquire(), False)
+            self.time.return_value += 1
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(limiter.stats()['decreases'], 4)
+
+    def test_slow_responses(self):
+        limiter = subject.AdaptiveLimiter(initialLimit=8, latencyThreshold=2)
+        token = limiter.acquire()
+        self.time.return_value = 1003
+        limiter.release(token, True)
+        self.assertEqual(limiter.limit, 4)
+
+
+class TestClientAdaptiveConcurrency(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def setUp(self):
+        subject.reset()
+        self.addCleanup(subject.reset)
+
+    def test_failures_reduce_limit(self):
+        client = self.BC({'adaptiveConcurrency': {'initialLimit': 8}, 'maxRetries': 0})
+        with mock.patch.object(utils, 'makeSingleHttpRequest', return_value=base.FakeResponse(503)):
+            with self.assertRaises(exc.TaskclusterRestFailure):
+                client._makeHttpRequest('get', 'task/abc')
+        stats = subject.limits()['https://queue.example.com/v1']
+        self.assertEqual(stats['limit'], 4)
+        self.assertEqual(stats['inFlight'], 0)
+
+    def test_shared_limiter_settings_must_match(self):
+        options = {'baseUrl': 'https://queue.example.com/v1'}
+        limiter = subject.getLimiterForOptions(dict(options, adaptiveConcurrency=True))
+        self.assertIs(subject.getLimiterForOptions(
+            dict(options, adaptiveConcurrency={'initialLimit': 10})), limiter)
+        with self.assertRaises(exc.TaskclusterFailure):
+            subject.getLimiterForOptions(dict(options, adaptiveConcurrency={'maxLimit': 5}))
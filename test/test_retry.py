@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, print_function
+
+import mock
+import requests
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.retry as subject
+import taskcluster.utils as utils
+
+
+class TestClassification(base.TCTest):
+
+    def test_default_statuses(self):
+        for status in (429, 500, 502, 503, 504):
+            self.assertTrue(subject.isRetryableStatus(status))
+        for status in (400, 401, 403, 404, 409, 501, 505):
+            self.assertFalse(subject.isRetryableStatus(status))
+
+    def test_custom_statuses(self):
+        policy = subject.FixedDelay(retryStatuses=[409])
+        self.assertTrue(policy.isRetryable(status=409))
+        self.assertFalse(policy.isRetryable(status=500))
+
+    def test_connection_errors(self):
+        policy = subject.FixedDelay(retryStatuses=[])
+        self.assertTrue(policy.isRetryable(error=requests.exceptions.ConnectionError()))
+
+
+class TestParseRetryAfter(base.TCTest):
+
+    def test_seconds(self):
+        self.assertEqual(subject.parseRetryAfter('120'), 120)
+
+    def test_date(self):
+        # Thu, 01 Jan 1970 00:02:00 GMT is 120 seconds after the epoch
+        self.assertEqual(subject.parseRetryAfter('Thu, 01 Jan 1970 00:02:00 GMT', now=100), 20)
+        self.assertEqual(subject.parseRetryAfter('Thu, 01 Jan 1970 00:02:00 GMT', now=200), 0)
+
+    def test_invalid(self):
+        self.assertIsNone(subject.parseRetryAfter(None))
+        self.assertIsNone(subject.parseRetryAfter('soon'))
+
+
+class TestPolicies(base.TCTest):
+
+    def delays(self, policy, count=10, **kwargs):
+        state = policy.begin()
+        return [state.nextDelay(**kwargs) for _ in range(count)]
+
+    def test_exponential_matches_calculateSleepTime(self):
+        with mock.patch('random.random', return_value=0.5):
+            delays = self.delays(subject.ExponentialBackoff(maxRetries=5), count=5, status=500)
+            self.assertEqual(delays, [utils.calculateSleepTime(i) for i in range(1, 6)])
+
+    def test_max_retries(self):
+        delays = self.delays(subject.FixedDelay(delay=1, maxRetries=3), count=5, status=500)
+        self.assertEqual(delays, [1, 1, 1, None, None])
+
+    def test_not_retryable(self):
+        self.assertEqual(self.delays(subject.FixedDelay(), count=1, status=404), [None])
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = subject.DecorrelatedJitter(baseDelay=0.1, maxDelay=2, maxRetries=50)
+        state = policy.begin()
+        previous = 0.1
+        for _ in range(50):
+            delay = state.nextDelay(status=503)
+            self.assertTrue(0.1 <= delay <= min(2, previous * 3))
+            previous = delay
+
+    def test_retry_after(self):
+        delays = self.delays(subject.FixedDelay(delay=1), count=1, status=429, retryAfter='7')
+        self.assertEqual(delays, [7])
+
+    def test_retry_after_ignored(self):
+        policy = subject.FixedDelay(delay=1, honorRetryAfter=False)
+        self.assertEqual(self.delays(policy, count=1, status=429, retryAfter='7'), [1])
+
+    def test_max_elapsed(self):
+        policy = subject.FixedDelay(delay=4, maxRetries=10, maxElapsed=10)
+        with mock.patch('time.time', return_value=1000):
+            state = policy.begin()
+            self.assertEqual(state.nextDelay(status=500), 4)
+        with mock.patch('time.time', return_value=1005):
+            self.assertEqual(state.nextDelay(status=500), 4)
+        with mock.patch('time.time', return_value=1007):
+            self.assertIsNone(state.nextDelay(status=500))
+
+
+class TestClientRetries(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def setUp(self):
+        sleepPatcher = mock.patch('time.sleep')
+        self.sleep = sleepPatcher.start()
+        self.addCleanup(sleepPatcher.stop)
+
+    def request(self, client, *responses):
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=responses) as p:
+            try:
+                return client._makeHttpRequest('get', 'task/abc')
+            finally:
+                self.calls = p.call_count
+
+    def test_no_sleep_before_first_attempt(self):
+        self.request(self.BC(), base.FakeResponse(200))
+        self.assertFalse(self.sleep.called)
+
+    def test_retry_after_honored(self):
+        client = self.BC({'retryPolicy': subject.FixedDelay(delay=1)})
+        self.request(client, base.FakeResponse(429, headers={'Retry-After': '3'}),
+                     base.FakeResponse(200))
+        self.sleep.assert_called_once_with(3)
+        self.assertEqual(self.calls, 2)
+
+    def test_client_errors_not_retried(self):
+        with self.assertRaises(exc.TaskclusterRestFailure):
+            self.request(self.BC(), base.FakeResponse(404), base.FakeResponse(200))
+        self.assertEqual(self.calls, 1)
+
+    def test_policy_max_retries(self):
+        client = self.BC({'retryPolicy': subject.DecorrelatedJitter(maxRetries=1)})
+        with self.assertRaises(exc.TaskclusterRestFailure):
+            self.request(client, base.FakeResponse(503), base.FakeResponse(503),
+                         base.FakeResponse(200))
+        self.assertEqual(self.calls, 2)
+
+    def test_makeHttpRequest(self):
+        policy = subject.FixedDelay(delay=2)
+        with mock.patch.object(utils, 'makeSingleHttpRequest',
+                               side_effect=[base.FakeResponse(502), base.FakeResponse(200)]) as p:
+            r = utils.makeHttpRequest('get', 'https://example.com', None, {},
+                                      retryPolicy=policy)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(p.call_count, 2)
+        self.sleep.assert_called_once_with(2)
@@ -0,0 +1,146 @@
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import mock
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.singleflight as subject
+import taskcluster.utils as utils
+
+
+class TestGroup(base.TCTest):
+
+    def run_concurrently(self, count, fn):
+        results = [None] * count
+        errors = [None] * count
+
+        def target(i):
+            try:
+                results[i] = fn()
+            except Exception as e:
+                errors[i] = e
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+        for t in threads:
+            t.start()
+        return threads, results, errors
+
+    def test_concurrent_calls_share_one_call(self):
+        group = subject.Group()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait()
+            return {'value': 1}
+
+        threads, results, errors = self.run_concurrently(
+            5, lambda: group.do('key', slow))
+        # wait until everybody is queued up behind the first call
+        while group._calls.get('key') is None or group._calls['key'].waiters < 4:
+            base._sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'value': 1}] * 5)
+        self.assertEqual(group.inFlight(), 0)
+
+    def test_waiters_get_copies(self):
+        group = subject.Group()
+        release = threading.Event()
+
+        def slow():
+            release.wait()
+            return {'value': 1}
+
+        threads, results, errors = self.run_concurrently(2, lambda: group.do('key', slow))
+        while group._calls.get('key') is None or group._calls['key'].waiters < 1:
+            base._sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+
+    def test_exceptions_are_shared(self):
+        group = subject.Group()
+        release = threading.Event()
+
+        def failing():
+            release.wait()
+            raise ValueError('broken')
+
+        threads, results, errors = self.run_concurrently(3, lambda: group.do('key', failing))
+        while group._calls.get('key') is None or group._calls['key'].waiters < 2:
+            base._sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+
+    def test_waiters_give_up_at_the_deadline(self):
+        group = subject.Group()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        threads, results, errors = self.run_concurrently(1, lambda: group.do('key', release.wait))
+        while group._calls.get('key') is None:
+            base._sleep(0.001)
+        with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+            group.do('key', release.wait, timeout=0.01)
+        self.assertEqual(group._calls['key'].waiters, 0)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        group = subject.Group()
+        fn = mock.Mock(return_value=1)
+        group.do('key', fn)
+        group.do('key', fn)
+        self.assertEqual(fn.call_count, 2)
+
+
+class TestClientCoalescing(base.TCTest):
+
+    class BC(bc.BaseClient):
+        classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+    def test_coalesced_gets(self):
+        client = self.BC({'coalesceRequests': True, 'credentials': {}})
+        release = threading.Event()
+        calls = []
+
+        def request(*args):
+            calls.append(args)
+            release.wait()
+            return base.FakeResponse(body={'works': True})
+
+        results = []
+        with mock.patch.object(utils, 'makeSingleHttpRequest', side_effect=request):
+            threads = [threading.Thread(
+                target=lambda: results.append(client._makeHttpRequest('get', 'task/abc')))
+                for _ in range(4)]
+            for t in threads:
+                t.start()
+            while len(calls) < 1 or subject.defaultGroup.inFlight() < 1 or \
+                    list(subject.defaultGroup._calls.values())[0].waiters < 3:
+                base._sleep(0.001)
+            release.set()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'works': True}] * 4)
+
+    def test_different_credentials_are_not_coalesced(self):
+        a = self.BC({'credentials': {'clientId': 'a', 'accessToken': 'x'}})
+        b = self.BC({'credentials': {'clientId': 'b', 'accessToken': 'x'}})
+        self.assertNotEqual(a._coalescingKey('get', 'u'), b._coalescingKey('get', 'u'))
+
+    def test_disabled_by_default(self):
+        client = self.BC()
+        with mock.patch.object(subject, 'do') as p:
+            response = base.FakeResponse(body={'works': True})
+            with mock.patch.object(utils, 'makeSingleHttpRequest', return_value=response):
+                client._makeHttpRequest('get', 'task/abc')
+        self.assertFalse(p.called)
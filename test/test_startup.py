@@ -0,0 +1,40 @@
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+import unittest
+
+import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark'))
+import bench_startup as subject  # NOQA
+
+
+class TestStartupBudget(unittest.TestCase):
+    """ Fail when starting a process which uses the client costs more than the
+    TASKCLUSTER_STARTUP_BUDGET multiple of the stored baseline.  The timings
+    depend on the machine, so this only runs when that variable is set.
+    Update the baseline with `python test/benchmark/bench_startup.py --save` """
+
+    def test_within_budget(self):
+        budget = subject.getBudget()
+        if budget is None:
+            self.skipTest('set %s to check the startup budget' % subject.BUDGET_ENV)
+        results = subject.measure(runs=3)
+        over = subject.overBudget(results, subject.loadBaseline(), budget)
+        self.assertEqual(over, [], 'startup over budget: %r' % (over,))
+
+    def test_over_budget(self):
+        baseline = {'importTime': 100.0, 'modules': 300, 'rss': 40.0, 'firstCall': None}
+        results = {'importTime': 250.0, 'modules': 310, 'rss': None, 'firstCall': 10.0}
+        self.assertEqual(subject.overBudget(results, baseline, 2.0),
+                         [('importTime', 250.0, 200.0)])
+        self.assertEqual(subject.overBudget(results, baseline, 3.0), [])
+
+    def test_budget_is_opt_in(self):
+        env = dict((k, v) for k, v in os.environ.items() if k != subject.BUDGET_ENV)
+        with mock.patch.dict(os.environ, env, clear=True):
+            self.assertIsNone(subject.getBudget())
+            self.assertEqual(subject.getBudget(2.0), 2.0)
+        with mock.patch.dict(os.environ, {subject.BUDGET_ENV: '1.5'}):
+            self.assertEqual(subject.getBudget(), 1.5)
@@ -0,0 +1,119 @@
+from __future__ import absolute_import, division, print_function
+
+import logging
+
+import mock
+
+import base
+import taskcluster.tracing as subject
+import taskcluster.utils as utils
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TracingTest(base.TCTest):
+
+    def setUp(self):
+        self.log = logging.getLogger('taskcluster.test.tracing')
+        self.handler = RecordingHandler()
+        self.log.addHandler(self.handler)
+        self.log.propagate = False
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+        self.log.setLevel(logging.NOTSET)
+
+
+class TestTrace(TracingTest):
+
+    def test_disabled(self):
+        self.log.setLevel(logging.INFO)
+        self.assertFalse(subject.enabled(self.log))
+        subject.trace(self.log, 'request', url='https://tc.example.com')
+        self.assertEqual(self.handler.records, [])
+
+    def test_enabled(self):
+        self.log.setLevel(logging.DEBUG)
+        self.assertTrue(subject.enabled(self.log))
+        subject.trace(self.log, 'request', url='https://tc.example.com', method='GET')
+        record, = self.handler.records
+        self.assertEqual(record.levelno, logging.DEBUG)
+        self.assertEqual(record.traceEvent, 'request')
+        self.assertEqual(record.traceFields, {'url': 'https://tc.example.com', 'method': 'GET'})
+        self.assertEqual(record.getMessage(), 'request method=GET url=https://tc.example.com')
+
+
+class TestTruncated(base.TCTest):
+
+    def test_short(self):
+        self.assertEqual(str(subject.Truncated(b'{"a": 1}', 10)), '{"a": 1}')
+
+    def test_bytes(self):
+        self.assertEqual(str(subject.Truncated(b'x' * 30, 10)), 'x' * 10 + '... (20 more)')
+
+    def test_text(self):
+        self.assertEqual(str(subject.Truncated(u'y' * 12, 10)), 'y' * 10 + '... (2 more)')
+
+    def test_only_prefix_decoded(self):
+        # An invalid byte after the limit is never decoded
+        self.assertEqual(str(subject.Truncated(b'abc\xff', 3)), 'abc... (1 more)')
+
+    def test_other(self):
+        self.assertEqual(str(subject.Truncated(None, 10)), 'None')
+
+
+class TestHeaders(base.TCTest):
+
+    def test_redacted(self):
+        headers = str(subject.Headers({'Authorization': 'Hawk mac="secret"',
+                                       'Content-Type': 'application/json'}))
+        self.assertNotIn('secret', headers)
+        self.assertIn('<redacted>', headers)
+        self.assertIn('application/json', headers)
+
+
+class TestRequestTracing(TracingTest):
+
+    def setUp(self):
+        TracingTest.setUp(self)
+        self.log = utils.log
+        self.log.addHandler(self.handler)
+        self.propagate = self.log.propagate
+        self.log.propagate = False
+
+    def tearDown(self):
+        TracingTest.tearDown(self)
+        self.log.propagate = self.propagate
+
+    def request(self):
+        session = mock.Mock()
+        session.request.return_value = mock.Mock(
+            status_code=200, headers={'Content-Type': 'application/json'}, content=b'x' * 2000)
+        return utils.makeSingleHttpRequest(
+            'get', 'https://tc.example.com/v1/ping', None,
+            {'Authorization': 'Hawk mac="secret"'}, session=session)
+
+    def test_disabled_formats_nothing(self):
+        self.log.setLevel(logging.INFO)
+        with mock.patch.object(subject.Truncated, '__str__') as formatted:
+            self.request()
+        self.assertFalse(formatted.called)
+        self.assertEqual(self.handler.records, [])
+
+    def test_enabled(self):
+        self.log.setLevel(logging.DEBUG)
+        self.request()
+        events = [r.traceEvent for r in self.handler.records]
+        self.assertEqual(events, ['request', 'response'])
+        response = self.handler.records[1].getMessage()
+        self.assertIn('status=200', response)
+        self.assertIn('... (976 more)', response)
+        self.assertNotIn('secret', self.handler.records[0].getMessage())
@@ -0,0 +1,210 @@
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import httmock
+import mock
+
+import base
+import taskcluster.baseclient as bc
+import taskcluster.exceptions as exc
+import taskcluster.transport as subject
+import taskcluster.utils as utils
+
+
+class BC(bc.BaseClient):
+    classOptions = {'baseUrl': 'https://queue.example.com/v1'}
+
+
+class TestGetSession(base.TCTest):
+
+    def setUp(self):
+        subject.closeSessions()
+        self.addCleanup(subject.closeSessions)
+
+    def test_same_host_shares_session(self):
+        a = subject.getSession('https://queue.example.com/v1/task/abc')
+        b = subject.getSession('https://queue.example.com/v1/ping')
+        self.assertIs(a, b)
+
+    def test_different_hosts_do_not_share(self):
+        a = subject.getSession('https://queue.example.com/v1/ping')
+        b = subject.getSession('https://index.example.com/v1/ping')
+        self.assertIsNot(a, b)
+
+    def test_different_settings_do_not_share(self):
+        a = subject.getSession('https://queue.example.com/v1/ping', poolSize=2)
+        b = subject.getSession('https://queue.example.com/v1/ping', poolSize=3)
+        self.assertIsNot(a, b)
+        self.assertEqual(a.poolSize, 2)
+
+    def test_unbounded_by_default(self):
+        s = subject.getSession('https://queue.example.com/v1/ping')
+        self.assertIsNone(s.poolSize)
+        self.assertIsNone(s._slots)
+
+    def test_keep_alive_disabled(self):
+
+        s = subject.getSession('https://queue.example.com/v1/ping', keepAlive=False)
+        self.assertEqual(s.headers['Connection'], 'close')
+
+    def test_fork_resets_pools(self):
+        a = subject.getSession('https://queue.example.com/v1/ping')
+        with mock.patch('os.getpid', return_value=-1):
+            b = subject.getSession('https://queue.example.com/v1/ping')
+        self.assertIsNot(a, b)
+
+
+class TestPrioritySlots(base.TCTest):
+
+    def waitFor(self, condition):
+        while not condition():
+            base._sleep(0.001)
+
+    def test_served_by_priority(self):
+        slots = subject.PrioritySlots(1)
+        slots.acquire()
+        order = []
+
+        def request(priority):
+            slots.acquire(priority)
+            order.append(priority)
+            slots.release()
+
+        threads = []
+        for priority in ('low', 'normal', 'high'):
+            t = threading.Thread(target=request, args=(priority,))
+            t.start()
+            threads.append(t)
+            self.waitFor(lambda: slots.waiting() == len(threads))
+        slots.release()
+        for t in threads:
+            t.join()
+        self.assertEqual(order, ['high', 'normal', 'low'])
+
+    def test_reservations(self):
+        slots = subject.PrioritySlots(3, {'high': 1})
+        self.assertEqual(slots.limit('high'), 3)
+        self.assertEqual(slots.limit('normal'), 2)
+        slots.acquire('low')
+        slots.acquire('normal')
+        blocked = threading.Thread(target=slots.acquire, args=('low',))
+        blocked.start()
+        self.waitFor(lambda: slots.waiting() == 1)
+        # the reserved slot is still free for high priority requests
+        slots.acquire('high')
+        self.assertEqual(slots.inFlight, 3)
+        slots.release()
+        slots.release()
+        blocked.join()
+        self.assertEqual(slots.inFlight, 2)
+
+    def test_acquire_deadline(self):
+        slots = subject.PrioritySlots(1)
+        slots.acquire()
+        with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+            slots.acquire(timeout=0.01)
+        self.assertEqual(slots.waiting(), 0)
+        slots.release()
+        slots.acquire(timeout=0.01)
+
+    def test_unknown_priority(self):
+        with self.assertRaises(ValueError):
+            subject.PrioritySlots(3, {'urgent': 1})
+
+    def test_priority_for(self):
+        self.assertEqual(subject.priorityFor('Queue', 'reclaimTask'), 'high')
+        self.assertEqual(subject.priorityFor('Queue', 'listArtifacts'), 'low')
+        self.assertEqual(subject.priorityFor('Queue', 'task'), 'normal')
+        self.assertEqual(subject.priorityFor('Queue', 'task', {'task': 'low'}), 'low')
+
+
+class TestClientSessions(base.TCTest):
+
+    def setUp(self):
+        subject.closeSessions()
+        self.addCleanup(subject.closeSessions)
+
+    def test_clients_share_session(self):
+        self.assertIs(BC().session, BC().session)
+
+    def test_pool_options(self):
+        client = BC({'poolSize': 3, 'maxIdleConnections': 2})
+        self.assertEqual(client.session.poolSize, 3)
+        self.assertEqual(client.session.maxIdleConnections, 2)
+
+    def test_reservation_options(self):
+        client = BC({'poolSize': 4, 'poolReservations': {'high': 1}})
+        self.assertEqual(client.session._slots.limit('low'), 3)
+        self.assertIsNot(client.session, BC({'poolSize': 4}).session)
+
+    def test_reservations_need_pool_size(self):
+        with self.assertRaises(ValueError):
+            BC({'poolReservations': {'high': 1}})
+
+    def test_priorities_without_pool_size_warn(self):
+        with mock.patch.object(subject.log, 'warning') as warning:
+            BC({'priorities': {'task': 'high'}})
+        self.assertTrue(warning.called)
+
+    def test_call_priority(self):
+        client = BC({'priorities': {'task': 'high'}})
+        self.assertEqual(client._callPriority('task'), 'high')
+        self.assertEqual(client._callPriority('status'), 'normal')
+        self.assertEqual(client._callPriority('task', 'low'), 'low')
+        with self.assertRaises(exc.TaskclusterFailure):
+            client._callPriority('task', 'urgent')
+
+    def test_priority_passed_to_pool(self):
+        @httmock.all_requests
+        def response_content(url, request):
+            return {'status_code': 200, 'content': {}}
+
+        client = BC({'credentials': {}, 'poolSize': 10})
+        with mock.patch.object(client.session._slots, 'acquire',
+                               wraps=client.session._slots.acquire) as p:
+            with httmock.HTTMock(response_content):
+                client._makeHttpRequest('get', 'task/abc', priority='high')
+        p.assert_called_once_with('high', None)
+
+    def test_deadline_while_pool_is_saturated(self):
+        client = BC({'credentials': {}, 'poolSize': 1, 'maxRetries': 0})
+        # a slow call holds the only slot
+        client.session._slots.acquire()
+        self.addCleanup(client.session._slots.release)
+        with mock.patch('requests.Session.request') as request:
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+                client._makeHttpRequest('get', 'task/abc', deadline=0.05)
+        self.assertFalse(request.called)
+        self.assertEqual(client.session._slots.waiting(), 0)
+
+    def test_attempt_timeout_after_slot(self):
+        session = subject.getSession('https://queue.example.com/v1/ping', poolSize=1)
+        now = mock.Mock(return_value=1000)
+        with mock.patch('time.time', now):
+            timeouts = utils.Timeouts.start(30, 300, deadline=10)
+
+        def acquire(priority, timeout):
+            self.assertEqual(timeout, 10)
+            # waiting for the slot took 4s
+            now.return_value += 4
+        with mock.patch('requests.Session.request') as request, \
+                mock.patch('time.time', now), \
+                mock.patch.object(session._slots, 'acquire', side_effect=acquire):
+            session.request('get', 'https://queue.example.com/v1/ping', timeouts=timeouts)
+        self.assertEqual(request.call_args[1]['timeout'], (6, 6))
+
+    def test_explicit_session(self):
+        session = bc.createSession()
+        self.assertIs(BC(session=session).session, session)
+
+    def test_make_http_request_uses_pool(self):
+        @httmock.all_requests
+        def response_content(url, request):
+            return {'status_code': 200, 'content': {}}
+
+        session = subject.getSession('http://www.example.com')
+        with mock.patch.object(session, 'request', wraps=session.request) as p:
+            with httmock.HTTMock(response_content):
+                utils.makeHttpRequest('get', 'http://www.example.com', None, {})
+            self.assertEqual(p.call_count, 1)
@@ -1,6 +1,10 @@
 import datetime
+import json
 import uuid
+import io
+import zlib
 
+import taskcluster.exceptions as exc
 import taskcluster.utils as subject
 import httmock
 import mock
@@ -8,6 +12,7 @@ import os
 import requests
 
 import base
+import unittest
 from unittest import TestCase
 from hypothesis import given
 import hypothesis.strategies as st
@@ -95,6 +100,127 @@ class DumpJsonTests(base.TCTest):
         self.assertEqual(expected, actual)
 
 
+class TestSpooledPayload(base.TCTest):
+    payload = {'tasks': [{'taskId': str(i), 'created': datetime.datetime(2000, 1, 1),
+                          'name': u'caf\xe9'} for i in range(200)]}
+
+    def test_iter_json_matches_dump_json(self):
+        chunks = list(subject.iterJson(self.payload, chunkSize=1000))
+        self.assertGreater(len(chunks), 5)
+        self.assertEqual(b''.join(chunks), subject.dumpJson(self.payload).encode('utf-8'))
+
+    def test_in_memory(self):
+        hasher = mock.Mock()
+        payload = subject.SpooledPayload(self.payload, hashers=[hasher], chunkSize=1000)
+        expected = subject.dumpJson(self.payload).encode('utf-8')
+        self.assertFalse(payload.spooled)
+        self.assertEqual(payload.length, len(expected))
+        self.assertEqual(payload.read(), expected)
+        self.assertEqual(b''.join(c[0][0] for c in hasher.update.call_args_list), expected)
+
+    def test_spooled_to_disk(self):
+        payload = subject.SpooledPayload(self.payload, spoolSize=5000, chunkSize=1000)
+        self.assertTrue(payload.spooled)
+        self.assertEqual(payload.read(), subject.dumpJson(self.payload).encode('utf-8'))
+        self.assertIn('spooled', str(payload))
+        payload.close()
+
+    def test_compressed(self):
+        hasher = mock.Mock()
+        payload = subject.SpooledPayload(self.payload, hashers=[hasher], chunkSize=1000,
+                                         compressLevel=9)
+        body = payload.read()
+        self.assertEqual(payload.contentEncoding, 'gzip')
+        self.assertEqual(payload.length, len(body))
+        self.assertEqual(b''.join(c[0][0] for c in hasher.update.call_args_list), body)
+        self.assertEqual(zlib.decompress(body, 16 + zlib.MAX_WBITS),
+                         subject.dumpJson(self.payload).encode('utf-8'))
+
+    def test_gzip_bytes(self):
+        data = b'{"a":1}' * 100
+        compressed = subject.gzipBytes(data, 1)
+        self.assertLess(len(compressed), len(data))
+        self.assertEqual(zlib.decompress(compressed, 16 + zlib.MAX_WBITS), data)
+
+    def test_sent_from_start(self):
+        payload = subject.SpooledPayload({'i': 'j'})
+
+        @httmock.all_requests
+        def response_content(url, request):
+            body = request.body.read() if hasattr(request.body, 'read') else request.body
+            self.assertEqual(body, b'{"i":"j"}')
+            self.assertEqual(request.headers['Content-Length'], '9')
+            return {'status_code': 200, 'content': {}}
+
+        with httmock.HTTMock(response_content):
+            for _ in range(2):
+                subject.makeSingleHttpRequest('POST', 'http://www.example.com', payload, {})
+
+
+class TestLazyJson(base.TCTest):
+
+    def test_decoded_once_when_used(self):
+        lazy = subject.LazyJson(b'{"a": [1, 2]}')
+        with mock.patch.object(subject, 'loadJson', wraps=subject.loadJson) as loads:
+            self.assertIn('bytes', repr(lazy))
+            self.assertEqual(loads.call_count, 0)
+            self.assertEqual(lazy['a'], [1, 2])
+            self.assertEqual(len(lazy), 1)
+            self.assertEqual(dict(lazy), {'a': [1, 2]})
+            self.assertEqual(lazy.get('b'), None)
+            self.assertEqual(loads.call_count, 1)
+
+    def test_write_response(self):
+        response = mock.Mock()
+        response.iter_content.return_value = [b'ab', b'cde']
+        f = io.BytesIO()
+        self.assertEqual(subject.writeResponse(response, f), 5)
+        self.assertEqual(f.getvalue(), b'abcde')
+
+
+class TestJsonCodec(base.TCTest):
+    value = {'date': datetime.datetime(2000, 1, 1, 1, 1, 1), 'bytes': b'abc',
+             'text': u'caf\xe9', 'list': [1, 2.5, None, True]}
+    expected = ('{"date":"2000-01-01T01:01:01Z","bytes":"abc","text":"caf\\u00e9",'
+                '"list":[1,2.5,null,true]}')
+
+    def useCodec(self, codec):
+        previous = subject.setJsonCodec(codec)
+        self.addCleanup(subject.setJsonCodec, previous)
+
+    def test_stdlib(self):
+        codec = subject.JsonCodec()
+        self.assertEqual(codec.dumps(self.value), self.expected)
+        self.assertEqual(codec.loads(self.expected.encode('utf-8'))['text'], u'caf\xe9')
+
+    @unittest.skipIf(subject.orjson is None, 'orjson is not installed')
+    def test_orjson_matches_stdlib(self):
+        codec = subject.OrjsonCodec()
+        self.assertEqual(codec.dumps(self.value), self.expected)
+        self.assertEqual(codec.dumps({1: 2**70}), '{"1":%d}' % 2**70)
+        self.assertEqual(codec.loads(self.expected), subject.JsonCodec().loads(self.expected))
+
+    def test_stdlib_by_default(self):
+        self.assertEqual(subject.getJsonCodec().name, 'json')
+        self.assertEqual(subject.dumpJson({'a': 1e16, 'b': 1e-7}), '{"a":1e+16,"b":1e-07}')
+
+    @unittest.skipIf(subject.orjson is not None, 'orjson is installed')
+    def test_orjson_needs_orjson(self):
+        with self.assertRaises(RuntimeError):
+            subject.OrjsonCodec()
+
+    def test_set_codec(self):
+        codec = mock.Mock()
+        codec.dumps.return_value = '{}'
+        codec.loads.return_value = {'a': 1}
+        self.useCodec(codec)
+        self.assertEqual(subject.dumpJson({'x': 1}), '{}')
+        self.assertEqual(subject.loadJson(b'{"x":1}'), {'a': 1})
+        self.assertEqual(subject.getJsonCodec(), codec)
+        # keyword arguments for json.dumps bypass the codec
+        self.assertEqual(subject.dumpJson({'x': 1}, sort_keys=True), '{"x":1}')
+
+
 class TestBase64Utils(base.TCTest):
     def test_encode_string_for_b64_header(self):
         # Really long strings trigger newlines every 72 ch
@@ -167,11 +293,31 @@ class TestMakeSingleHttpRequest(base.TCTest):
                 d.raise_for_status()
 
 
+class TestAll(base.TCTest):
+    def test_public_functions_and_classes(self):
+        defined = [name for name, value in vars(subject).items()
+                   if not name.startswith('_') and
+                   getattr(value, '__module__', None) == subject.__name__]
+        self.assertEqual(sorted(set(defined) - set(subject.__all__)), [])
+        for name in subject.__all__:
+            self.assertTrue(hasattr(subject, name), name)
+
+
 class TestPutfile(base.TCTest):
     def test_success_put_file(self):
         with mock.patch.object(subject, 'makeSingleHttpRequest') as p:
             subject.putFile('setup.py', 'http://www.example.com', 'text/plain')
-            p.assert_called_once_with('put', 'http://www.example.com', mock.ANY, mock.ANY, mock.ANY)
+            p.assert_called_once_with('put', 'http://www.example.com', mock.ANY, mock.ANY, mock.ANY,
+                                      mock.ANY)
+        self.assertEqual(p.call_args[0][5].forAttempt(), (30, 300))
+
+    def test_put_file_deadline(self):
+        timeouts = subject.Timeouts.start(deadline=0)
+        with mock.patch.object(subject, 'makeSingleHttpRequest') as p:
+            with self.assertRaises(exc.TaskclusterDeadlineExceeded):
+                subject.putFile('setup.py', 'http://www.example.com', 'text/plain',
+                                timeouts=timeouts)
+        self.assertFalse(p.called)
 
 
 class TestStableSlugIdClosure(TestCase):
@@ -208,6 +354,16 @@ class TestEncryptEnvVarMessage(TestCase):
         self.assertDictEqual(expected, subject._messageForEncryptedEnvVar(
             taskId, startTime, endTime, name, value))
 
+    def test_serialized_with_json(self):
+        with mock.patch.object(subject, '_encrypt', return_value=b'') as encrypt, \
+                mock.patch.object(subject, 'dumpJson') as dumpJson:
+            subject.encryptEnvVar('abc', 1, 2.5, 'NAME', 'value', 'key')
+        self.assertFalse(dumpJson.called)
+        message = encrypt.call_args[0][0]
+        self.assertEqual(message, json.dumps(subject._messageForEncryptedEnvVar(
+            'abc', 1, 2.5, 'NAME', 'value')))
+        self.assertIn('"startTime": 1, "endTime": 2.5', message)
+
 
 class TestEncrypt(TestCase):
 